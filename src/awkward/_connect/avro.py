@@ -1,10 +1,15 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import contextlib
+import itertools
 import json
+import os
+import threading
 
 import numpy as np
 
 import awkward as ak
+import awkward._connect.pyarrow
 import awkward.forth
 
 
@@ -12,8 +17,230 @@ class _ReachedEndofArrayError(Exception):
     pass
 
 
+def import_zstandard(name):
+    try:
+        import zstandard
+    except ModuleNotFoundError as err:
+        raise ImportError(
+            f"""to use {name} with the "zstandard" codec, you must install zstandard:
+
+    pip install zstandard
+
+or
+
+    conda install -c conda-forge zstandard
+"""
+        ) from err
+
+    return zstandard
+
+
+def import_snappy(name):
+    try:
+        import snappy
+    except ModuleNotFoundError as err:
+        raise ImportError(
+            f"""to use {name} with the "snappy" codec, you must install python-snappy:
+
+    pip install python-snappy
+
+or
+
+    conda install -c conda-forge python-snappy
+"""
+        ) from err
+
+    return snappy
+
+
+def decompressor(codec):
+    """
+    Returns a function that decompresses the data of one Avro block, or None
+    if the blocks are not compressed.
+    """
+    if isinstance(codec, (bytes, bytearray)):
+        codec = codec.decode(errors="surrogateescape")
+
+    if codec is None or codec == "null":
+        return None
+
+    elif codec == "deflate":
+        import zlib
+
+        # raw DEFLATE (RFC 1951), without a zlib header or checksum
+        return lambda data: zlib.decompress(data, -15)
+
+    elif codec == "bzip2":
+        import bz2
+
+        return bz2.decompress
+
+    elif codec == "xz":
+        import lzma
+
+        return lzma.decompress
+
+    elif codec == "zstandard":
+        zstandard = import_zstandard("ak.from_avro_file")
+
+        # frames don't necessarily declare their decompressed size
+        return (
+            lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        )
+
+    elif codec == "snappy":
+        snappy = import_snappy("ak.from_avro_file")
+
+        # each block ends with a 4-byte CRC32 of the decompressed data
+        return lambda data: snappy.decompress(data[:-4])
+
+    else:
+        raise ak._errors.wrap_error(ValueError(f"unsupported Avro codec: {codec!r}"))
+
+
+def decompressed(blocks, decompress):
+    """
+    Yields `(num_items, data)` for each `(num_items, compressed)` in `blocks`,
+    decompressing the next block in a background thread while the current one
+    is being used.
+    """
+    if decompress is None:
+        yield from blocks
+        return
+
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        pending = None
+        for num_items, data in blocks:
+            future = pool.submit(decompress, data)
+            if pending is not None:
+                yield pending[0], pending[1].result()
+            pending = (num_items, future)
+
+        if pending is not None:
+            yield pending[0], pending[1].result()
+
+
+def compressor(codec):
+    """
+    Returns a function that compresses the data of one Avro block, or None if
+    the blocks are not to be compressed. This is the inverse of #decompressor.
+    """
+    if codec is None or codec == "null":
+        return None
+
+    elif codec == "deflate":
+        import zlib
+
+        def compress(data):
+            deflate = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+            return deflate.compress(data) + deflate.flush()
+
+        return compress
+
+    elif codec == "bzip2":
+        import bz2
+
+        return bz2.compress
+
+    elif codec == "xz":
+        import lzma
+
+        return lzma.compress
+
+    elif codec == "zstandard":
+        zstandard = import_zstandard("ak.to_avro_file")
+
+        return lambda data: zstandard.ZstdCompressor().compress(data)
+
+    elif codec == "snappy":
+        import zlib
+
+        snappy = import_snappy("ak.to_avro_file")
+
+        return lambda data: snappy.compress(data) + (
+            zlib.crc32(data) & 0xFFFFFFFF
+        ).to_bytes(4, "big")
+
+    else:
+        raise ak._errors.wrap_error(ValueError(f"unsupported Avro codec: {codec!r}"))
+
+
+def columns_tree(columns):
+    """
+    Converts a list of field names, in which nested record fields are separated
+    by dots, into a dict of dicts, with True for the fields that are fully read.
+    """
+    if columns is None:
+        return None
+    if isinstance(columns, str):
+        columns = [columns]
+
+    out = {}
+    for column in columns:
+        node = out
+        *path, last = column.split(".")
+        for name in path:
+            if node.get(name) is True:
+                break
+            node = node.setdefault(name, {})
+        else:
+            node[last] = True
+    return out
+
+
+class CompiledSchema:
+    """
+    The Awkward form and AwkwardForth code that read one Avro schema (with one
+    selection of columns), and a pool of ForthMachines compiled from the code.
+    A machine is taken out of the pool while it is in use, so the same schema
+    can be read by several threads at once.
+    """
+
+    max_idle_machines = 4
+
+    def __init__(self, form, forth_code, form_keys, container):
+        self.form = form
+        self.forth_code = forth_code
+        self.form_keys = form_keys
+        self.container = container
+        self._idle = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def machine(self):
+        with self._lock:
+            machine = self._idle.pop() if len(self._idle) != 0 else None
+        if machine is None:
+            machine = awkward.forth.ForthMachine64(self.forth_code)
+        try:
+            yield machine
+        finally:
+            # don't keep the outputs alive while the machine is idle
+            machine.reset()
+            with self._lock:
+                if len(self._idle) < self.max_idle_machines:
+                    self._idle.append(machine)
+
+
+# schemas that have been read in this process, by schema and columns
+compiled_schemas = ak._util.LRUCache(256)
+
+
 class ReadAvroFT:
-    def __init__(self, file, limit_entries, debug_forth=False):
+    def __init__(
+        self,
+        file,
+        limit_entries,
+        debug_forth=False,
+        executor=None,
+        columns=None,
+        step_blocks=None,
+        start_block=0,
+    ):
+        # if step_blocks is not None, outcontents is an iterator over the
+        # contents of every step_blocks blocks (starting at start_block)
         self.data = file
         self.blocks = 0
         self.marker = 0
@@ -42,27 +269,75 @@ class ReadAvroFT:
             except _ReachedEndofArrayError:  # noqa: AK101
                 numbytes *= 2
 
-        ind = 2
         self.update_pos(pos)
+        self.update_pos(17)
+
+        schema = self.metadata["avro.schema"]
+        columns = columns_tree(columns)
+        if columns is not None:
+            self.check_columns(schema, columns)
+
+        key = (json.dumps(schema, sort_keys=True), json.dumps(columns, sort_keys=True))
+        try:
+            compiled = compiled_schemas[key]
+        except KeyError:
+            compiled = compiled_schemas[key] = self.compile_schema(schema, columns)
+
+        self.form = compiled.form
+        if debug_forth:
+            print(compiled.forth_code)  # noqa: T201
+
+        decompress = decompressor(self.metadata.get("avro.codec"))
+
+        if step_blocks is not None:
+            self.outcontents = self.iter_contents(
+                compiled, limit_entries, decompress, step_blocks, start_block
+            )
+
+        elif executor is None:
+            container = dict(compiled.container)
+            with compiled.machine() as machine:
+                container.update(
+                    self.decode_blocks(
+                        machine,
+                        compiled.form_keys,
+                        decompressed(self.read_blocks(limit_entries), decompress),
+                    )
+                )
+            self.outcontents = (self.form, self.blocks, container)
+
+        else:
+            self.outcontents = self.decode_parallel(
+                compiled, limit_entries, decompress, executor
+            )
+
+    def compile_schema(self, schema, columns):
+        ind = 2
         exec_code = []
         init_code = [": init-out\n"]
         header_code = "input stream \n"
 
         (
-            self.form,
-            self.exec_code,
-            self.form_next_id,
+            form,
+            exec_code,
+            form_next_id,
             declarations,
             form_keys,
             init_code,
             container,
         ) = self.rec_exp_json_code(
-            self.metadata["avro.schema"], exec_code, ind, 0, [], [], init_code, {}
+            schema,
+            exec_code,
+            ind,
+            0,
+            [],
+            [],
+            init_code,
+            {},
+            columns,
         )
 
-        first_iter = True
         init_code.append(";\n")
-        self.update_pos(17)
         header_code = header_code + "".join(declarations)
         init_code = "".join(init_code)
         exec_code.insert(0, "0 do \n")
@@ -73,30 +348,13 @@ class ReadAvroFT:
                 {header_code}
                     {init_code}
                 {exec_code}"""
-        if debug_forth:
-            print(forth_code)  # noqa: T201
 
-        machine = awkward.forth.ForthMachine64(forth_code)
-        break_flag = False
-        while True:
-            try:
-                pos, num_items, len_block = self.decode_block()
-                temp_data = self.data.read(len_block)
-                if len(temp_data) < len_block:
-                    raise _ReachedEndofArrayError  # noqa: AK101
-                self.update_pos(len_block)
-            except _ReachedEndofArrayError:  # noqa: AK101
-                break
-
-            if limit_entries is not None and self.blocks > limit_entries:
-                temp_diff = int(self.blocks - limit_entries)
-                self.blocks -= temp_diff
-                num_items -= temp_diff
-                break_flag = True
-
-            else:
-                pass
+        return CompiledSchema(form, forth_code, form_keys, container)
 
+    def decode_blocks(self, machine, form_keys, blocks):
+        # begin resets the machine, so it can be reused for other blocks
+        first_iter = True
+        for num_items, temp_data in blocks:
             if first_iter:
                 machine.begin({"stream": np.frombuffer(temp_data, dtype=np.uint8)})
                 machine.stack_push(num_items)
@@ -110,14 +368,111 @@ class ReadAvroFT:
                 machine.stack_push(num_items)
                 machine.resume()
 
-            self.update_pos(16)
-            if break_flag:
-                break
+        if first_iter:
+            # a file without blocks: run for zero items, to declare the outputs
+            machine.begin({"stream": np.empty(0, dtype=np.uint8)})
+            machine.stack_push(0)
+            machine.call("init-out")
+            machine.resume()
+
+        return {elem: machine.output(elem) for elem in form_keys}
+
+    def decode_parallel(self, compiled, limit_entries, decompress, executor):
+        # index the blocks, then split them into contiguous groups, one per worker
+        index = list(self.read_blocks(limit_entries, read_data=False))
+        if ak._util.is_integer(executor):
+            num_groups = executor
+        else:
+            num_groups = os.cpu_count() or 1
+        num_groups = max(1, min(num_groups, len(index)))
+        starts = [len(index) * i // num_groups for i in range(num_groups + 1)]
+        groups = [index[start:stop] for start, stop in zip(starts[:-1], starts[1:])]
+
+        lock = threading.Lock()
+
+        def read(group):
+            for num_items, (offset, len_block) in group:
+                with lock:
+                    self.data.seek(offset)
+                    temp_data = self.data.read(len_block)
+                if len(temp_data) < len_block:
+                    raise ak._errors.wrap_error(
+                        ValueError("invalid Avro file: last block is truncated")
+                    )
+                if decompress is not None:
+                    temp_data = decompress(temp_data)
+                yield num_items, temp_data
+
+        def decode(group):
+            buffers = dict(compiled.container)
+            with compiled.machine() as machine:
+                buffers.update(
+                    self.decode_blocks(machine, compiled.form_keys, read(group))
+                )
+            length = sum(num_items for num_items, _ in group)
+            return ak.operations.from_buffers(
+                self.form, length, buffers, highlevel=False
+            )
+
+        # every group has the same form, so their buffers are simply stitched
+        # together (ak.concatenate would merge unions into different types)
+        layouts = ak._util.map_with_executor(executor, decode, groups)
+        if len(layouts) == 1:
+            layout = layouts[0]
+        else:
+            layout = awkward._connect.pyarrow.concatenate_owned(layouts)
+        return ak.operations.to_buffers(layout)
+
+    def iter_contents(
+        self, compiled, limit_entries, decompress, step_blocks, start_block
+    ):
+        blocks = decompressed(
+            self.read_blocks(limit_entries, start_block=start_block), decompress
+        )
+        # the same machine is used for all groups of blocks
+        with compiled.machine() as machine:
+            while True:
+                group = list(itertools.islice(blocks, step_blocks))
+                if len(group) == 0:
+                    return
+                buffers = dict(compiled.container)
+                buffers.update(self.decode_blocks(machine, compiled.form_keys, group))
+                yield self.form, sum(num_items for num_items, _ in group), buffers
+
+    def read_blocks(self, limit_entries, read_data=True, start_block=0):
+        # if not read_data, yield the (offset, size) of each block's data instead;
+        # the first start_block blocks are skipped and not counted in the limit
+        while True:
+            try:
+                pos, num_items, len_block = self.decode_block()
+                if start_block > 0:
+                    start_block -= 1
+                    self.blocks -= num_items
+                    self.update_pos(len_block + 16)
+                    continue
+                if read_data:
+                    temp_data = self.data.read(len_block)
+                    if len(temp_data) < len_block:
+                        raise _ReachedEndofArrayError  # noqa: AK101
+                else:
+                    temp_data = (self.marker, len_block)
+                self.update_pos(len_block)
+            except _ReachedEndofArrayError:  # noqa: AK101
+                return
 
-        for elem in form_keys:
-            container[elem] = machine.output(elem)
+            break_flag = False
+            if limit_entries is not None and self.blocks > limit_entries:
+                temp_diff = int(self.blocks - limit_entries)
+                self.blocks -= temp_diff
+                num_items -= temp_diff
+                break_flag = True
 
-        self.outcontents = (self.form, self.blocks, container)
+            # skip the sync marker
+            self.update_pos(16)
+            yield num_items, temp_data
+
+            if break_flag:
+                return
 
     def update_pos(self, pos):
         self.marker += pos
@@ -205,6 +560,97 @@ class ReadAvroFT:
         else:
             raise AssertionError  # noqa: AK101
 
+    def check_columns(self, file, columns):
+        while isinstance(file["type"], dict):
+            file = file["type"]
+        if file["type"] != "record":
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"cannot select fields {sorted(columns)} of Avro type {file['type']!r}"
+                )
+            )
+        names = [x["name"] for x in file["fields"]]
+        missing = [x for x in columns if x not in names]
+        if len(missing) != 0:
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"columns {missing} not found; available columns are {names}"
+                )
+            )
+        for elem in file["fields"]:
+            if isinstance(columns.get(elem["name"]), dict):
+                self.check_columns(elem, columns[elem["name"]])
+
+    def skip_json_code(self, file, exec_code, ind):
+        """
+        Appends Forth code that moves the stream past one value of Avro type
+        `file` without writing any outputs.
+        """
+        if isinstance(file, (str, list)):
+            file = {"type": file}
+
+        tpe = file["type"]
+        if isinstance(tpe, dict):
+            self.skip_json_code(tpe, exec_code, ind)
+
+        elif isinstance(tpe, list):
+            exec_code.append("\n" + "    " * ind + "stream zigzag-> stack case")
+            for i, elem in enumerate(tpe):
+                exec_code.append("\n" + "    " * ind + f"{i} of")
+                self.skip_json_code(elem, exec_code, ind + 1)
+                exec_code.append(" endof")
+            exec_code.append("\n" + "    " * (ind + 1) + "endcase")
+
+        elif tpe == "null":
+            pass
+
+        elif tpe == "boolean":
+            exec_code.append("\n" + "    " * ind + "1 stream skip")
+
+        elif tpe in ("int", "long", "enum"):
+            exec_code.append("\n" + "    " * ind + "stream zigzag-> stack drop")
+
+        elif tpe == "float":
+            exec_code.append("\n" + "    " * ind + "4 stream skip")
+
+        elif tpe == "double":
+            exec_code.append("\n" + "    " * ind + "8 stream skip")
+
+        elif tpe in ("bytes", "string"):
+            exec_code.append("\n" + "    " * ind + "stream zigzag-> stack stream skip")
+
+        elif tpe == "fixed":
+            exec_code.append("\n" + "    " * ind + f"{file['size']} stream skip")
+
+        elif tpe == "record":
+            for elem in file["fields"]:
+                self.skip_json_code(elem, exec_code, ind)
+
+        elif tpe in ("array", "map"):
+            # a sequence of blocks, each with a count of items, ending with an
+            # empty block; a negative count is followed by the block's size
+            exec_code.append(
+                "\n" + "    " * ind + "begin stream zigzag-> stack dup while"
+            )
+            exec_code.append(
+                "\n"
+                + "    " * (ind + 1)
+                + "dup 0 < if drop stream zigzag-> stack stream skip"
+            )
+            exec_code.append("\n" + "    " * (ind + 1) + "else 0 do")
+            if tpe == "map":
+                self.skip_json_code("string", exec_code, ind + 2)
+                self.skip_json_code(file["values"], exec_code, ind + 2)
+            else:
+                self.skip_json_code(file["items"], exec_code, ind + 2)
+            exec_code.append("\n" + "    " * (ind + 1) + "loop then")
+            exec_code.append("\n" + "    " * ind + "repeat drop")
+
+        else:
+            raise ak._errors.wrap_error(
+                NotImplementedError(f"cannot skip Avro type {tpe!r}")
+            )
+
     def rec_exp_json_code(
         self,
         file,
@@ -215,7 +661,10 @@ class ReadAvroFT:
         form_keys,
         init_code,
         container,
+        columns=None,
     ):
+        # columns: None to read everything, or a dict from the names of the
+        # record's fields to read to True (all of it) or a nested dict
         if isinstance(file, (str, list)):
             file = {"type": file}
 
@@ -239,7 +688,7 @@ class ReadAvroFT:
             return (
                 aform,
                 exec_code,
-                form_next_id,
+                form_next_id + 1,
                 declarations,
                 form_keys,
                 init_code,
@@ -251,6 +700,10 @@ class ReadAvroFT:
             aformcont = []
             aformfields = []
             for elem in file["fields"]:
+                if columns is not None and elem["name"] not in columns:
+                    self.skip_json_code(elem, exec_code, ind)
+                    continue
+
                 aformfields.append(elem["name"])
                 (
                     aform,
@@ -269,6 +722,9 @@ class ReadAvroFT:
                     form_keys,
                     init_code,
                     container,
+                    None
+                    if columns is None or columns[elem["name"]] is True
+                    else columns[elem["name"]],
                 )
                 aformcont.append(aform)
 
@@ -634,19 +1090,11 @@ class ReadAvroFT:
                 )
 
             if type_idx == "no_null":
-                if null_present:
-                    idxx = file["type"].index("null")
-                if out == 2:
-                    dum_idx = 1 - idxx
-                elif out > 2:
-                    if idxx == 0:
-                        dum_idx = 1
-                    else:
-                        dum_idx = idxx - 1
-
                 temp = form_next_id
                 temp_forms = []
                 for i in range(out):
+                    # the tag is the position among the types other than "null"
+                    tag = len(temp_forms)
                     if file["type"][i] == "null":
                         exec_code.append(
                             "\n"
@@ -658,13 +1106,13 @@ class ReadAvroFT:
                             exec_code.append(
                                 "\n"
                                 + "    " * (ind)
-                                + f"{i} of 1 node{mask_idx}-mask <- stack {i} node{union_idx}-tags <- stack"
+                                + f"{i} of 1 node{mask_idx}-mask <- stack {tag} node{union_idx}-tags <- stack"
                             )
                         else:
                             exec_code.append(
                                 "\n"
                                 + "    " * (ind)
-                                + f"{i} of {i} node{union_idx}-tags <- stack 1 countvar{form_next_id}{i} +!"
+                                + f"{i} of {tag} node{union_idx}-tags <- stack"
                             )
                         init_code.append(f"variable countvar{form_next_id}{i} \n")
                         exec_code.append(
@@ -709,7 +1157,7 @@ class ReadAvroFT:
                     )
                 else:
                     aform = ak.forms.UnionForm(
-                        "i8", "i64", aform1, form_key=f"node{mask_idx}"
+                        "i8", "i64", temp_forms, form_key=f"node{union_idx}"
                     )
 
             exec_code.append("\n" + "    " * (ind + 1) + "endcase")
@@ -742,6 +1190,7 @@ class ReadAvroFT:
                 form_keys,
                 init_code,
                 container,
+                columns,
             )
 
             return (
@@ -841,8 +1290,11 @@ class ReadAvroFT:
             exec_code.append(
                 "\n" + "    " * ind + f"dup node{form_next_id}-offsets +<- stack"
             )
+            # keep the count: only non-empty arrays have a final (empty) block
+            exec_code.append("\n" + "    " * ind + "dup")
 
-            if isinstance(file["items"], str):
+            # primitive items are read in bulk, but "null" has nothing to read
+            if isinstance(file["items"], str) and file["items"] != "null":
                 self.is_primitive = True
             else:
                 exec_code.append("\n" + "    " * ind + "0 do")
@@ -872,7 +1324,7 @@ class ReadAvroFT:
             else:
                 exec_code.append("\n" + "    " * ind + "loop")
 
-            exec_code.append("\n" + "    " * ind + "1 stream skip")
+            exec_code.append("\n" + "    " * ind + "if 1 stream skip then")
             aform = ak.forms.ListOffsetForm("i64", aformtemp, form_key=f"node{temp}")
 
             return (
@@ -912,3 +1364,399 @@ class ReadAvroFT:
             #         exec_code = exec_code+jj
             #         exec_code = exec_code+kk
             raise ak._errors.wrap_error(NotImplementedError)
+
+
+def encode_long(value):
+    """
+    Returns the zigzag varint encoding of one integer as bytes.
+    """
+    value = (value << 1) ^ (value >> 63)
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def encode_longs(values):
+    """
+    Returns `(data, offsets)`, the zigzag varint encodings of an array of
+    integers, concatenated into one uint8 array, and their positions in it.
+    """
+    zigzag = (values.astype(np.int64) << 1) ^ (values.astype(np.int64) >> 63)
+    zigzag = zigzag.view(np.uint64)
+
+    numbytes = np.ones(len(zigzag), np.int64)
+    for i in range(1, 10):
+        numbytes += zigzag >= np.uint64(1 << (7 * i))
+
+    offsets = np.zeros(len(zigzag) + 1, np.int64)
+    np.cumsum(numbytes, out=offsets[1:])
+    if offsets[-1] == len(zigzag):
+        return zigzag.astype(np.uint8), offsets
+
+    data = np.empty(offsets[-1], np.uint8)
+    starts = offsets[:-1]
+    for i in range(int(numbytes.max())):
+        which = np.nonzero(numbytes > i)[0]
+        byte = (zigzag[which] >> np.uint64(7 * i)) & np.uint64(0x7F)
+        more = numbytes[which] > i + 1
+        data[starts[which] + i] = byte.astype(np.uint8) | (more.astype(np.uint8) << 7)
+    return data, offsets
+
+
+def interleave(parts, length):
+    """
+    Concatenates byte segments element by element: each part is a triple of a
+    uint8 array and the `starts` and `stops` of one segment of it per element.
+    Returns `(data, offsets)`, in which element `i` is made of the `i`-th
+    segment of every part, in order.
+    """
+    if len(parts) == 1 and length != 0:
+        data, starts, stops = parts[0]
+        if np.array_equal(starts[1:], stops[:-1]):
+            # the segments are already contiguous
+            offsets = np.append(starts, stops[-1])
+            return data[offsets[0] : offsets[-1]], offsets - offsets[0]
+
+    # one row per element and one column per part, in the order of the output
+    base = np.cumsum([0] + [len(data) for data, _, _ in parts[:-1]])
+    seg_starts = np.empty((length, len(parts)), np.int64)
+    seg_sizes = np.empty((length, len(parts)), np.int64)
+    for i, (_, starts, stops) in enumerate(parts):
+        seg_starts[:, i] = starts + base[i]
+        seg_sizes[:, i] = stops - starts
+    seg_starts, seg_sizes = seg_starts.ravel(), seg_sizes.ravel()
+
+    seg_offsets = np.zeros(len(seg_sizes) + 1, np.int64)
+    np.cumsum(seg_sizes, out=seg_offsets[1:])
+    data = np.concatenate([np.empty(0, np.uint8)] + [data for data, _, _ in parts])
+
+    # each output byte is the byte at the same position within its segment
+    shift = np.repeat(seg_starts - seg_offsets[:-1], seg_sizes)
+    shift += np.arange(seg_offsets[-1], dtype=np.int64)
+    return data[shift], seg_offsets[:: len(parts)]
+
+
+def is_null(form):
+    # forms that can only contain missing values are written as Avro "null"
+    if isinstance(form, ak.forms.EmptyForm):
+        return True
+    elif isinstance(form, ak.forms.IndexedForm) or form.is_option:
+        return is_null(form.content)
+    else:
+        return False
+
+
+class WriteAvro:
+    """
+    Writes Avro blocks directly from a layout's buffers: each node is encoded
+    as one uint8 array with an offset per element, from the leaves up, with
+    vectorized operations only. The top-level array is encoded in chunks of
+    `rows_per_chunk` elements, which are cut into blocks of (at most)
+    `block_size` bytes before compression.
+    """
+
+    rows_per_chunk = 65536
+
+    def __init__(self, form, codec, block_size):
+        self.names = set()
+        self.schema = self.avro_schema(form)
+        self.codec = "null" if codec is None else codec
+        self.compress = compressor(codec)
+        self.block_size = block_size
+        self.sync = os.urandom(16)
+
+    def header(self):
+        metadata = {
+            b"avro.schema": json.dumps(self.schema).encode(),
+            b"avro.codec": self.codec.encode(),
+        }
+        out = [b"Obj\x01", encode_long(len(metadata))]
+        for key, value in metadata.items():
+            out.extend([encode_long(len(key)), key, encode_long(len(value)), value])
+        out.extend([encode_long(0), self.sync])
+        return b"".join(out)
+
+    def write(self, layout, write):
+        write(self.header())
+        for start in range(0, layout.length, self.rows_per_chunk):
+            stop = min(start + self.rows_per_chunk, layout.length)
+            data, offsets = self.encode(layout._getitem_range(slice(start, stop)))
+
+            first = 0
+            while first < stop - start:
+                last = np.searchsorted(
+                    offsets, offsets[first] + self.block_size, side="right"
+                )
+                last = max(int(last) - 1, first + 1)
+                block = data[offsets[first] : offsets[last]].tobytes()
+                if self.compress is not None:
+                    block = self.compress(block)
+                write(
+                    b"".join(
+                        [
+                            encode_long(last - first),
+                            encode_long(len(block)),
+                            block,
+                            self.sync,
+                        ]
+                    )
+                )
+                first = last
+
+    def name(self, prefix):
+        name = prefix
+        while name in self.names:
+            name = f"{prefix}{len(self.names)}"
+        self.names.add(name)
+        return name
+
+    def avro_schema(self, form):
+        if isinstance(form, ak.forms.EmptyForm):
+            return "null"
+
+        elif isinstance(form, ak.forms.NumpyForm):
+            if len(form.inner_shape) != 0:
+                return self.avro_schema(form.toRegularForm())
+            dtype = ak.types.numpytype.primitive_to_dtype(form.primitive)
+            if dtype.kind == "b":
+                return "boolean"
+            elif dtype.kind in "iu" and dtype.itemsize < 4 or dtype == np.int32:
+                return "int"
+            elif dtype.kind in "iu":
+                return "long"
+            elif dtype.kind == "f" and dtype.itemsize <= 4:
+                return "float"
+            elif dtype == np.float64:
+                return "double"
+            else:
+                raise ak._errors.wrap_error(
+                    TypeError(f"cannot write {dtype} data to Avro")
+                )
+
+        elif isinstance(
+            form, (ak.forms.ListOffsetForm, ak.forms.ListForm, ak.forms.RegularForm)
+        ):
+            array = form.parameter("__array__")
+            if array == "string":
+                return "string"
+            elif array == "bytestring" and isinstance(form, ak.forms.RegularForm):
+                return {"type": "fixed", "name": self.name("Fixed"), "size": form.size}
+            elif array == "bytestring":
+                return "bytes"
+            else:
+                return {"type": "array", "items": self.avro_schema(form.content)}
+
+        elif isinstance(form, ak.forms.RecordForm):
+            name = form.parameter("__record__")
+            if not isinstance(name, str) or not name.isidentifier():
+                name = "Record"
+            fields = form.fields
+            if form.is_tuple:
+                fields = [str(i) for i in range(len(form.contents))]
+            return {
+                "type": "record",
+                "name": self.name(name),
+                "fields": [
+                    {"name": field, "type": self.avro_schema(content)}
+                    for field, content in zip(fields, form.contents)
+                ],
+            }
+
+        elif isinstance(form, ak.forms.IndexedForm):
+            return self.avro_schema(form.content)
+
+        elif form.is_option:
+            if is_null(form.content):
+                return "null"
+            content = self.avro_schema(form.content)
+            if isinstance(content, list):
+                # the tags of the union's own types don't change
+                return content + ["null"]
+            else:
+                return ["null", content]
+
+        elif isinstance(form, ak.forms.UnionForm):
+            out, kinds = [], []
+            for content in form.contents:
+                if content.is_option:
+                    raise ak._errors.wrap_error(
+                        TypeError("cannot write a union of option types to Avro")
+                    )
+                schema = self.avro_schema(content)
+                # named types (records and fixed) are distinguished by name
+                kind = schema
+                if isinstance(schema, dict):
+                    kind = schema.get("name", schema["type"])
+                if kind in kinds:
+                    raise ak._errors.wrap_error(
+                        TypeError(f"an Avro union can't contain two {kind!r} types")
+                    )
+                out.append(schema)
+                kinds.append(kind)
+            return out
+
+        else:
+            raise ak._errors.wrap_error(
+                AssertionError(f"unrecognized Form type: {type(form)}")
+            )
+
+    def encode(self, layout):
+        nplike = ak.nplikes.Numpy.instance()
+        length = layout.length
+
+        if isinstance(layout, ak.contents.EmptyArray):
+            return np.empty(0, np.uint8), np.zeros(1, np.int64)
+
+        elif isinstance(layout, ak.contents.NumpyArray):
+            if len(layout.shape) != 1:
+                return self.encode(layout.toRegularArray())
+            return self.numbers(layout.raw(nplike))
+
+        elif isinstance(layout, (ak.contents.ListOffsetArray, ak.contents.ListArray)):
+            # a ListArray (such as a permuted or filtered one) can point anywhere
+            # in its content, so only the part that it refers to is kept
+            layout = layout.toListOffsetArray64(True)
+            offsets = layout.offsets.raw(nplike)
+            return self.lists(layout, offsets[:-1], offsets[1:])
+
+        elif isinstance(layout, ak.contents.RegularArray):
+            starts = np.arange(length, dtype=np.int64) * layout.size
+            return self.lists(layout, starts, starts + layout.size)
+
+        elif isinstance(layout, ak.contents.RecordArray):
+            parts = []
+            for i in range(len(layout.contents)):
+                data, offsets = self.encode(
+                    layout.content(i)._getitem_range(slice(0, length))
+                )
+                parts.append((data, offsets[:-1], offsets[1:]))
+            return interleave(parts, length)
+
+        elif isinstance(layout, ak.contents.IndexedOptionArray):
+            index = layout.index.raw(nplike)
+            valid = index >= 0
+            content = layout.content._carry(ak.index.Index64(index[valid]), False)
+            return self.missing(layout, valid, content)
+
+        elif isinstance(layout, ak.contents.IndexedArray):
+            return self.encode(layout.project())
+
+        elif isinstance(
+            layout, (ak.contents.ByteMaskedArray, ak.contents.BitMaskedArray)
+        ):
+            valid = layout.mask_as_bool(valid_when=True, nplike=nplike)[:length]
+            content = layout.content._getitem_range(slice(0, length))
+            content = content._carry(ak.index.Index64(np.nonzero(valid)[0]), False)
+            return self.missing(layout, valid, content)
+
+        elif isinstance(layout, ak.contents.UnmaskedArray):
+            return self.missing(layout, np.ones(length, np.bool_), layout.content)
+
+        elif isinstance(layout, ak.contents.UnionArray):
+            tags = layout.tags.raw(nplike)
+            index = layout.index.raw(nplike)[: len(tags)]
+            starts = np.zeros(length, np.int64)
+            stops = np.zeros(length, np.int64)
+            datas, total = [np.empty(0, np.uint8)], 0
+            for tag in range(len(layout.contents)):
+                where = np.nonzero(tags == tag)[0]
+                content = layout.content(tag)._carry(
+                    ak.index.Index64(index[where]), False
+                )
+                data, offsets = self.encode(content)
+                starts[where] = offsets[:-1] + total
+                stops[where] = offsets[1:] + total
+                datas.append(data)
+                total += len(data)
+            data = np.concatenate(datas)
+            tags, offsets = encode_longs(tags)
+            return interleave(
+                [(tags, offsets[:-1], offsets[1:]), (data, starts, stops)], length
+            )
+
+        else:
+            raise ak._errors.wrap_error(
+                AssertionError(f"unrecognized Content type: {type(layout)}")
+            )
+
+    def numbers(self, data):
+        if data.dtype.kind == "b":
+            return data.astype(np.uint8), np.arange(len(data) + 1, dtype=np.int64)
+
+        elif data.dtype.kind in "iu":
+            if data.dtype == np.uint64 and len(data) != 0:
+                if data.max() > np.iinfo(np.int64).max:
+                    raise ak._errors.wrap_error(
+                        ValueError("cannot write uint64 values above 2**63 - 1 to Avro")
+                    )
+            return encode_longs(data)
+
+        else:
+            dtype = np.dtype("<f4") if data.dtype.itemsize <= 4 else np.dtype("<f8")
+            data = np.ascontiguousarray(data, dtype=dtype).view(np.uint8)
+            itemsize = dtype.itemsize
+            return data, np.arange(len(data) // itemsize + 1, dtype=np.int64) * itemsize
+
+    def lists(self, layout, starts, stops):
+        nplike = ak.nplikes.Numpy.instance()
+        counts = stops - starts
+        array = layout.parameter("__array__")
+
+        if array in ("string", "bytestring"):
+            data = np.ascontiguousarray(layout.content.raw(nplike)).view(np.uint8)
+            if array == "bytestring" and isinstance(layout, ak.contents.RegularArray):
+                # Avro "fixed": the bytes without a length
+                return interleave([(data, starts, stops)], layout.length)
+            sizes, offsets = encode_longs(counts)
+            return interleave(
+                [(sizes, offsets[:-1], offsets[1:]), (data, starts, stops)],
+                layout.length,
+            )
+
+        # the lists are contiguous, starting at zero (see encode)
+        nonempty = counts != 0
+        stop = stops[-1] if len(stops) != 0 else 0
+        content = layout.content._getitem_range(slice(0, stop))
+        data, offsets = self.encode(content)
+
+        # one block of items (with its count) and a zero count to end the array
+        sizes, size_offsets = encode_longs(counts)
+        end = np.zeros(1, np.uint8)
+        return interleave(
+            [
+                (sizes, size_offsets[:-1], size_offsets[1:]),
+                (data, offsets[starts], offsets[stops]),
+                (end, np.zeros(layout.length, np.int64), nonempty.astype(np.int64)),
+            ],
+            layout.length,
+        )
+
+    def missing(self, layout, valid, content):
+        # `content` has one element for each True in `valid`
+        if is_null(layout.content.form):
+            # the schema is just "null" (see avro_schema), which has no bytes
+            return np.empty(0, np.uint8), np.zeros(layout.length + 1, np.int64)
+
+        data, offsets = self.encode(content)
+        where = np.nonzero(valid)[0]
+        starts = np.zeros(layout.length, np.int64)
+        stops = np.zeros(layout.length, np.int64)
+        starts[where] = offsets[:-1]
+        stops[where] = offsets[1:]
+
+        if isinstance(layout.content, ak.contents.UnionArray):
+            # "null" is the last type of the union, after the union's own types
+            tags = np.where(valid, 0, len(layout.content.contents))
+            tags, tag_offsets = encode_longs(tags)
+            tag_stops = np.where(valid, tag_offsets[:-1], tag_offsets[1:])
+        else:
+            tags, tag_offsets = encode_longs(valid.astype(np.int64))
+            tag_stops = tag_offsets[1:]
+
+        return interleave(
+            [(tags, tag_offsets[:-1], tag_stops), (data, starts, stops)],
+            layout.length,
+        )
@@ -1,6 +1,7 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 import json
+from collections import namedtuple
 from collections.abc import Iterable, Sized
 
 import numpy
@@ -282,6 +283,20 @@ def mask_parameters(awkwardarrow_type):
         return None
 
 
+def shift_validbits(validbits, offset, length):
+    """
+    Validity bits of a sliced Arrow array, starting from its first item; they are
+    a view of the Arrow buffer if the slice starts on a byte boundary.
+    """
+    bytemask = numpy.frombuffer(validbits, dtype=np.uint8)
+    if offset % 8 == 0:
+        # ceildiv(length, 8) = -(length // -8)
+        return bytemask[offset // 8 : offset // 8 - (length // -8)]
+    else:
+        bits = numpy.unpackbits(bytemask, count=offset + length, bitorder="little")
+        return numpy.packbits(bits[offset:], bitorder="little")
+
+
 def popbuffers_finalize(
     out, array, validbits, awkwardarrow_type, generate_bitmasks, fix_offsets=True
 ):
@@ -289,6 +304,12 @@ def popbuffers_finalize(
     if fix_offsets and (array.offset != 0 or len(array) != len(out)):
         out = out[array.offset : array.offset + len(array)]
 
+    # The validity bits are relative to the buffer, too (even for records, whose
+    # fields are already offsets-corrected). Keeping them as bits, rather than
+    # expanding them to bytes, keeps the BitMaskedArray 8 times smaller.
+    if validbits is not None and array.offset != 0:
+        validbits = shift_validbits(validbits, array.offset, len(array))
+
     # Everything must leave popbuffers as option-type; the mask_node will be
     # removed by the next level up in popbuffers recursion if appropriate.
 
@@ -395,15 +416,25 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers, generate_bitma
             buffers,
             generate_bitmasks,
         )
+        # the Arrow indices are used without copying, unless they are missing
+        # values (which become -1) or have a type that Awkward indexes can't have
         index = masked_index.content.data
+        if index.dtype not in (np.dtype(np.int32), np.dtype(np.int64)):
+            index = index.astype(np.int64)
 
-        if not isinstance(masked_index, ak.contents.UnmaskedArray):
+        if (
+            not isinstance(masked_index, ak.contents.UnmaskedArray)
+            and paarray.null_count != 0
+        ):
             mask = masked_index.mask_as_bool(valid_when=False)
             if mask.any():
                 index = numpy.array(index, copy=True)
                 index[mask] = -1
 
         content = handle_arrow(paarray.dictionary, generate_bitmasks)
+        if isinstance(content, ak.contents.UnmaskedArray):
+            # the dictionary has no missing values, so it need not be projected
+            content = content.content
 
         parameters = ak._util.merge_parameters(
             mask_parameters(awkwardarrow_type), node_parameters(awkwardarrow_type)
@@ -411,11 +442,14 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers, generate_bitma
         if parameters is None:
             parameters = {"__array__": "categorical"}
 
-        return ak.contents.IndexedOptionArray(
+        out = ak.contents.IndexedOptionArray(
             ak.index.Index(index),
             content,
             parameters=parameters,
-        ).simplify_optiontype()
+        )
+        if content.is_option:
+            out = out.simplify_optiontype()
+        return out
 
     elif isinstance(storage_type, pyarrow.lib.FixedSizeListType):
         assert storage_type.num_buffers == 1
@@ -895,6 +929,140 @@ def form_remove_optiontype(akform):
         return akform.content
 
 
+RecordBatchPlan = namedtuple(
+    "RecordBatchPlan",
+    [
+        "names",
+        "storage_types",
+        "nullable",
+        "empty_field",
+        "record_is_optiontype",
+        "optiontype_fields",
+        "record_is_scalar",
+        "optiontype_parameters",
+        "recordtype_parameters",
+    ],
+)
+
+
+def record_batch_plan(schema, pass_empty_field=False):
+    """
+    Interprets a RecordBatch schema (its types and Awkward metadata) once, so that
+    any number of batches with this schema can be converted by handle_record_batch.
+    """
+    record_is_optiontype = False
+    optiontype_fields = []
+    record_is_scalar = False
+    optiontype_parameters = None
+    recordtype_parameters = None
+    if schema.metadata is not None and b"ak:parameters" in schema.metadata:
+        for x in json.loads(schema.metadata[b"ak:parameters"]):
+            (key,) = x.keys()
+            (value,) = x.values()
+            if key == "optiontype_fields":
+                optiontype_fields = value
+            elif key == "record_is_scalar":
+                record_is_scalar = value
+            elif key in (
+                "UnmaskedArray",
+                "BitMaskedArray",
+                "ByteMaskedArray",
+                "IndexedOptionArray",
+            ):
+                record_is_optiontype = True
+                optiontype_parameters = value
+            elif key == "RecordArray":
+                recordtype_parameters = value
+
+    return RecordBatchPlan(
+        list(schema.names),
+        [to_awkwardarrow_storage_types(x) for x in schema.types],
+        [field.nullable for field in schema],
+        pass_empty_field and list(schema.names) == [""],
+        record_is_optiontype,
+        optiontype_fields,
+        record_is_scalar,
+        optiontype_parameters,
+        recordtype_parameters,
+    )
+
+
+def handle_column(paarray, storage_types, generate_bitmasks):
+    if isinstance(paarray, pyarrow.lib.ChunkedArray):
+        layouts = [
+            handle_column(x, storage_types, generate_bitmasks)
+            for x in paarray.chunks
+            if len(x) > 0
+        ]
+        return concatenate(layouts)
+
+    awkwardarrow_type, storage_type = storage_types
+    buffers = paarray.buffers()
+    out = popbuffers(
+        paarray, awkwardarrow_type, storage_type, buffers, generate_bitmasks
+    )
+    assert len(buffers) == 0
+    return out
+
+
+def handle_record_batch(batch, plan, generate_bitmasks=False):
+    if plan.empty_field:
+        layout = handle_column(
+            batch.column(0), plan.storage_types[0], generate_bitmasks
+        )
+        if not plan.nullable[0]:
+            return remove_optiontype(layout)
+        else:
+            return layout
+
+    record_mask = None
+    contents = []
+    for i, name in enumerate(plan.names):
+        layout = handle_column(
+            batch.column(i), plan.storage_types[i], generate_bitmasks
+        )
+        if plan.record_is_optiontype:
+            if record_mask is None:
+                record_mask = layout.mask_as_bool(valid_when=False)
+            else:
+                record_mask &= layout.mask_as_bool(valid_when=False)
+        if (
+            plan.record_is_optiontype and name not in plan.optiontype_fields
+        ) or not plan.nullable[i]:
+            contents.append(remove_optiontype(layout))
+        else:
+            contents.append(layout)
+
+    out = ak.contents.RecordArray(
+        contents,
+        plan.names,
+        length=len(batch),
+        parameters=plan.recordtype_parameters,
+    )
+
+    if plan.record_is_scalar:
+        return out._getitem_at(0)
+
+    if plan.record_is_optiontype and record_mask is None and generate_bitmasks:
+        record_mask = numpy.zeros(len(out), dtype=np.bool_)
+
+    if plan.record_is_optiontype and record_mask is None:
+        return ak.contents.UnmaskedArray(out, parameters=plan.optiontype_parameters)
+
+    elif plan.record_is_optiontype:
+        return ak.contents.BitMaskedArray(
+            ak.index.IndexU8(numpy.packbits(~record_mask, bitorder="little")),
+            out,
+            valid_when=True,
+            length=len(out),
+            lsb_order=True,
+            parameters=plan.optiontype_parameters,
+        )
+
+    else:
+        return out
+
+
 def handle_arrow(obj, generate_bitmasks=False, pass_empty_field=False):
     if isinstance(obj, pyarrow.lib.Array):
         buffers = obj.buffers()
@@ -908,106 +1076,42 @@ def handle_arrow(obj, generate_bitmasks=False, pass_empty_field=False):
         return out
 
     elif isinstance(obj, pyarrow.lib.ChunkedArray):
+        if not _has_extension(obj.type):
+            # see the Table case, below
+            return handle_arrow(obj.combine_chunks(), generate_bitmasks)
         layouts = [handle_arrow(x, generate_bitmasks) for x in obj.chunks if len(x) > 0]
-
-        if len(layouts) == 1:
-            return layouts[0]
-        else:
-            return ak.operations.concatenate(layouts, highlevel=False)
+        return concatenate(layouts)
 
     elif isinstance(obj, pyarrow.lib.RecordBatch):
-        if pass_empty_field and list(obj.schema.names) == [""]:
-            layout = handle_arrow(obj.column(0), generate_bitmasks)
-            if not obj.schema.field(0).nullable:
-                return remove_optiontype(layout)
-            else:
-                return layout
-        else:
-            record_is_optiontype = False
-            optiontype_fields = []
-            record_is_scalar = False
-            optiontype_parameters = None
-            recordtype_parameters = None
-            if (
-                obj.schema.metadata is not None
-                and b"ak:parameters" in obj.schema.metadata
-            ):
-                for x in json.loads(obj.schema.metadata[b"ak:parameters"]):
-                    (key,) = x.keys()
-                    (value,) = x.values()
-                    if key == "optiontype_fields":
-                        optiontype_fields = value
-                    elif key == "record_is_scalar":
-                        record_is_scalar = value
-                    elif key in (
-                        "UnmaskedArray",
-                        "BitMaskedArray",
-                        "ByteMaskedArray",
-                        "IndexedOptionArray",
-                    ):
-                        record_is_optiontype = True
-                        optiontype_parameters = value
-                    elif key == "RecordArray":
-                        recordtype_parameters = value
-
-            record_mask = None
-            contents = []
-            for i in range(obj.num_columns):
-                field = obj.schema.field(i)
-                layout = handle_arrow(obj.column(i), generate_bitmasks)
-                if record_is_optiontype:
-                    if record_mask is None:
-                        record_mask = layout.mask_as_bool(valid_when=False)
-                    else:
-                        record_mask &= layout.mask_as_bool(valid_when=False)
-                if (
-                    record_is_optiontype and field.name not in optiontype_fields
-                ) or not field.nullable:
-                    contents.append(remove_optiontype(layout))
-                else:
-                    contents.append(layout)
-
-            out = ak.contents.RecordArray(
-                contents,
-                obj.schema.names,
-                length=len(obj),
-                parameters=recordtype_parameters,
-            )
-
-            if record_is_scalar:
-                return out._getitem_at(0)
-
-            if record_is_optiontype and record_mask is None and generate_bitmasks:
-                record_mask = numpy.zeros(len(out), dtype=np.bool_)
-
-            if record_is_optiontype and record_mask is None:
-                return ak.contents.UnmaskedArray(out, parameters=optiontype_parameters)
-
-            elif record_is_optiontype:
-                return ak.contents.ByteMaskedArray(
-                    ak.index.Index8(record_mask),
-                    out,
-                    valid_when=False,
-                    parameters=optiontype_parameters,
-                )
-
-            else:
-                return out
+        return handle_record_batch(
+            obj, record_batch_plan(obj.schema, pass_empty_field), generate_bitmasks
+        )
 
     elif isinstance(obj, pyarrow.lib.Table):
-        batches = obj.combine_chunks().to_batches()
+        if any(_has_extension(x) for x in obj.schema.types):
+            # Arrow can't concatenate extension arrays, so the batches are
+            # converted without copying and then merged in concatenate_owned
+            batches = obj.to_batches()
+        else:
+            # Arrow merges many small batches much faster than they can be
+            # converted one by one, and it unifies the dictionaries of the chunks
+            batches = obj.combine_chunks().to_batches()
         if len(batches) == 0:
             # FIXME: create a zero-length array with the right type
             raise ak._errors.wrap_error(NotImplementedError)
         elif len(batches) == 1:
             return handle_arrow(batches[0], generate_bitmasks, pass_empty_field)
         else:
+            # all batches of a table share its schema
+            plan = record_batch_plan(obj.schema, pass_empty_field)
             arrays = [
-                handle_arrow(batch, generate_bitmasks, pass_empty_field)
+                handle_record_batch(batch, plan, generate_bitmasks)
                 for batch in batches
                 if len(batch) > 0
             ]
-            return ak.operations.concatenate(arrays, highlevel=False)
+            if len(arrays) == 0:
+                return handle_record_batch(batches[0], plan, generate_bitmasks)
+            return concatenate(arrays)
 
     elif (
         isinstance(obj, Iterable)
@@ -1021,10 +1125,7 @@ def handle_arrow(obj, generate_bitmasks=False, pass_empty_field=False):
             chunk = handle_arrow(batch, generate_bitmasks, pass_empty_field)
             if len(chunk) > 0:
                 chunks.append(chunk)
-        if len(chunks) == 1:
-            return chunks[0]
-        else:
-            return ak.operations.concatenate(chunks, highlevel=False)
+        return concatenate(chunks)
 
     elif isinstance(obj, Iterable) and len(obj) == 0:
         return ak.contents.RecordArray([], [], length=0)
@@ -1033,6 +1134,186 @@ def handle_arrow(obj, generate_bitmasks=False, pass_empty_field=False):
         raise ak._errors.wrap_error(TypeError(f"unrecognized Arrow type: {type(obj)}"))
 
 
+def _drain(layouts):
+    # drops the list's reference to each item as it is yielded, without shifting
+    # the rest of the list (which would make draining quadratic)
+    for i, x in enumerate(layouts):
+        layouts[i] = None
+        yield x
+    layouts.clear()
+
+
+def concatenate_owned(layouts):
+    """
+    Concatenates `layouts`, which must all have the same Form, into preallocated
+    buffers. The list is emptied as it goes, so that the caller's (only) references
+    to the inputs are dropped as soon as their buffers have been copied.
+    """
+    first = layouts[0]
+    total = sum(x.length for x in layouts)
+    parameters = first.parameters
+
+    if isinstance(first, ak.contents.EmptyArray):
+        layouts.clear()
+        return ak.contents.EmptyArray(parameters)
+
+    elif isinstance(first, ak.contents.NumpyArray):
+        data = numpy.empty((total,) + first.data.shape[1:], first.data.dtype)
+        start = 0
+        for x in _drain(layouts):
+            data[start : start + x.length] = x.data
+            start += x.length
+        return ak.contents.NumpyArray(data, parameters)
+
+    elif isinstance(first, ak.contents.RegularArray):
+        contents = []
+        for x in _drain(layouts):
+            contents.append(x.content._getitem_range(slice(0, x.length * x.size)))
+        return ak.contents.RegularArray(
+            concatenate_owned(contents), first.size, total, parameters
+        )
+
+    elif isinstance(first, (ak.contents.ListArray, ak.contents.ListOffsetArray)):
+        offsets = numpy.empty(total + 1, np.int64)
+        offsets[0] = 0
+        contents = []
+        start = 0
+        for x in _drain(layouts):
+            x = x.toListOffsetArray64(True)
+            these = x.offsets.data
+            stop = start + x.length
+            offsets[start + 1 : stop + 1] = these[1:] + offsets[start]
+            contents.append(x.content._getitem_range(slice(0, these[-1])))
+            start = stop
+        return ak.contents.ListOffsetArray(
+            ak.index.Index64(offsets), concatenate_owned(contents), parameters
+        )
+
+    elif isinstance(first, (ak.contents.IndexedArray, ak.contents.IndexedOptionArray)):
+        index = numpy.empty(total, np.int64)
+        contents = []
+        start = shift = 0
+        for x in _drain(layouts):
+            these = index[start : start + x.length]
+            these[:] = x.index.data
+            if x.is_option:
+                numpy.add(these, shift, out=these, where=these >= 0)
+            else:
+                these += shift
+            shift += x.content.length
+            contents.append(x.content)
+            start += x.length
+        return type(first)(
+            ak.index.Index64(index), concatenate_owned(contents), parameters
+        )
+
+    elif isinstance(first, ak.contents.ByteMaskedArray):
+        mask = numpy.empty(total, np.int8)
+        contents = []
+        start = 0
+        for x in _drain(layouts):
+            mask[start : start + x.length] = x.mask.data
+            contents.append(x.content._getitem_range(slice(0, x.length)))
+            start += x.length
+        return ak.contents.ByteMaskedArray(
+            ak.index.Index8(mask),
+            concatenate_owned(contents),
+            first.valid_when,
+            parameters,
+        )
+
+    elif isinstance(first, ak.contents.BitMaskedArray):
+        # masks are not byte-aligned at the boundaries, so go through one byte per bit
+        bitorder = "little" if first.lsb_order else "big"
+        bits = numpy.empty(total, np.uint8)
+        contents = []
+        start = 0
+        for x in _drain(layouts):
+            bits[start : start + x.length] = numpy.unpackbits(
+                x.mask.data, count=x.length, bitorder=bitorder
+            )
+            contents.append(x.content._getitem_range(slice(0, x.length)))
+            start += x.length
+        return ak.contents.BitMaskedArray(
+            ak.index.IndexU8(numpy.packbits(bits, bitorder=bitorder)),
+            concatenate_owned(contents),
+            first.valid_when,
+            total,
+            first.lsb_order,
+            parameters,
+        )
+
+    elif isinstance(first, ak.contents.UnmaskedArray):
+        contents = []
+        for x in _drain(layouts):
+            contents.append(x.content)
+        return ak.contents.UnmaskedArray(concatenate_owned(contents), parameters)
+
+    elif isinstance(first, ak.contents.RecordArray):
+        contents = [[] for _ in first.contents]
+        for x in _drain(layouts):
+            for i, field in enumerate(x.fields):
+                contents[i].append(x.content(field))
+        return ak.contents.RecordArray(
+            [concatenate_owned(x) for x in contents],
+            None if first.is_tuple else first.fields,
+            total,
+            parameters,
+        )
+
+    elif isinstance(first, ak.contents.UnionArray):
+        tags = numpy.empty(total, np.int8)
+        index = numpy.empty(total, np.int64)
+        contents = [[] for _ in first.contents]
+        shifts = [0] * len(first.contents)
+        start = 0
+        for x in _drain(layouts):
+            stop = start + x.length
+            tags[start:stop] = x.tags.data
+            these = index[start:stop]
+            these[:] = x.index.data
+            for tag, content in enumerate(x.contents):
+                numpy.add(these, shifts[tag], out=these, where=tags[start:stop] == tag)
+                shifts[tag] += content.length
+                contents[tag].append(content)
+            start = stop
+        return ak.contents.UnionArray(
+            ak.index.Index8(tags),
+            ak.index.Index64(index),
+            [concatenate_owned(x) for x in contents],
+            parameters,
+        )
+
+    else:
+        raise ak._errors.wrap_error(
+            AssertionError(f"unrecognized Content type: {type(first).__name__}")
+        )
+
+
+def _has_extension(arrow_type):
+    if isinstance(arrow_type, pyarrow.lib.ExtensionType):
+        return True
+    return any(
+        _has_extension(arrow_type.field(i).type) for i in range(arrow_type.num_fields)
+    )
+
+
+def concatenate(layouts):
+    """
+    Concatenates the conversions of Arrow chunks or batches, which usually share
+    one Form and can therefore be merged with one allocation per buffer.
+    """
+    if len(layouts) == 1:
+        return layouts[0]
+    elif all(isinstance(x, ak.contents.Content) for x in layouts) and all(
+        x.form.to_dict(verbose=False) == layouts[0].form.to_dict(verbose=False)
+        for x in layouts[1:]
+    ):
+        return concatenate_owned(list(layouts))
+    else:
+        return ak.operations.concatenate(layouts, highlevel=False)
+
+
 def form_handle_arrow(schema, pass_empty_field=False):
     if pass_empty_field and list(schema.names) == [""]:
         awkwardarrow_type, storage_type = to_awkwardarrow_storage_types(schema.types[0])
@@ -1082,8 +1363,12 @@ def form_handle_arrow(schema, pass_empty_field=False):
         )
 
         if record_is_optiontype:
-            return ak.forms.ByteMaskedForm(
-                "i8", out, valid_when=False, parameters=optiontype_parameters
+            return ak.forms.BitMaskedForm(
+                "u8",
+                out,
+                valid_when=True,
+                lsb_order=True,
+                parameters=optiontype_parameters,
             )
 
         else:
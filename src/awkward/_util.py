@@ -6,6 +6,7 @@ import itertools
 import numbers
 import os
 import re
+import threading
 from collections.abc import Iterable, Mapping, Sized
 
 import packaging.version
@@ -96,6 +97,127 @@ def identifier_hash(str):
     )
 
 
+def map_with_executor(executor, function, iterable):
+    """
+    Applies `function` to each item of `iterable`, returning a list in the same
+    order as the input.
+
+    If `executor` is None, the items are processed serially in this thread. If it
+    is a positive integer, a `concurrent.futures.ThreadPoolExecutor` with that many
+    workers is created for the duration of this call. Otherwise, `executor` must
+    be an object with a `map` method, such as any `concurrent.futures.Executor`.
+    """
+    if executor is None:
+        return [function(x) for x in iterable]
+
+    elif is_integer(executor):
+        if executor < 1:
+            raise ak._errors.wrap_error(
+                ValueError(f"number of workers must be positive, not {executor}")
+            )
+        if executor == 1:
+            return [function(x) for x in iterable]
+
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=executor) as pool:
+            return list(pool.map(function, iterable))
+
+    elif callable(getattr(executor, "map", None)):
+        return list(executor.map(function, iterable))
+
+    else:
+        raise ak._errors.wrap_error(
+            TypeError(
+                "executor must be None, a positive integer (number of threads), "
+                f"or an object with a 'map' method, not {executor!r}"
+            )
+        )
+
+
+class LRUCache(collections.abc.MutableMapping):
+    """
+    A dict-like cache that holds at most `max_entries` items and/or items whose
+    `nbytes` add up to at most `max_bytes`, discarding the least recently used
+    ones first. An item that is larger than `max_bytes` by itself is not kept.
+    It is safe to share among threads.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        if not (max_entries is None or (is_integer(max_entries) and max_entries > 0)):
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"max_entries must be a positive integer, not {max_entries!r}"
+                )
+            )
+        if not (max_bytes is None or (is_integer(max_bytes) and max_bytes >= 0)):
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"max_bytes must be a non-negative integer, not {max_bytes!r}"
+                )
+            )
+        if max_entries is None and max_bytes is None:
+            raise ak._errors.wrap_error(
+                ValueError("max_entries and max_bytes can't both be None")
+            )
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._num_bytes = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    def __repr__(self):
+        if self._max_bytes is None:
+            return f"<LRUCache ({len(self)}/{self._max_entries} entries)>"
+        return f"<LRUCache ({self._num_bytes}/{self._max_bytes} bytes)>"
+
+    def __getitem__(self, key):
+        with self._lock:
+            out = self._data[key]
+            self._data.move_to_end(key)
+            return out
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._discard(key)
+            if self._max_bytes is not None and value.nbytes > self._max_bytes:
+                return
+            self._data[key] = value
+            if self._max_bytes is not None:
+                self._num_bytes += value.nbytes
+            while len(self._data) > 1 and (
+                (self._max_entries is not None and len(self._data) > self._max_entries)
+                or (self._max_bytes is not None and self._num_bytes > self._max_bytes)
+            ):
+                self._discard(next(iter(self._data)))
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key):
+        value = self._data.pop(key)
+        if self._max_bytes is not None:
+            self._num_bytes -= value.nbytes
+
+    def __iter__(self):
+        with self._lock:
+            keys = list(self._data)
+        return iter(keys)
+
+    def __len__(self):
+        return len(self._data)
+
+
 # Sentinel object for catching pass-through values
 class Unspecified:
     pass
@@ -346,7 +346,26 @@ class BitMaskedArray(Content):
             return None
 
     def _getitem_range(self, where):
-        return self.toByteMaskedArray()._getitem_range(where)
+        if not self._nplike.known_shape:
+            return self.toByteMaskedArray()._getitem_range(where)
+
+        start, stop, step = where.indices(self.length)
+        assert step == 1
+        if start % 8 != 0:
+            return self.toByteMaskedArray()._getitem_range(where)
+
+        # the range starts on a byte boundary, so the mask can be sliced as bytes
+        stop = max(start, stop)
+        return BitMaskedArray(
+            # ceildiv(stop, 8) = -(stop // -8)
+            self._mask[start // 8 : -(stop // -8)],
+            self._content._getitem_range(slice(start, stop)),
+            self._valid_when,
+            stop - start,
+            self._lsb_order,
+            self._parameters,
+            self._nplike,
+        )
 
     def _getitem_field(self, where, only_fields=()):
         return BitMaskedArray(
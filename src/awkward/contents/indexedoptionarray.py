@@ -1492,9 +1492,20 @@ class IndexedOptionArray(Content):
             )
 
     def _to_arrow(self, pyarrow, mask_node, validbytes, length, options):
-        index = numpy.array(self._index, copy=True)
+        index = self._index.raw(numpy)
         this_validbytes = self.mask_as_bool(valid_when=True)
-        index[~this_validbytes] = 0
+        is_dictionary = (
+            options["categorical_as_dictionary"]
+            and self.parameter("__array__") == "categorical"
+        )
+        if is_dictionary and this_validbytes.all():
+            # nothing is missing, so the index can be passed to Arrow without
+            # copying; DictionaryArrays are nullable without a validity bitmap
+            this_validbytes = None
+        else:
+            # other types need the bitmap to stay nullable (option-type) in Arrow
+            index = numpy.array(index, copy=True)
+            index[~this_validbytes] = 0
 
         if self.parameter("__array__") == "categorical":
             # The new IndexedArray will have this parameter, but the rest
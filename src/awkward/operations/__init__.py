@@ -23,6 +23,7 @@ from awkward.operations.ak_fill_none import fill_none
 from awkward.operations.ak_firsts import firsts
 from awkward.operations.ak_flatten import flatten
 from awkward.operations.ak_from_arrow import from_arrow
+from awkward.operations.ak_from_arrow_ipc import from_arrow_ipc
 from awkward.operations.ak_from_arrow_schema import from_arrow_schema
 from awkward.operations.ak_from_avro_file import from_avro_file
 from awkward.operations.ak_from_buffers import from_buffers
@@ -41,6 +42,10 @@ from awkward.operations.ak_is_none import is_none
 from awkward.operations.ak_is_tuple import is_tuple
 from awkward.operations.ak_is_valid import is_valid
 from awkward.operations.ak_isclose import isclose
+from awkward.operations.ak_iter_arrow import iter_arrow
+from awkward.operations.ak_iter_avro_file import iter_avro_file
+from awkward.operations.ak_iter_json import iter_json
+from awkward.operations.ak_iter_parquet import iter_parquet
 from awkward.operations.ak_linear_fit import linear_fit
 from awkward.operations.ak_local_index import local_index
 from awkward.operations.ak_mask import mask
@@ -67,7 +72,9 @@ from awkward.operations.ak_std import nanstd, std
 from awkward.operations.ak_strings_astype import strings_astype
 from awkward.operations.ak_sum import nansum, sum
 from awkward.operations.ak_to_arrow import to_arrow
+from awkward.operations.ak_to_arrow_ipc import to_arrow_ipc
 from awkward.operations.ak_to_arrow_table import to_arrow_table
+from awkward.operations.ak_to_avro_file import to_avro_file
 from awkward.operations.ak_to_backend import to_backend
 from awkward.operations.ak_to_buffers import to_buffers
 from awkward.operations.ak_to_categorical import to_categorical
@@ -79,6 +86,8 @@ from awkward.operations.ak_to_layout import to_layout
 from awkward.operations.ak_to_list import to_list
 from awkward.operations.ak_to_numpy import to_numpy
 from awkward.operations.ak_to_parquet import to_parquet
+from awkward.operations.ak_to_parquet_dataset import to_parquet_dataset
+from awkward.operations.ak_to_parquet_writer import to_parquet_writer
 from awkward.operations.ak_to_rdataframe import to_rdataframe
 from awkward.operations.ak_to_regular import to_regular
 from awkward.operations.ak_transform import transform
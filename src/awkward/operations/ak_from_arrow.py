@@ -29,6 +29,12 @@ def from_arrow(array, generate_bitmasks=False, highlevel=True, behavior=None):
     low-level #ak.forms.Form), even through Parquet, making Parquet a good way to save
     Awkward Arrays for later use.
 
+    The chunks of a `pyarrow.ChunkedArray` or `pyarrow.Table` are combined by
+    Arrow, unless they have extension types (such as the ones #ak.to_arrow
+    makes), which Arrow can't combine. Those chunks, and lists of record
+    batches, are converted without copying and then merged into one
+    preallocated buffer per node.
+
     See also #ak.to_arrow, #ak.to_arrow_table, #ak.from_parquet, #ak.from_arrow_schema.
     """
     with ak._errors.OperationErrorContext(
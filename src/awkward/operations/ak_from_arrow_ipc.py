@@ -0,0 +1,159 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplikes.NumpyMetadata.instance()
+
+_file_magic = b"ARROW1"
+
+
+def from_arrow_ipc(
+    source,
+    columns=None,
+    format=None,
+    memory_map=True,
+    generate_bitmasks=False,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        source (str, pathlib.Path, bytes, `pyarrow.Buffer`, or file-like object):
+            Local filename, in-memory data, or readable (and, for the file format,
+            seekable) binary file object containing Arrow IPC data.
+        columns (None, str, or list of str): Names of the top-level columns to
+            read; if None, all columns are read.
+        format (None, "file", or "stream"): The IPC "file" format (also known as
+            Feather version 2), which starts with `ARROW1` and allows random
+            access, or the "stream" format. If None, the format is determined
+            from the first bytes of the data.
+        memory_map (bool): If True and `source` is a filename, the file is
+            memory-mapped, rather than read into memory.
+        generate_bitmasks (bool): If enabled and Arrow does not have Awkward
+            metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
+            types that don't have bitmasks in the Arrow data, so that the
+            Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.contents.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Reads an Arrow IPC file or stream, such as one written by #ak.to_arrow_ipc.
+
+    With `memory_map=True`, opening a file does not read its data: the Arrow
+    buffers are views of the mapped file, and the output array refers to them
+    without copying wherever the Awkward and Arrow layouts agree. Only the pages
+    of the selected `columns` are ever loaded from disk (if the file consists of
+    several record batches, they are copied into one array, and if any of the
+    data are compressed, they are decompressed into memory). Unselected columns
+    are skipped without being decompressed, unless `source` is a file object
+    that cannot seek.
+
+    See also #ak.to_arrow_ipc, #ak.from_arrow.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.from_arrow_ipc",
+        dict(
+            source=source,
+            columns=columns,
+            format=format,
+            memory_map=memory_map,
+            generate_bitmasks=generate_bitmasks,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(
+            source, columns, format, memory_map, generate_bitmasks, highlevel, behavior
+        )
+
+
+def _impl(source, columns, format, memory_map, generate_bitmasks, highlevel, behavior):
+    import awkward._connect.pyarrow
+
+    # early exit if missing deps
+    awkward._connect.pyarrow.import_pyarrow("ak.from_arrow_ipc")
+    import pyarrow
+    import pyarrow.ipc
+
+    if format not in (None, "file", "stream"):
+        raise ak._errors.wrap_error(
+            ValueError(f"format must be None, 'file', or 'stream', not {format!r}")
+        )
+    if isinstance(columns, str):
+        columns = [columns]
+
+    # the memory map is closed when the last buffer that uses it is deleted
+    to_close = None
+    is_path, source = ak._util.regularize_path(source)
+    if is_path or isinstance(source, str):
+        if memory_map:
+            source = pyarrow.memory_map(source, "r")
+        else:
+            source = to_close = pyarrow.OSFile(source, "r")
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        source = pyarrow.py_buffer(source)
+
+    try:
+        if format is None:
+            format = "file" if _starts_with_file_magic(source) else "stream"
+
+        if format == "file":
+            open_reader = pyarrow.ipc.open_file
+        else:
+            open_reader = pyarrow.ipc.open_stream
+        table = _open_selected(source, open_reader, columns).read_all()
+    finally:
+        if to_close is not None:
+            to_close.close()
+
+    if columns is not None:
+        missing = [x for x in columns if x not in table.column_names]
+        if len(missing) != 0:
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"columns {missing} not found; available columns are "
+                    f"{table.column_names}"
+                )
+            )
+        table = table.select(columns)
+
+    return ak.operations.ak_from_arrow._impl(
+        table, generate_bitmasks, highlevel, behavior
+    )
+
+
+def _open_selected(source, open_reader, columns):
+    import pyarrow.ipc
+
+    if columns is None:
+        return open_reader(source)
+
+    if isinstance(source, ak._connect.pyarrow.pyarrow.lib.Buffer):
+        position = None
+    elif source.seekable():
+        position = source.tell()
+    else:
+        # the schema is consumed, so all columns are read and then selected
+        return open_reader(source)
+
+    names = open_reader(source).schema.names
+    if position is not None:
+        source.seek(position)
+
+    # only the selected columns are read (and decompressed) from the batches
+    options = pyarrow.ipc.IpcReadOptions(
+        included_fields=[i for i, x in enumerate(names) if x in columns]
+    )
+    return open_reader(source, options=options)
+
+
+def _starts_with_file_magic(source):
+    if isinstance(source, ak._connect.pyarrow.pyarrow.lib.Buffer):
+        return source[: len(_file_magic)].to_pybytes() == _file_magic
+
+    position = source.tell()
+    try:
+        return source.read(len(_file_magic)) == _file_magic
+    finally:
+        source.seek(position)
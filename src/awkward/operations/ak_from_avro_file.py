@@ -9,13 +9,30 @@ np = ak.nplikes.NumpyMetadata.instance()
 
 
 def from_avro_file(
-    file, debug_forth=False, limit_entries=None, highlevel=True, behavior=None
+    file,
+    debug_forth=False,
+    limit_entries=None,
+    columns=None,
+    executor=None,
+    highlevel=True,
+    behavior=None,
 ):
     """
     Args:
         file (string or fileobject): Avro file to be read as Awkward Array.
         debug_forth (bool): If True, prints the generated Forth code for debugging.
         limit_entries (int): The number of rows of the Avro file to be read into the Awkward Array.
+        columns (None, str, or list of str): Names of the fields to read; fields of
+            nested records are selected with dots, such as `"outer.inner"`. The
+            other fields are skipped while decoding, without being stored. If None,
+            all fields are read.
+        executor (None, int, or `concurrent.futures.Executor`): If None, blocks are
+            decoded one after another. If an integer, the blocks are split into
+            that many contiguous groups, which are decoded (and decompressed)
+            concurrently in a thread pool. Any object with a `map` method (such as
+            a `concurrent.futures.Executor`) may also be passed to control how the
+            work is distributed. In all cases, the output array is in the same
+            order as the file.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -24,6 +41,15 @@ def from_avro_file(
 
     Internally this function uses AwkwardForth DSL. The function recursively parses the Avro schema, generates
     Awkward form and Forth code for that specific Avro file and then reads it.
+    The generated code and compiled Forth machines are cached (for the 256 most
+    recently used schemas and column selections), so reading many files with
+    the same schema only does this once.
+
+    Blocks compressed with the "deflate", "bzip2", "xz", "zstandard" (requires the
+    zstandard package), or "snappy" (requires python-snappy) codecs are decompressed
+    in a background thread, while the previous block is being decoded.
+
+    See also #ak.iter_avro_file, #ak.to_avro_file.
     """
     import awkward._connect.avro
 
@@ -35,6 +61,8 @@ def from_avro_file(
             behavior=behavior,
             debug_forth=debug_forth,
             limit_entries=limit_entries,
+            columns=columns,
+            executor=executor,
         ),
     ):
 
@@ -45,7 +73,7 @@ def from_avro_file(
             try:
                 with open(file, "rb") as opened_file:
                     form, length, container = awkward._connect.avro.ReadAvroFT(
-                        opened_file, limit_entries, debug_forth
+                        opened_file, limit_entries, debug_forth, executor, columns
                     ).outcontents
                     return _impl(form, length, container, highlevel, behavior)
             except ImportError as err:
@@ -60,8 +88,8 @@ def from_avro_file(
                 )
             else:
                 form, length, container = awkward._connect.avro.ReadAvroFT(
-                    file, limit_entries, debug_forth
-                ).outarr
+                    file, limit_entries, debug_forth, executor, columns
+                ).outcontents
                 return _impl(form, length, container, highlevel, behavior)
 
 
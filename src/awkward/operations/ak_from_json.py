@@ -1,6 +1,9 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import contextlib
 import json
+import mmap
+import os
 import pathlib
 from collections.abc import Iterable, Sized
 from urllib.parse import urlparse
@@ -22,6 +25,7 @@ def from_json(
     buffersize=65536,
     initial=1024,
     resize=1.5,
+    executor=None,
     highlevel=True,
     behavior=None,
 ):
@@ -39,10 +43,12 @@ def from_json(
             JSON into an array (regardless of how many there are). The line
             delimiter is not actually checked, so it may be `"\n"`, `"\r\n"`
             or anything else.
-        schema (None, JSON str or equivalent lists/dicts): If None, the data type
-            is discovered while parsing. If a JSONSchema
+        schema (None, "infer", JSON str or equivalent lists/dicts): If None, the
+            data type is discovered while parsing. If a JSONSchema
             ([json-schema.org](https://json-schema.org/)), that schema is used to
-            parse the JSON more quickly by skipping type-discovery.
+            parse the JSON more quickly by skipping type-discovery. If `"infer"`
+            and `line_delimited=True`, a JSONSchema is derived from the first
+            documents and used to parse all of them (see below).
         nan_string (None or str): If not None, strings with this value will be
             interpreted as floating-point NaN values.
         posinf_string (None or str): If not None, strings with this value will
@@ -59,6 +65,13 @@ def from_json(
         resize (float): Resize multiplier for buffers used by the
             [ak::ArrayBuilder](_static/classawkward_1_1ArrayBuilder.html);
             should be strictly greater than 1.
+        executor (None, int, or `concurrent.futures.Executor`): If None, the
+            source is parsed in this thread. If not None and `line_delimited=True`,
+            an in-memory or local file `source` is split at newlines into chunks
+            that are parsed concurrently: an integer is a number of threads, and
+            any object with a `map` method (such as a `concurrent.futures.Executor`)
+            may be passed to control how the work is distributed. In all cases,
+            the output array is in the same order as the lines.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -164,9 +177,16 @@ def from_json(
     Note that JSON interpreted with `line_delimited` doesn't actually need delimiters
     between JSON documents or an absence of delimiters within each document. Parsing
     with `line_delimited=True` continues to the end of a JSON document and starts
-    again with the next JSON document. It may be necessary to require actual delimiters
-    between and never within JSON documents to split a large source for
-    parallel-processing, but that consideration is beyond this function.
+    again with the next JSON document.
+
+    Parsing in parallel (with an `executor`), on the other hand, splits the source
+    at `"\n"` characters, so every newline must be between JSON documents, as in
+    [JSON Lines](https://jsonlines.org/). Each chunk is parsed into its own
+    buffers, and the chunks are concatenated at the end; without a `schema`, the
+    type of each chunk is discovered independently, so if chunks differ (for
+    instance, integers in one and floating-point numbers in another), their types
+    are merged by #ak.concatenate. Sources that are neither in-memory nor local
+    files (remote files and file-like objects) are always parsed in one thread.
 
     If a JSONSchema is provided, the schema describes the structure of the JSON
     document, regardless of whether there's only one of them (may be an #ak.Record)
@@ -228,6 +248,17 @@ def from_json(
         and any properties in the data not described by `"properties"` will not
         appear in the output.
 
+    With `schema="infer"`, the types of the first 1000 line-delimited documents
+    are discovered, and if they can be expressed as a JSONSchema (as described
+    above), all of the documents are parsed with that schema. If any document
+    doesn't fit it (for instance, a floating-point number where only integers
+    were seen, a `null` where there were none, or a record field that didn't
+    appear in the first documents), the whole source is parsed again with
+    type-discovery, so the result is the same as with `schema=None`. Since the
+    source is read more than once, file-like objects and remote files are read
+    into memory first. If `line_delimited=False`, `"infer"`
+    is the same as `schema=None`.
+
     Substitutions for non-finite and complex numbers
     ================================================
 
@@ -310,7 +341,7 @@ def from_json(
         ... )
         <Array [1+1.1j, 2+2.2j] type='2 * complex128'>
 
-    See also #ak.to_json.
+    See also #ak.to_json, #ak.iter_json.
     """
     with ak._errors.OperationErrorContext(
         "ak.from_json",
@@ -325,52 +356,104 @@ def from_json(
             buffersize=buffersize,
             initial=initial,
             resize=resize,
+            executor=executor,
             highlevel=highlevel,
             behavior=behavior,
         ),
     ):
-        if schema is None:
-            return _no_schema(
-                source,
-                line_delimited,
-                nan_string,
-                posinf_string,
-                neginf_string,
-                complex_record_fields,
-                buffersize,
-                initial,
-                resize,
-                highlevel,
-                behavior,
-            )
+        return _impl(
+            source,
+            line_delimited,
+            schema,
+            nan_string,
+            posinf_string,
+            neginf_string,
+            complex_record_fields,
+            buffersize,
+            initial,
+            resize,
+            executor,
+            highlevel,
+            behavior,
+        )
 
-        else:
-            return _yes_schema(
-                source,
-                line_delimited,
-                schema,
-                nan_string,
-                posinf_string,
-                neginf_string,
-                complex_record_fields,
-                buffersize,
-                initial,
-                resize,
-                highlevel,
-                behavior,
-            )
+
+def _impl(
+    source,
+    line_delimited,
+    schema,
+    nan_string,
+    posinf_string,
+    neginf_string,
+    complex_record_fields,
+    buffersize,
+    initial,
+    resize,
+    executor,
+    highlevel,
+    behavior,
+):
+    if isinstance(schema, str) and schema == "infer":
+        return _infer_schema(
+            source,
+            line_delimited,
+            nan_string,
+            posinf_string,
+            neginf_string,
+            complex_record_fields,
+            buffersize,
+            initial,
+            resize,
+            executor,
+            highlevel,
+            behavior,
+        )
+
+    elif schema is None:
+        return _no_schema(
+            source,
+            line_delimited,
+            nan_string,
+            posinf_string,
+            neginf_string,
+            complex_record_fields,
+            buffersize,
+            initial,
+            resize,
+            executor,
+            highlevel,
+            behavior,
+        )
+
+    else:
+        return _yes_schema(
+            source,
+            line_delimited,
+            schema,
+            nan_string,
+            posinf_string,
+            neginf_string,
+            complex_record_fields,
+            buffersize,
+            initial,
+            resize,
+            executor,
+            highlevel,
+            behavior,
+        )
 
 
 class _BytesReader:
-    __slots__ = ("data", "current")
+    __slots__ = ("data", "current", "stop")
 
-    def __init__(self, data):
+    def __init__(self, data, start=0, stop=None):
         self.data = data
-        self.current = 0
+        self.current = start
+        self.stop = len(data) if stop is None else stop
 
     def read(self, num_bytes):
         before = self.current
-        self.current += num_bytes
+        self.current = min(before + num_bytes, self.stop)
         return self.data[before : self.current]
 
     def __enter__(self):
@@ -395,12 +478,11 @@ def _get_reader(source):
     if not isinstance(source, pathlib.Path) and isinstance(source, str):
         source = source.encode("utf8", errors="surrogateescape")
 
-    if isinstance(source, bytes):
+    if isinstance(source, (bytes, mmap.mmap)):
         return lambda: _BytesReader(source)
 
     elif isinstance(source, pathlib.Path):
-        parsed_url = urlparse(str(source))
-        if parsed_url.scheme == "" or parsed_url.netloc == "":
+        if _is_local(source):
             return lambda: open(source, "rb")  # pylint: disable=R1732
         else:
             import fsspec
@@ -411,6 +493,73 @@ def _get_reader(source):
         return lambda: _NoContextManager(source)
 
 
+def _is_local(path):
+    parsed_url = urlparse(str(path))
+    return parsed_url.scheme == "" or parsed_url.netloc == ""
+
+
+@contextlib.contextmanager
+def _get_data(source):
+    if not isinstance(source, pathlib.Path) and isinstance(source, str):
+        source = source.encode("utf8", errors="surrogateescape")
+
+    if isinstance(source, (bytes, mmap.mmap)):
+        yield source
+
+    elif isinstance(source, pathlib.Path) and _is_local(source):
+        with open(source, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b""
+            else:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    yield data
+
+    else:
+        yield None
+
+
+def _line_chunks(data, num_chunks):
+    size = len(data)
+    boundaries = [0]
+    for i in range(1, num_chunks):
+        newline = data.find(b"\n", max(size * i // num_chunks, boundaries[-1]))
+        if newline == -1:
+            break
+        boundaries.append(newline + 1)
+    boundaries.append(size)
+
+    out = [(a, b) for a, b in zip(boundaries[:-1], boundaries[1:]) if a < b]
+    return out if len(out) != 0 else [(0, 0)]
+
+
+def _parse(source, line_delimited, executor, parse):
+    if line_delimited and executor is not None:
+        if ak._util.is_integer(executor):
+            num_chunks = executor
+        else:
+            num_chunks = os.cpu_count() or 1
+
+        with _get_data(source) as data:
+            if data is not None:
+                layouts = ak._util.map_with_executor(
+                    executor,
+                    lambda chunk: parse(_BytesReader(data, *chunk)),
+                    _line_chunks(data, max(num_chunks, 1)),
+                )
+                nonempty = [x for x in layouts if x.length != 0]
+                if len(nonempty) == 0:
+                    return layouts[0]
+                elif len(nonempty) == 1:
+                    return nonempty[0]
+                else:
+                    return ak.operations.ak_concatenate._impl(
+                        nonempty, 0, True, True, False, None
+                    )
+
+    with _get_reader(source)() as obj:
+        return parse(obj)
+
+
 def _record_to_complex(layout, complex_record_fields):
     if complex_record_fields is None:
         return layout
@@ -466,14 +615,14 @@ def _no_schema(
     buffersize,
     initial,
     resize,
+    executor,
     highlevel,
     behavior,
 ):
-    builder = ak._ext.ArrayBuilder(initial=initial, resize=resize)
-
     read_one = not line_delimited
 
-    with _get_reader(source)() as obj:
+    def parse(obj):
+        builder = ak._ext.ArrayBuilder(initial=initial, resize=resize)
         try:
             ak._ext.fromjsonobj(
                 obj,
@@ -487,10 +636,11 @@ def _no_schema(
         except Exception as err:
             raise ak._errors.wrap_error(ValueError(str(err))) from None
 
-    formstr, length, buffers = builder.to_buffers()
-    form = ak.forms.from_json(formstr)
-    layout = ak.operations.from_buffers(form, length, buffers, highlevel=False)
+        formstr, length, buffers = builder.to_buffers()
+        form = ak.forms.from_json(formstr)
+        return ak.operations.from_buffers(form, length, buffers, highlevel=False)
 
+    layout = _parse(source, line_delimited, executor, parse)
     layout = _record_to_complex(layout, complex_record_fields)
 
     if read_one:
@@ -513,6 +663,7 @@ def _yes_schema(
     buffersize,
     initial,
     resize,
+    executor,
     highlevel,
     behavior,
 ):
@@ -549,25 +700,30 @@ def _yes_schema(
         )
 
     read_one = not line_delimited
+    instructions = json.dumps(instructions)
 
-    with _get_reader(source)() as obj:
+    def parse(obj):
+        # each parse fills its own copy of the container
+        buffers = dict(container)
         try:
             length = ak._ext.fromjsonobj_schema(
                 obj,
-                container,
+                buffers,
                 read_one,
                 buffersize,
                 nan_string,
                 posinf_string,
                 neginf_string,
-                json.dumps(instructions),
+                instructions,
                 initial,
                 resize,
             )
         except Exception as err:
             raise ak._errors.wrap_error(ValueError(str(err))) from None
 
-    layout = ak.operations.from_buffers(form, length, container, highlevel=False)
+        return ak.operations.from_buffers(form, length, buffers, highlevel=False)
+
+    layout = _parse(source, line_delimited, executor, parse)
     layout = _record_to_complex(layout, complex_record_fields)
 
     if is_record and read_one:
@@ -579,6 +735,192 @@ def _yes_schema(
         return layout
 
 
+_infer_num_documents = 1000
+
+
+def _infer_schema(
+    source,
+    line_delimited,
+    nan_string,
+    posinf_string,
+    neginf_string,
+    complex_record_fields,
+    buffersize,
+    initial,
+    resize,
+    executor,
+    highlevel,
+    behavior,
+):
+    options = (
+        nan_string,
+        posinf_string,
+        neginf_string,
+        complex_record_fields,
+        buffersize,
+        initial,
+        resize,
+        executor,
+        highlevel,
+        behavior,
+    )
+    if not line_delimited:
+        return _no_schema(source, line_delimited, *options)
+
+    with _get_data(source) as data:
+        if data is None:
+            # the source is read twice, so it can't be a stream
+            with _get_reader(source)() as obj:
+                data = b"".join(iter(lambda: obj.read(buffersize), b""))
+
+        end = 0
+        for _ in range(_infer_num_documents):
+            end = data.find(b"\n", end) + 1
+            if end == 0:
+                end = len(data)
+                break
+
+        sample = _no_schema(
+            data[:end],
+            True,
+            nan_string,
+            posinf_string,
+            neginf_string,
+            None,
+            buffersize,
+            initial,
+            resize,
+            None,
+            False,
+            None,
+        )
+        schema = _form_to_schema(sample.form)
+
+        # in line-delimited mode, a root "array" would concatenate the documents
+        if schema is not None and schema["type"] == "object":
+            try:
+                layout = _yes_schema(
+                    data,
+                    line_delimited,
+                    schema,
+                    nan_string,
+                    posinf_string,
+                    neginf_string,
+                    None,
+                    buffersize,
+                    initial,
+                    resize,
+                    executor,
+                    False,
+                    None,
+                )
+            except ValueError:
+                pass
+            else:
+                # keys that are not in the schema are skipped without an error,
+                # so documents after the sample may have had fields dropped
+                if _num_keys(layout) == _num_json_keys(data):
+                    layout = _record_to_complex(layout, complex_record_fields)
+                    return ak._util.wrap(layout, behavior, highlevel)
+
+        return _no_schema(data, line_delimited, *options)
+
+
+def _num_keys(layout):
+    # the number of keys in the JSON objects that layout was read from
+    if layout.is_option or layout.is_indexed:
+        return _num_keys(layout.project())
+    elif layout.is_list:
+        layout = layout.toListOffsetArray64(True)
+        return _num_keys(layout.content[: layout.offsets[-1]])
+    elif layout.is_record:
+        return layout.length * len(layout.fields) + sum(
+            _num_keys(layout.content(x)) for x in layout.fields
+        )
+    else:
+        return 0
+
+
+def _num_json_keys(data):
+    # every key is a string followed by a colon, maybe with whitespace between;
+    # the contents of strings can look like that too, so this can overcount,
+    # but it never undercounts
+    num = 0
+    start = 0
+    while start < len(data):
+        # each chunk ends with a colon, so that no key is split between two
+        stop = data.find(b":", start + 2**24) + 1 or len(data)
+        num += data[start:stop].translate(None, b" \t\r\n").count(b'":')
+        start = stop
+    return num
+
+
+def _form_to_schema(form):
+    if isinstance(
+        form,
+        (
+            ak.forms.IndexedOptionForm,
+            ak.forms.ByteMaskedForm,
+            ak.forms.BitMaskedForm,
+            ak.forms.UnmaskedForm,
+        ),
+    ):
+        out = _form_to_schema(form.content)
+        if out is None or isinstance(out["type"], list):
+            return None
+        out["type"] = [out["type"], "null"]
+        return out
+
+    elif isinstance(form, ak.forms.IndexedForm):
+        return _form_to_schema(form.content)
+
+    elif isinstance(form, ak.forms.NumpyForm):
+        if len(form.inner_shape) != 0:
+            return None
+        elif form.primitive == "bool":
+            return {"type": "boolean"}
+        elif form.primitive.startswith(("int", "uint")):
+            return {"type": "integer"}
+        elif form.primitive.startswith("float"):
+            return {"type": "number"}
+        else:
+            return None
+
+    elif isinstance(form, (ak.forms.ListOffsetForm, ak.forms.ListForm)):
+        if form.parameter("__array__") == "string":
+            return {"type": "string"}
+        elif form.parameter("__array__") == "bytestring":
+            return None
+        content = _form_to_schema(form.content)
+        if content is None:
+            return None
+        return {"type": "array", "items": content}
+
+    elif isinstance(form, ak.forms.RegularForm):
+        content = _form_to_schema(form.content)
+        if content is None:
+            return None
+        return {
+            "type": "array",
+            "items": content,
+            "minItems": form.size,
+            "maxItems": form.size,
+        }
+
+    elif isinstance(form, ak.forms.RecordForm) and not form.is_tuple:
+        properties = {}
+        for field, content in zip(form.fields, form.contents):
+            properties[field] = _form_to_schema(content)
+            if properties[field] is None:
+                return None
+        return {"type": "object", "properties": properties}
+
+    else:
+        # unknown (EmptyForm), unions, tuples, and other types that JSONSchema
+        # can't express (or that build_assembly doesn't support)
+        return None
+
+
 def build_assembly(schema, container, instructions):
     if not isinstance(schema, dict):
         raise ak._errors.wrap_error(
@@ -680,7 +1022,7 @@ def build_assembly(schema, container, instructions):
 
         else:
             if is_optional:
-                mask = f"node{container}"
+                mask = f"node{len(container)}"
                 container[mask + "-mask"] = None
                 instructions.append(["FillByteMaskedArray", mask + "-mask", "int8"])
 
@@ -1,17 +1,31 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import collections
+import json
+import pickle
+from collections.abc import Mapping
+
 import awkward as ak
 
+np = ak.nplikes.NumpyMetadata.instance()
+
 
 def from_parquet(
     path,
     columns=None,
     row_groups=None,
+    filter=None,
+    entry_start=None,
+    entry_stop=None,
     storage_options=None,
     max_gap=64_000,
     max_block=256_000_000,
     footer_sample_size=1_000_000,
     generate_bitmasks=False,
+    executor=None,
+    lazy=False,
+    lazy_cache_size=256 * 1024**2,
+    metadata_cache=None,
     highlevel=True,
     behavior=None,
 ):
@@ -26,6 +40,24 @@ def from_parquet(
         row_groups (None or set of int): Row groups to read; must be non-negative.
             Order is ignored: the output array is presented in the order specified by
             Parquet metadata. If None, all row groups/all rows are read.
+        filter (None, list of tuples, or list of lists of tuples): Predicate on
+            the Parquet column statistics in disjunctive normal form, like
+            pyarrow's `filters`: each tuple is `(column, op, value)` with op in
+            `==`, `=`, `!=`, `<`, `<=`, `>`, `>=`, `in`, `not in`, a list of
+            tuples is their logical-and, and a list of such lists is the
+            logical-or of those. Row groups whose min/max statistics prove that
+            no value can satisfy the predicate are skipped without being read.
+            Columns are named as in #ak.metadata_from_parquet's `"columns"`
+            (`"list.item"` parts may be omitted). This only selects row groups;
+            rows within the selected row groups are not filtered.
+        entry_start (None or int): First entry (row) to read, counting only the
+            rows of the row groups selected by `row_groups` and `filter`. As in
+            a Python slice, negative values count from the end. If None, start
+            at the first entry.
+        entry_stop (None or int): Entry (row) at which to stop reading, exclusive,
+            in the same numbering as `entry_start`. If None, read to the end.
+            Only the row groups that overlap the range are read, and the rows
+            outside of it are removed from the first and last of them.
         storage_options: Passed to `fsspec.parquet.open_parquet_file`.
         max_gap (int): Passed to `fsspec.parquet.open_parquet_file`.
         max_block (int): Passed to `fsspec.parquet.open_parquet_file`.
@@ -34,6 +66,33 @@ def from_parquet(
             metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
             types that don't have bitmasks in the Arrow/Parquet data, so that the
             Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        executor (None, int, or `concurrent.futures.Executor`): If None, files
+            are read one after another. If an integer, up to that many files are
+            read and converted concurrently in a thread pool. Any object with a
+            `map` method (such as a `concurrent.futures.Executor`) may also be
+            passed to control how the work is distributed. In all cases, the
+            output array is in the same order as the files.
+        lazy (bool): If True and the data are records, return an #ak.Array whose
+            top-level fields are read from the files only when they are first
+            accessed by name (e.g. `array.x` or `array["x"]`). Any other use of
+            the array reads all of the selected fields, without keeping them
+            beyond the cache. Ignored if not high-level or if the data are not
+            records.
+        lazy_cache_size (int): Maximum number of bytes of fields read by a `lazy`
+            array to keep in its cache; the least recently used fields are
+            dropped (and would be read again if needed). If 0, nothing is kept.
+        metadata_cache (None, True, or MutableMapping): If not None, the
+            directory listing and the Parquet footers are kept in this mapping
+            and reused by later calls that read the same files, rather than
+            being listed and parsed again. If True, a process-wide cache
+            that keeps the 1024 most recently used entries is used. Entries are keyed by
+            path, size, and modification time (or ETag), so rewritten files are
+            read again. Listings of directories with subdirectories (such as
+            partitioned datasets) are not kept, since files can be added to
+            them without changing the modification time of the top directory.
+            Other listings are refreshed if the filesystem reports a new
+            modification time for the directory (local directories do; object
+            stores generally do not) or if a listed file has been removed.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.contents.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
@@ -41,10 +100,14 @@ def from_parquet(
 
     Reads data from a local or remote Parquet file or collection of files.
 
-    The data are eagerly (not lazily) read and must fit into memory. Use `columns`
-    and/or `row_groups` to select and filter manageable subsets of the data, and
-    use #ak.metadata_from_parquet to find column names and the range of row groups
-    that a dataset has.
+    Unless `lazy=True`, the data are eagerly read and must fit into memory. Use
+    `columns` and/or `row_groups` to select and filter manageable subsets of the
+    data, and use #ak.metadata_from_parquet to find column names and the range
+    of row groups that a dataset has.
+
+    Local files are memory-mapped, rather than read through Python file objects,
+    so that uncompressed, plain-encoded columns are not copied on their way into
+    the output array.
 
     See also #ak.to_parquet, #ak.metadata_from_parquet.
     """
@@ -54,23 +117,93 @@ def from_parquet(
             path=path,
             columns=columns,
             row_groups=row_groups,
+            filter=filter,
+            entry_start=entry_start,
+            entry_stop=entry_stop,
             storage_options=storage_options,
             max_gap=max_gap,
             max_block=max_block,
             footer_sample_size=footer_sample_size,
             generate_bitmasks=generate_bitmasks,
+            executor=executor,
+            lazy=lazy,
+            lazy_cache_size=lazy_cache_size,
+            metadata_cache=metadata_cache,
             highlevel=highlevel,
             behavior=behavior,
         ),
     ):
         import awkward._connect.pyarrow  # noqa: F401
 
-        parquet_columns, subform, actual_paths, fs, subrg, row_counts, meta = metadata(
+        (
+            parquet_columns,
+            subform,
+            actual_paths,
+            fs,
+            subrg,
+            row_counts,
+            meta,
+            entry_range,
+        ) = _metadata(
             path,
             storage_options,
             row_groups,
             columns,
+            filter=filter,
+            metadata_cache=metadata_cache,
+            entry_start=entry_start,
+            entry_stop=entry_stop,
         )
+
+        if (
+            lazy
+            and highlevel
+            and isinstance(subform, ak.forms.RecordForm)
+            and len(subform.fields) != 0
+            and row_counts is not None
+            and not _record_is_scalar(meta)
+        ):
+
+            def read_field(field):
+                # parquet_columns are dot-separated paths, starting with the field
+                field_columns = [
+                    x
+                    for x in parquet_columns
+                    if x == field or x.startswith(field + ".")
+                ]
+                out = _load(
+                    actual_paths,
+                    field_columns,
+                    subrg,
+                    max_gap,
+                    max_block,
+                    footer_sample_size,
+                    generate_bitmasks,
+                    subform.select_columns([field]),
+                    False,
+                    None,
+                    fs,
+                    executor=executor,
+                    entry_range=entry_range,
+                )
+                return ak.operations.to_layout(out)[field]
+
+            if not (ak._util.is_integer(lazy_cache_size) and lazy_cache_size >= 0):
+                raise ak._errors.wrap_error(
+                    ValueError(
+                        "lazy_cache_size must be a non-negative integer, "
+                        f"not {lazy_cache_size!r}"
+                    )
+                )
+
+            return _LazyRecordArray(
+                subform,
+                sum(row_counts) if entry_range is None else entry_range[1],
+                read_field,
+                ak._util.LRUCache(max_bytes=lazy_cache_size),
+                behavior,
+            )
+
         return _load(
             actual_paths,
             parquet_columns if columns is not None else None,
@@ -83,6 +216,8 @@ def from_parquet(
             highlevel,
             behavior,
             fs,
+            executor=executor,
+            entry_range=entry_range,
         )
 
 
@@ -93,7 +228,37 @@ def metadata(
     columns=None,
     ignore_metadata=False,
     scan_files=True,
+    filter=None,
+    metadata_cache=None,
+):
+    return _metadata(
+        path,
+        storage_options,
+        row_groups,
+        columns,
+        ignore_metadata,
+        scan_files,
+        filter,
+        metadata_cache,
+    )[:-1]
+
+
+def _metadata(
+    path,
+    storage_options=None,
+    row_groups=None,
+    columns=None,
+    ignore_metadata=False,
+    scan_files=True,
+    filter=None,
+    metadata_cache=None,
+    entry_start=None,
+    entry_stop=None,
 ):
+    """
+    Same as `metadata`, with one more output: None or a `(skip, take)` pair of
+    entries to keep from the selected row groups, if an entry range is given.
+    """
     import awkward._connect.pyarrow
 
     # early exit if missing deps
@@ -108,22 +273,54 @@ def metadata(
         if len(set(row_groups)) < len(row_groups):
             raise ak._errors.wrap_error(ValueError("row group indices must not repeat"))
 
-    fs, _, paths = fsspec.get_fs_token_paths(
+    if filter is not None:
+        filter = _regularize_filter(filter)
+
+    metadata_cache = _regularize_metadata_cache(metadata_cache)
+
+    fs, fs_token, paths = fsspec.get_fs_token_paths(
         path, mode="rb", storage_options=storage_options
     )
-    all_paths, path_for_schema, can_sub = _all_and_metadata_paths(
-        path, fs, paths, ignore_metadata, scan_files
-    )
+
+    key = listing = None
+    if metadata_cache is not None:
+        # fs_token identifies the filesystem, not the paths
+        key = (
+            "listing",
+            fs_token,
+            ignore_metadata,
+            scan_files,
+            tuple((fs.unstrip_protocol(x), _file_stamp(fs, x)) for x in paths),
+        )
+        listing = metadata_cache.get(key)
+    if listing is not None:
+        try:
+            metadata, schema_arrow = _read_footers(
+                fs, *listing, scan_files, pyarrow_parquet, metadata_cache
+            )
+        except FileNotFoundError:
+            # a listed file was removed, which doesn't change the modification
+            # time of a directory in an object store
+            metadata_cache.pop(key, None)
+            listing = None
+    if listing is None:
+        *listing, nested = _all_and_metadata_paths(
+            path, fs, paths, ignore_metadata, scan_files
+        )
+        if key is not None and not nested:
+            # files added to or removed from a subdirectory don't change the
+            # modification times of the directories in `paths`
+            metadata_cache[key] = tuple(listing)
+        metadata, schema_arrow = _read_footers(
+            fs, *listing, scan_files, pyarrow_parquet, metadata_cache
+        )
+    all_paths, path_for_schema, can_sub = listing
 
     subrg = [None] * len(all_paths)
     actual_paths = all_paths
-    with fs.open(
-        path_for_schema,
-    ) as file_for_metadata:
-        parquetfile_for_metadata = pyarrow_parquet.ParquetFile(file_for_metadata)
 
     list_indicator = "list.item"
-    for column_metadata in parquetfile_for_metadata.schema:
+    for column_metadata in metadata.schema:
         if (
             column_metadata.max_repetition_level > 0
             and ".list.element." in column_metadata.path
@@ -131,30 +328,16 @@ def metadata(
             list_indicator = "list.element"
             break
 
-    subform = ak._connect.pyarrow.form_handle_arrow(
-        parquetfile_for_metadata.schema_arrow, pass_empty_field=True
-    )
+    subform = ak._connect.pyarrow.form_handle_arrow(schema_arrow, pass_empty_field=True)
     if columns is not None:
         subform = subform.select_columns(columns)
 
     # Handle empty field at root
-    if parquetfile_for_metadata.schema_arrow.names == [""]:
+    if schema_arrow.names == [""]:
         column_prefix = ("",)
     else:
         column_prefix = ()
 
-    metadata = parquetfile_for_metadata.metadata
-    if scan_files and not path_for_schema.endswith("/_metadata"):
-        if path_for_schema in all_paths:
-            scan_paths = all_paths[1:]
-        else:
-            scan_paths = all_paths
-        for apath in scan_paths:
-            with fs.open(apath, "rb") as f:
-                md = pyarrow_parquet.ParquetFile(f).metadata
-                # TODO: not nested directory structure yet
-                md.set_file_path(apath.rsplit("/", 1)[-1])
-                metadata.append_row_groups(md)
     if row_groups is not None:
         if any(_ >= metadata.num_row_groups for _ in row_groups):
             raise ak._errors.wrap_error(
@@ -169,6 +352,35 @@ def metadata(
                 )
             )
 
+    if filter is not None:
+        if not can_sub:
+            raise ak._errors.wrap_error(
+                TypeError(
+                    "Requested a filter on row-group statistics, but not scanning metadata"
+                )
+            )
+        if row_groups is None:
+            row_groups = range(metadata.num_row_groups)
+        row_groups = [
+            i for i in row_groups if _row_group_may_match(metadata.row_group(i), filter)
+        ]
+
+    entry_range = None
+    if entry_start is not None or entry_stop is not None:
+        if not can_sub:
+            raise ak._errors.wrap_error(
+                TypeError("Requested a range of entries, but not scanning metadata")
+            )
+        if row_groups is None:
+            row_groups = range(metadata.num_row_groups)
+        row_groups, entry_range = _row_groups_in_range(
+            [metadata.row_group(i).num_rows for i in row_groups],
+            row_groups,
+            entry_start,
+            entry_stop,
+        )
+
+    if row_groups is not None:
         path_rgs = {}
         rgs_path = {}
         subrg = []
@@ -200,7 +412,40 @@ def metadata(
         list_indicator=list_indicator, column_prefix=column_prefix
     )
 
-    return parquet_columns, subform, actual_paths, fs, subrg, col_counts, metadata
+    return (
+        parquet_columns,
+        subform,
+        actual_paths,
+        fs,
+        subrg,
+        col_counts,
+        metadata,
+        entry_range,
+    )
+
+
+def _row_groups_in_range(num_rows, row_groups, entry_start, entry_stop):
+    """Selects the row groups that overlap a Python-like slice of the entries"""
+    for name, value in [("entry_start", entry_start), ("entry_stop", entry_stop)]:
+        if value is not None and not ak._util.is_integer(value):
+            raise ak._errors.wrap_error(
+                TypeError(f"{name} must be None or an integer, not {value!r}")
+            )
+    start, stop, _ = slice(entry_start, entry_stop).indices(sum(num_rows))
+    stop = max(start, stop)
+
+    selected = []
+    skip = None
+    first = 0
+    for count, row_group in zip(num_rows, row_groups):
+        last = first + count
+        if first < stop and last > start:
+            if skip is None:
+                skip = start - first
+            selected.append(row_group)
+        first = last
+
+    return selected, (skip or 0, stop - start)
 
 
 def _load(
@@ -216,23 +461,28 @@ def _load(
     behavior,
     fs,
     metadata=None,
+    executor=None,
+    entry_range=None,
 ):
-    arrays = []
-    for i, p in enumerate(actual_paths):
-        arrays.append(
-            _read_parquet_file(
-                p,
-                fs=fs,
-                parquet_columns=parquet_columns,
-                row_groups=subrg[i],
-                max_gap=max_gap,
-                max_block=max_block,
-                footer_sample_size=footer_sample_size,
-                generate_bitmasks=generate_bitmasks,
-                metadata=metadata,
-            )
+    def read_one(i):
+        return _read_parquet_file(
+            actual_paths[i],
+            fs=fs,
+            parquet_columns=parquet_columns,
+            row_groups=subrg[i],
+            max_gap=max_gap,
+            max_block=max_block,
+            footer_sample_size=footer_sample_size,
+            generate_bitmasks=generate_bitmasks,
+            metadata=metadata,
         )
 
+    # the executor preserves order, so the output does not depend on timing
+    arrays = ak._util.map_with_executor(executor, read_one, range(len(actual_paths)))
+
+    if entry_range is not None:
+        arrays = _trim_entries(arrays, *entry_range)
+
     if len(arrays) == 0:
         numpy = ak.nplikes.Numpy.instance()
         return ak.operations.ak_from_buffers._impl(
@@ -243,6 +493,15 @@ def _load(
         if isinstance(arrays[0], ak.record.Record):
             return ak.Record(arrays[0])
         return ak.Array(arrays[0])
+    elif all(isinstance(x, ak.contents.Content) for x in arrays) and all(
+        x.form.to_dict(verbose=False) == arrays[0].form.to_dict(verbose=False)
+        for x in arrays[1:]
+    ):
+        # each file's buffers are released as soon as they are copied, so the
+        # peak memory is about one copy of the output, rather than two
+        return ak._util.wrap(
+            ak._connect.pyarrow.concatenate_owned(arrays), behavior, highlevel
+        )
     else:
         # TODO: if each array is a record?
         return ak.operations.ak_concatenate._impl(
@@ -250,14 +509,35 @@ def _load(
         )
 
 
+def _trim_entries(arrays, skip, take):
+    """Keeps `take` entries after the first `skip` of the concatenated `arrays`"""
+    out = []
+    for array in arrays:
+        start = min(skip, array.length)
+        stop = min(array.length, start + take)
+        if stop > start:
+            out.append(array._getitem_range(slice(start, stop)))
+        skip -= start
+        take -= stop - start
+    return out
+
+
 def _open_file(
     path, fs, columns, row_groups, max_gap, max_block, footer_sample_size, metadata
 ):
-    """Picks between fsspec.parquet and normal fs.open"""
+    """Picks between fsspec.parquet, a memory map, and normal fs.open"""
+    import fsspec.implementations.local
     import fsspec.parquet
 
+    if isinstance(fs, fsspec.implementations.local.LocalFileSystem):
+        import pyarrow
+
+        # pages are read as slices of the mapped file, rather than copied through
+        # Python file objects; the mapping lives as long as any buffer uses it
+        return pyarrow.memory_map(path, "r")
+
     # condition should be if columns and ow_groups are not all the possible ones
-    if (columns or row_groups) and getattr(fs, "async_impl", False):
+    elif (columns or row_groups) and getattr(fs, "async_impl", False):
         return fsspec.parquet.open_parquet_file(
             path,
             fs=fs,
@@ -312,6 +592,344 @@ def _read_parquet_file(
     )
 
 
+def _record_is_scalar(metadata):
+    parameters = metadata.metadata and metadata.metadata.get(b"ak:parameters")
+    if parameters is not None:
+        for x in json.loads(parameters):
+            if x.get("record_is_scalar"):
+                return True
+    return False
+
+
+def _array_from_state(state):
+    out = ak.highlevel.Array.__new__(ak.highlevel.Array)
+    out.__setstate__(state)
+    return out
+
+
+class _LazyRecordArray(ak.highlevel.Array):
+    """
+    An #ak.Array of records whose fields are read when first projected.
+
+    Projecting one top-level field by name reads (or takes from the cache) only
+    that field; everything else that needs the `layout` reads all of them. The
+    `layout` is built again each time, so that only the cache holds on to the
+    fields; `len`, `fields`, `type`, and `repr` come from the Form.
+
+    Instances also subclass the class that `behavior` assigns to the records
+    (see #ak.behavior), and are named after it.
+    """
+
+    def __new__(cls, form, length, read_field, fields_cache, behavior):
+        if cls is _LazyRecordArray:
+            cls = _lazy_class(ak._util.arrayclass(form, behavior))
+        return super().__new__(cls)
+
+    def __init__(self, form, length, read_field, fields_cache, behavior):
+        self._form = form
+        self._length = length
+        self._read_field = read_field
+        self._fields_cache = fields_cache
+        self._materialized = None
+        self._numbaview = None
+        self._behavior = behavior
+
+    @property
+    def _layout(self):
+        if self._materialized is not None:
+            # the layout was replaced, such as by __setitem__
+            return self._materialized
+        return ak.contents.RecordArray(
+            [self._field(x) for x in self._form.fields],
+            None if self._form.is_tuple else self._form.fields,
+            self._length,
+            self._form.parameters,
+        )
+
+    @_layout.setter
+    def _layout(self, layout):
+        self._materialized = layout
+
+    def _field(self, field):
+        try:
+            return self._fields_cache[field]
+        except KeyError:
+            out = self._fields_cache[field] = self._read_field(field)
+            return out
+
+    @ak.highlevel.Array.behavior.setter
+    def behavior(self, behavior):
+        # the layout is a property here, so only switch between lazy classes
+        if behavior is None or isinstance(behavior, Mapping):
+            self.__class__ = _lazy_class(ak._util.arrayclass(self._form, behavior))
+            self._behavior = behavior
+        else:
+            raise ak._errors.wrap_error(TypeError("behavior must be None or a dict"))
+
+    @property
+    def fields(self):
+        if self._materialized is None:
+            return self._form.fields
+        return self._materialized.fields
+
+    @property
+    def type(self):
+        if self._materialized is None:
+            return ak.types.ArrayType(
+                self._form.type_from_behavior(self._behavior), self._length
+            )
+        return super().type
+
+    def __len__(self):
+        if self._materialized is None:
+            return self._length
+        return len(self._materialized)
+
+    def _repr(self, limit_cols):
+        if self._materialized is not None:
+            return super()._repr(limit_cols)
+
+        pytype = type(self).__name__
+        typestr = repr(str(self.type))[1:-1]
+        length = max(3, limit_cols - len(pytype) - len("type='...'") - len(" [...]"))
+        if len(typestr) > length:
+            typestr = "'" + typestr[: length - 3] + "...'"
+        else:
+            typestr = "'" + typestr + "'"
+
+        return f"<{pytype} [...] type={typestr}>"
+
+    def __str__(self):
+        # printing takes many small slices of the array, so read it only once
+        return str(ak._util.wrap(self._layout, self._behavior))
+
+    def show(self, *args, **kwargs):
+        return ak._util.wrap(self._layout, self._behavior).show(*args, **kwargs)
+
+    def __reduce__(self):
+        # unpickles as an ordinary, fully read ak.Array
+        state = ak.highlevel.Array(self._layout, behavior=self._behavior).__getstate__()
+        return _array_from_state, (state,)
+
+    def __getitem__(self, where):
+        if (
+            self._materialized is None
+            and isinstance(where, str)
+            and where in self._form.fields
+        ):
+            return ak._util.wrap(self._field(where), self._behavior)
+        return super().__getitem__(where)
+
+    def __getattr__(self, where):
+        if (
+            where.startswith("_")
+            or self._materialized is not None
+            or where not in self._form.fields
+        ):
+            return super().__getattr__(where)
+        return self[where]
+
+
+_lazy_classes = {}
+
+
+def _lazy_class(cls):
+    # cached, so that equal behaviors make instances of the same class
+    try:
+        return _lazy_classes[cls]
+    except KeyError:
+        out = _lazy_classes[cls] = type(
+            cls.__name__, (_LazyRecordArray, cls), {"__module__": cls.__module__}
+        )
+        return out
+
+
+_filter_ops = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def _regularize_filter(filter):
+    """Normalizes a DNF filter into a list of lists of (column, op, value)"""
+    if (
+        isinstance(filter, list)
+        and len(filter) != 0
+        and all(isinstance(x, tuple) for x in filter)
+    ):
+        filter = [filter]
+
+    if not (
+        isinstance(filter, list)
+        and len(filter) != 0
+        and all(isinstance(x, list) and len(x) != 0 for x in filter)
+        and all(isinstance(y, tuple) and len(y) == 3 for x in filter for y in x)
+    ):
+        raise ak._errors.wrap_error(
+            TypeError(
+                "filter must be a non-empty list of (column, op, value) tuples "
+                "or a non-empty list of such lists"
+            )
+        )
+
+    for conjunction in filter:
+        for column, op, value in conjunction:
+            if op not in _filter_ops:
+                raise ak._errors.wrap_error(
+                    ValueError(
+                        f"filter op must be one of {', '.join(_filter_ops)}, not {op!r}"
+                    )
+                )
+            if op in ("in", "not in") and isinstance(value, (str, bytes)):
+                raise ak._errors.wrap_error(
+                    TypeError(f"filter value for {op!r} must be a collection")
+                )
+
+    return filter
+
+
+def _row_group_may_match(row_group, filter):
+    """False only if the column statistics prove that no row can match"""
+    statistics = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        path = column.path_in_schema
+        statistics[path] = column.statistics
+        short = path.replace(".list.item", "").replace(".list.element", "")
+        statistics.setdefault(short, column.statistics)
+
+    for conjunction in filter:
+        for column, op, value in conjunction:
+            if column not in statistics:
+                raise ak._errors.wrap_error(
+                    ValueError(
+                        f"filter column {column!r} not found; Parquet columns are: "
+                        + ", ".join(repr(x) for x in statistics)
+                    )
+                )
+            stats = statistics[column]
+            if stats is None or not stats.has_min_max:
+                continue
+            try:
+                excluded = _excluded(stats.min, stats.max, op, value)
+            except TypeError as err:
+                raise ak._errors.wrap_error(
+                    ValueError(
+                        f"filter value {value!r} cannot be compared with the "
+                        f"statistics of column {column!r} (min {stats.min!r}, "
+                        f"max {stats.max!r})"
+                    )
+                ) from err
+            if excluded:
+                break
+        else:
+            return True
+
+    return False
+
+
+def _excluded(minimum, maximum, op, value):
+    if op in ("==", "="):
+        return value < minimum or maximum < value
+    elif op == "!=":
+        return minimum == maximum == value
+    elif op == "<":
+        return minimum >= value
+    elif op == "<=":
+        return minimum > value
+    elif op == ">":
+        return maximum <= value
+    elif op == ">=":
+        return maximum < value
+    elif op == "in":
+        return all(x < minimum or maximum < x for x in value)
+    else:
+        return minimum == maximum and minimum in value
+
+
+_default_metadata_cache = ak._util.LRUCache(1024)
+
+
+def _regularize_metadata_cache(metadata_cache):
+    if metadata_cache is None or metadata_cache is False:
+        return None
+    elif metadata_cache is True:
+        return _default_metadata_cache
+    elif isinstance(metadata_cache, collections.abc.MutableMapping):
+        return metadata_cache
+    else:
+        raise ak._errors.wrap_error(
+            TypeError(
+                "metadata_cache must be None, True, or a MutableMapping (such as a "
+                f"dict), not {metadata_cache!r}"
+            )
+        )
+
+
+def _file_stamp(fs, path):
+    """Identifies a version of a file or directory: (type, size, modification)"""
+    try:
+        info = fs.info(path)
+    except FileNotFoundError:
+        return None
+    for name in ("mtime", "LastModified", "last_modified", "updated", "ETag", "etag"):
+        if info.get(name) is not None:
+            modified = info[name]
+            break
+    else:
+        modified = None
+    return (info.get("type"), info.get("size"), str(modified))
+
+
+def _cached(cache, key, generate):
+    try:
+        return cache[key]
+    except KeyError:
+        out = generate()
+        cache[key] = out
+        return out
+
+
+def _read_footers(
+    fs, all_paths, path_for_schema, can_sub, scan_files, pyarrow_parquet, metadata_cache
+):
+    """Returns the FileMetaData of the dataset (with all files' row groups, if
+    `scan_files`) and its Arrow schema"""
+    metadata, schema_arrow = _read_footer(
+        fs, path_for_schema, pyarrow_parquet, metadata_cache, with_schema=True
+    )
+
+    if scan_files and not path_for_schema.endswith("/_metadata"):
+        if path_for_schema in all_paths:
+            scan_paths = all_paths[1:]
+        else:
+            scan_paths = all_paths
+        if metadata_cache is not None and len(scan_paths) != 0:
+            # appending row groups below must not modify the cached footer
+            metadata = pickle.loads(pickle.dumps(metadata))
+        for apath in scan_paths:
+            md = _read_footer(fs, apath, pyarrow_parquet, metadata_cache)
+            # TODO: not nested directory structure yet
+            md.set_file_path(apath.rsplit("/", 1)[-1])
+            metadata.append_row_groups(md)
+
+    return metadata, schema_arrow
+
+
+def _read_footer(fs, path, pyarrow_parquet, metadata_cache, with_schema=False):
+    """Returns the FileMetaData of one file (and its Arrow schema if `with_schema`)"""
+
+    def read():
+        with fs.open(path, "rb") as file:
+            parquetfile = pyarrow_parquet.ParquetFile(file)
+            if with_schema:
+                return parquetfile.metadata, parquetfile.schema_arrow
+            return parquetfile.metadata
+
+    if metadata_cache is None:
+        return read()
+
+    key = ("footer", fs.unstrip_protocol(path), _file_stamp(fs, path), with_schema)
+    return _cached(metadata_cache, key, read)
+
+
 class _DictOfEmptyBuffers:
     def __getitem__(self, where):
         return b"\x00\x00\x00\x00\x00\x00\x00\x00"
@@ -319,6 +937,7 @@ class _DictOfEmptyBuffers:
 
 def _all_and_metadata_paths(path, fs, paths, ignore_metadata=False, scan_files=True):
     all_paths = []
+    nested = False
     for x in paths:
         if fs.isfile(x):
             is_meta = x.rsplit("/", 1)[-1] == "_metadata"
@@ -329,7 +948,9 @@ def _all_and_metadata_paths(path, fs, paths, ignore_metadata=False, scan_files=T
                 continue
             all_paths.append((x, is_meta, is_comm))
         elif fs.isdir(x):
-            for f, fdata in fs.find(x, detail=True).items():
+            for f, fdata in fs.find(x, withdirs=True, detail=True).items():
+                if fdata["type"] == "directory" and f.rstrip("/") != x.rstrip("/"):
+                    nested = True
                 is_meta = f.endswith("_metadata")
                 if is_meta and ignore_metadata:
                     continue
@@ -361,4 +982,4 @@ def _all_and_metadata_paths(path, fs, paths, ignore_metadata=False, scan_files=T
             ValueError(f"no *.parquet or *.parq matches for path {path!r}")
         )
 
-    return all_paths, path_for_metadata, can_sub
+    return all_paths, path_for_metadata, can_sub, nested
@@ -0,0 +1,83 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplikes.NumpyMetadata.instance()
+
+
+def iter_arrow(source, generate_bitmasks=False, highlevel=True, behavior=None):
+    """
+    Args:
+        source (`pyarrow.RecordBatchReader` or `pyarrow.Table`): Stream of Apache
+            Arrow record batches that share one schema, such as a query engine's
+            result or a dataset scanner.
+        generate_bitmasks (bool): If enabled and Arrow/Parquet does not have Awkward
+            metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
+            types that don't have bitmasks in the Arrow/Parquet data, so that the
+            Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.contents.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Iterates over the record batches of `source`, yielding each one (if it is not
+    empty) as an Awkward Array, without concatenating them:
+
+        >>> for array in ak.iter_arrow(reader):
+        ...     process(array)
+
+    The schema is interpreted once, before iteration begins, so each batch is
+    only wrapped as Awkward buffers, without copying wherever the Awkward and Arrow
+    layouts agree. Only one batch needs to be in memory at a time, if the source
+    produces them one at a time.
+
+    See also #ak.from_arrow, #ak.iter_parquet.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.iter_arrow",
+        dict(
+            source=source,
+            generate_bitmasks=generate_bitmasks,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        import awkward._connect.pyarrow
+
+        pyarrow = awkward._connect.pyarrow.import_pyarrow("ak.iter_arrow")
+
+        if isinstance(source, pyarrow.lib.Table):
+            batches = source.to_batches()
+        elif isinstance(source, pyarrow.lib.RecordBatchReader):
+            batches = source
+        else:
+            raise ak._errors.wrap_error(
+                TypeError(
+                    "source must be a pyarrow.RecordBatchReader or pyarrow.Table, "
+                    f"not {type(source)}"
+                )
+            )
+
+        plan = awkward._connect.pyarrow.record_batch_plan(
+            source.schema, pass_empty_field=True
+        )
+
+    return _impl(batches, plan, generate_bitmasks, highlevel, behavior)
+
+
+def _impl(batches, plan, generate_bitmasks, highlevel, behavior):
+    import awkward._connect.pyarrow
+
+    for batch in batches:
+        if len(batch) == 0:
+            continue
+
+        with ak._errors.OperationErrorContext(
+            "ak.iter_arrow",
+            dict(batch=batch, generate_bitmasks=generate_bitmasks),
+        ):
+            out = awkward._connect.pyarrow.handle_record_batch(
+                batch, plan, generate_bitmasks
+            )
+
+        yield ak._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,136 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplikes.NumpyMetadata.instance()
+
+
+def iter_avro_file(
+    file,
+    step_blocks=64,
+    start_block=0,
+    limit_entries=None,
+    columns=None,
+    debug_forth=False,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        file (string or fileobject): Avro file to be read as Awkward Arrays.
+        step_blocks (int): Number of Avro blocks in each array (the last array may
+            have fewer).
+        start_block (int): Number of Avro blocks to skip at the beginning of the
+            file. Skipped blocks are not read or decompressed.
+        limit_entries (None or int): If not None, the maximum number of rows to
+            read, in total, after the skipped blocks.
+        columns (None, str, or list of str): Names of the fields to read, as in
+            #ak.from_avro_file.
+        debug_forth (bool): If True, prints the generated Forth code for debugging.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.contents.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Iterates over an Avro file, yielding one array for every `step_blocks`
+    blocks, without concatenating them:
+
+        >>> for array in ak.iter_avro_file("export.avro", step_blocks=100):
+        ...     process(array)
+
+    The Avro schema is interpreted and its AwkwardForth code compiled once,
+    before the first array is read, and the same machine decodes all of the
+    blocks. Only the blocks of one array are in memory at a time, so files of
+    any size can be processed in a loop. The number of rows in a block is
+    chosen by the writer of the file (see `block_size` in #ak.to_avro_file).
+
+    See also #ak.from_avro_file.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.iter_avro_file",
+        dict(
+            file=file,
+            step_blocks=step_blocks,
+            start_block=start_block,
+            limit_entries=limit_entries,
+            columns=columns,
+            debug_forth=debug_forth,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        if not (ak._util.is_integer(step_blocks) and step_blocks > 0):
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"step_blocks must be a positive integer, not {step_blocks!r}"
+                )
+            )
+        if not (ak._util.is_integer(start_block) and start_block >= 0):
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"start_block must be a non-negative integer, not {start_block!r}"
+                )
+            )
+
+        is_path, file = ak._util.regularize_path(file)
+        if not (is_path or isinstance(file, str) or hasattr(file, "read")):
+            raise ak._errors.wrap_error(
+                TypeError("the fileobject provided is not of the correct type.")
+            )
+
+    return _impl(
+        file,
+        step_blocks,
+        start_block,
+        limit_entries,
+        columns,
+        debug_forth,
+        highlevel,
+        behavior,
+    )
+
+
+def _impl(
+    file,
+    step_blocks,
+    start_block,
+    limit_entries,
+    columns,
+    debug_forth,
+    highlevel,
+    behavior,
+):
+    if isinstance(file, str):
+        with open(file, "rb") as opened_file:
+            yield from _impl(
+                opened_file,
+                step_blocks,
+                start_block,
+                limit_entries,
+                columns,
+                debug_forth,
+                highlevel,
+                behavior,
+            )
+        return
+
+    import awkward._connect.avro
+
+    with ak._errors.OperationErrorContext(
+        "ak.iter_avro_file",
+        dict(file=file, columns=columns),
+    ):
+        contents = awkward._connect.avro.ReadAvroFT(
+            file,
+            limit_entries,
+            debug_forth,
+            None,
+            columns,
+            step_blocks,
+            start_block,
+        ).outcontents
+
+    for form, length, container in contents:
+        yield ak.operations.ak_from_avro_file._impl(
+            form, length, container, highlevel, behavior
+        )
@@ -0,0 +1,208 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import json
+
+import awkward as ak
+
+np = ak.nplikes.NumpyMetadata.instance()
+
+
+def iter_json(
+    source,
+    step_size=None,
+    step_bytes=64 * 1024 * 1024,
+    schema=None,
+    nan_string=None,
+    posinf_string=None,
+    neginf_string=None,
+    complex_record_fields=None,
+    buffersize=65536,
+    initial=1024,
+    resize=1.5,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        source (bytes/str, pathlib.Path, or file-like object): Data source of the
+            line-delimited JSON, as in #ak.from_json.
+        step_size (None or int): If an integer, each array has at most this many
+            lines (JSON documents).
+        step_bytes (None or int): If an integer, each array is parsed from at most
+            this many bytes of the source, unless a single line is longer than
+            that, in which case it is parsed by itself.
+        schema (None, "infer", JSON str or equivalent lists/dicts): As in
+            #ak.from_json, applied to each array separately.
+        nan_string (None or str): If not None, strings with this value will be
+            interpreted as floating-point NaN values.
+        posinf_string (None or str): If not None, strings with this value will
+            be interpreted as floating-point positive infinity values.
+        neginf_string (None or str): If not None, strings with this value
+            will be interpreted as floating-point negative infinity values.
+        complex_record_fields (None or (str, str)): If not None, defines a pair of
+            field names to interpret 2-field records as complex numbers.
+        buffersize (int): Number of bytes in each read from source.
+        initial (int): Initial size (in bytes) of buffers used by the
+            [ak::ArrayBuilder](_static/classawkward_1_1ArrayBuilder.html).
+        resize (float): Resize multiplier for buffers used by the
+            [ak::ArrayBuilder](_static/classawkward_1_1ArrayBuilder.html);
+            should be strictly greater than 1.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.contents.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Iterates over line-delimited JSON ([JSON Lines](https://jsonlines.org/)),
+    yielding one array for every `step_size` lines or `step_bytes` bytes of
+    the source, whichever comes first:
+
+        >>> for array in ak.iter_json(pathlib.Path("log.jsonl"), step_size=100000):
+        ...     process(array)
+
+    The source is read `buffersize` bytes at a time and split at `"\\n"`
+    characters, so newlines must only appear between JSON documents. Only the
+    lines of one array are held in memory at a time, so sources of unbounded
+    size, such as an ever-growing log or a network stream, can be processed in
+    a loop. At least one of `step_size` and `step_bytes` must be an integer.
+
+    Each array's type is discovered (or inferred) independently, so if the data
+    are not uniform, arrays may have different types; pass a JSONSchema as
+    `schema` to ensure that they all have the same type. Empty arrays (such as
+    a chunk of blank lines) are not yielded.
+
+    See also #ak.from_json.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.iter_json",
+        dict(
+            source=source,
+            step_size=step_size,
+            step_bytes=step_bytes,
+            schema=schema,
+            nan_string=nan_string,
+            posinf_string=posinf_string,
+            neginf_string=neginf_string,
+            complex_record_fields=complex_record_fields,
+            buffersize=buffersize,
+            initial=initial,
+            resize=resize,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        for name, value in [("step_size", step_size), ("step_bytes", step_bytes)]:
+            if value is not None and not (ak._util.is_integer(value) and value > 0):
+                raise ak._errors.wrap_error(
+                    ValueError(
+                        f"{name} must be None or a positive integer, not {value!r}"
+                    )
+                )
+        if step_size is None and step_bytes is None:
+            raise ak._errors.wrap_error(
+                ValueError("step_size and step_bytes can't both be None")
+            )
+
+        if isinstance(schema, (bytes, str)) and schema != "infer":
+            schema = json.loads(schema)
+
+    return _impl(
+        source,
+        step_size,
+        step_bytes,
+        schema,
+        nan_string,
+        posinf_string,
+        neginf_string,
+        complex_record_fields,
+        buffersize,
+        initial,
+        resize,
+        highlevel,
+        behavior,
+    )
+
+
+def _impl(
+    source,
+    step_size,
+    step_bytes,
+    schema,
+    nan_string,
+    posinf_string,
+    neginf_string,
+    complex_record_fields,
+    buffersize,
+    initial,
+    resize,
+    highlevel,
+    behavior,
+):
+    with ak.operations.ak_from_json._get_reader(source)() as obj:
+        for chunk in _line_chunks(obj, buffersize, step_size, step_bytes):
+            with ak._errors.OperationErrorContext(
+                "ak.iter_json",
+                dict(source=source, schema=schema),
+            ):
+                out = ak.operations.ak_from_json._impl(
+                    chunk,
+                    True,
+                    schema,
+                    nan_string,
+                    posinf_string,
+                    neginf_string,
+                    complex_record_fields,
+                    buffersize,
+                    initial,
+                    resize,
+                    None,
+                    False,
+                    None,
+                )
+
+            if out.length != 0:
+                yield ak._util.wrap(out, behavior, highlevel)
+
+
+def _line_chunks(obj, buffersize, step_size, step_bytes):
+    buffer = bytearray()
+    scanned = 0  # position up to which buffer has been searched for newlines
+    complete = 0  # position after the last newline that was found
+    num_lines = 0  # number of newlines in buffer[:complete]
+
+    while True:
+        block = obj.read(buffersize)
+        if len(block) == 0:
+            break
+        buffer += block
+
+        while True:
+            newline = buffer.find(b"\n", scanned)
+            if newline == -1:
+                scanned = len(buffer)
+                break
+            scanned = newline + 1
+
+            if step_bytes is not None and scanned > step_bytes and complete != 0:
+                # the line that ends here doesn't fit: it starts the next chunk
+                yield bytes(buffer[:complete])
+                del buffer[:complete]
+                scanned -= complete
+                complete = num_lines = 0
+
+            complete = scanned
+            num_lines += 1
+
+            if (step_size is not None and num_lines == step_size) or (
+                step_bytes is not None and complete >= step_bytes
+            ):
+                yield bytes(buffer[:complete])
+                del buffer[:complete]
+                scanned -= complete
+                complete = num_lines = 0
+
+    # the last line might not end with a newline
+    if step_bytes is not None and len(buffer) > step_bytes and complete != 0:
+        yield bytes(buffer[:complete])
+        del buffer[:complete]
+    if len(buffer) != 0:
+        yield bytes(buffer)
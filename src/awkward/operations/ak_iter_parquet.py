@@ -0,0 +1,231 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+
+def iter_parquet(
+    path,
+    columns=None,
+    row_groups=None,
+    filter=None,
+    step_size=None,
+    storage_options=None,
+    max_gap=64_000,
+    max_block=256_000_000,
+    footer_sample_size=1_000_000,
+    generate_bitmasks=False,
+    metadata_cache=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        path (str): Local filename or remote URL, passed to fsspec for resolution.
+            May contain glob patterns.
+        columns (None, str, or list of str): Glob pattern(s) with bash-like curly
+            brackets for matching column names. Nested records are separated by dots.
+            If a list of patterns, the logical-or is matched. If None, all columns
+            are read.
+        row_groups (None or set of int): Row groups to read; must be non-negative.
+            Order is ignored: the output arrays are presented in the order specified
+            by Parquet metadata. If None, all row groups/all rows are read.
+        filter (None, list of tuples, or list of lists of tuples): Predicate on
+            the Parquet column statistics that skips row groups in which no row
+            can match; see #ak.from_parquet.
+        step_size (None or int): If None, one array is yielded per (non-empty) row
+            group. If an integer, arrays of exactly `step_size` rows are yielded,
+            crossing row group and file boundaries as needed; only the last array
+            may be shorter.
+        storage_options: Passed to `fsspec.parquet.open_parquet_file`.
+        max_gap (int): Passed to `fsspec.parquet.open_parquet_file`.
+        max_block (int): Passed to `fsspec.parquet.open_parquet_file`.
+        footer_sample_size (int): Passed to `fsspec.parquet.open_parquet_file`.
+        generate_bitmasks (bool): If enabled and Arrow/Parquet does not have Awkward
+            metadata, `generate_bitmasks=True` creates empty bitmasks for nullable
+            types that don't have bitmasks in the Arrow/Parquet data, so that the
+            Form (BitMaskedForm vs UnmaskedForm) is predictable.
+        metadata_cache (None, True, or MutableMapping): Reuses directory
+            listings and Parquet footers across calls; see #ak.from_parquet.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.contents.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Iterates over a local or remote Parquet file or collection of files, yielding
+    one array at a time.
+
+    Only one row group (or `step_size` rows) is held in memory at a time, so
+    datasets much larger than the available memory can be processed in a loop:
+
+        >>> for array in ak.iter_parquet("dataset/", columns=["x", "y"], step_size=100000):
+        ...     process(array)
+
+    The file listing, schema, and column selection are resolved once, before
+    iteration begins, so errors in `path`, `columns`, or `row_groups` are raised
+    when this function is called, not when the first array is requested.
+
+    See also #ak.from_parquet, #ak.metadata_from_parquet.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.iter_parquet",
+        dict(
+            path=path,
+            columns=columns,
+            row_groups=row_groups,
+            filter=filter,
+            step_size=step_size,
+            storage_options=storage_options,
+            max_gap=max_gap,
+            max_block=max_block,
+            footer_sample_size=footer_sample_size,
+            generate_bitmasks=generate_bitmasks,
+            metadata_cache=metadata_cache,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        import awkward._connect.pyarrow  # noqa: F401
+
+        if step_size is not None and not (
+            ak._util.is_integer(step_size) and step_size > 0
+        ):
+            raise ak._errors.wrap_error(
+                ValueError(
+                    f"step_size must be None or a positive integer, not {step_size!r}"
+                )
+            )
+
+        (
+            parquet_columns,
+            subform,
+            actual_paths,
+            fs,
+            subrg,
+            row_counts,
+            meta,
+        ) = ak.operations.ak_from_parquet.metadata(
+            path,
+            storage_options,
+            row_groups,
+            columns,
+            filter=filter,
+            metadata_cache=metadata_cache,
+        )
+
+    return _impl(
+        actual_paths,
+        parquet_columns if columns is not None else None,
+        subrg,
+        step_size,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        generate_bitmasks,
+        highlevel,
+        behavior,
+        fs,
+    )
+
+
+def _impl(
+    actual_paths,
+    parquet_columns,
+    subrg,
+    step_size,
+    max_gap,
+    max_block,
+    footer_sample_size,
+    generate_bitmasks,
+    highlevel,
+    behavior,
+    fs,
+):
+    def convert(arrow_table, highlevel):
+        return ak.operations.ak_from_arrow._impl(
+            arrow_table, generate_bitmasks, highlevel, behavior
+        )
+
+    tables = (
+        table
+        for i, p in enumerate(actual_paths)
+        for table in _iter_parquet_file(
+            p,
+            fs,
+            parquet_columns,
+            subrg[i],
+            step_size,
+            max_gap,
+            max_block,
+            footer_sample_size,
+        )
+        if len(table) > 0
+    )
+
+    if step_size is None:
+        for table in tables:
+            yield convert(table, highlevel)
+
+    else:
+        # batches don't cross row group boundaries, so they are regrouped here;
+        # Arrow can't concatenate extension types, so pieces are converted first
+        pending, num_pending = [], 0
+        for table in tables:
+            while len(table) > 0:
+                take = min(step_size - num_pending, len(table))
+                pending.append(convert(table.slice(0, take), False))
+                num_pending += take
+                table = table.slice(take)
+                if num_pending == step_size:
+                    yield _merge(pending, highlevel, behavior)
+                    pending, num_pending = [], 0
+
+        if num_pending > 0:
+            yield _merge(pending, highlevel, behavior)
+
+
+def _merge(layouts, highlevel, behavior):
+    if len(layouts) == 1:
+        return ak._util.wrap(layouts[0], behavior, highlevel)
+    else:
+        return ak.operations.ak_concatenate._impl(
+            layouts, 0, True, True, highlevel, behavior
+        )
+
+
+def _iter_parquet_file(
+    path,
+    fs,
+    parquet_columns,
+    row_groups,
+    step_size,
+    max_gap,
+    max_block,
+    footer_sample_size,
+):
+    import pyarrow
+    import pyarrow.parquet as pyarrow_parquet
+
+    with ak.operations.ak_from_parquet._open_file(
+        path,
+        fs,
+        parquet_columns,
+        row_groups,
+        max_gap,
+        max_block,
+        footer_sample_size,
+        None,
+    ) as file:
+        parquetfile = pyarrow_parquet.ParquetFile(file)
+
+        if row_groups is None:
+            row_groups = list(range(parquetfile.num_row_groups))
+
+        if step_size is None:
+            for row_group in row_groups:
+                yield parquetfile.read_row_group(row_group, parquet_columns)
+
+        else:
+            for batch in parquetfile.iter_batches(
+                batch_size=step_size, row_groups=row_groups, columns=parquet_columns
+            ):
+                yield pyarrow.Table.from_batches([batch])
@@ -14,7 +14,12 @@ ParquetMetadata = collections.namedtuple(
 
 
 def metadata_from_parquet(
-    path, storage_options=None, row_groups=None, ignore_metadata=False, scan_files=True
+    path,
+    storage_options=None,
+    row_groups=None,
+    ignore_metadata=False,
+    scan_files=True,
+    metadata_cache=None,
 ):
     """
     This function differs from ak.from_parquet._metadata as follows:
@@ -29,6 +34,8 @@ def metadata_from_parquet(
             May contain glob patterns. A list of paths is also allowed, but they
             must be data files, not directories.
         storage_options: Passed to `fsspec`.
+        metadata_cache (None, True, or MutableMapping): Reuses directory
+            listings and Parquet footers across calls; see #ak.from_parquet.
 
     Returns dict containing
 
@@ -50,6 +57,7 @@ def metadata_from_parquet(
         dict(
             path=path,
             storage_options=storage_options,
+            metadata_cache=metadata_cache,
         ),
     ):
         return _impl(
@@ -58,14 +66,26 @@ def metadata_from_parquet(
             row_groups=row_groups,
             ignore_metadata=ignore_metadata,
             scan_files=scan_files,
+            metadata_cache=metadata_cache,
         )
 
 
 def _impl(
-    path, storage_options, row_groups=None, ignore_metadata=False, scan_files=True
+    path,
+    storage_options,
+    row_groups=None,
+    ignore_metadata=False,
+    scan_files=True,
+    metadata_cache=None,
 ):
     results = ak.operations.ak_from_parquet.metadata(
-        path, storage_options, row_groups, None, ignore_metadata, scan_files
+        path,
+        storage_options,
+        row_groups,
+        None,
+        ignore_metadata,
+        scan_files,
+        metadata_cache=metadata_cache,
     )
     parquet_columns, subform, actual_paths, fs, subrg, col_counts, metadata = results
 
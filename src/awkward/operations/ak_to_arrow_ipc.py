@@ -0,0 +1,143 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplikes.NumpyMetadata.instance()
+
+
+def to_arrow_ipc(
+    array,
+    destination,
+    format="file",
+    compression=None,
+    max_batch_size=None,
+    list_to32=False,
+    string_to32=False,
+    bytestring_to32=False,
+    emptyarray_to=None,
+    categorical_as_dictionary=False,
+    extensionarray=True,
+    count_nulls=True,
+):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        destination (str, pathlib.Path, or file-like object): Local filename or
+            writable binary file object.
+        format ("file" or "stream"): The IPC "file" format (also known as Feather
+            version 2), which can be memory-mapped and randomly accessed by
+            #ak.from_arrow_ipc, or the "stream" format, which can be written to
+            and read from non-seekable streams.
+        compression (None, "lz4", or "zstd"): Compression of the Arrow buffers.
+            Compressed data have to be decompressed into memory when read, so
+            they cannot be used without copying from a memory-mapped file.
+        max_batch_size (None or int): If not None, the data are written as
+            record batches of at most this many rows; otherwise, as a single
+            record batch.
+        list_to32 (bool): See #ak.to_arrow_table.
+        string_to32 (bool): See #ak.to_arrow_table.
+        bytestring_to32 (bool): See #ak.to_arrow_table.
+        emptyarray_to (None or dtype): See #ak.to_arrow_table.
+        categorical_as_dictionary (bool): See #ak.to_arrow_table.
+        extensionarray (bool): See #ak.to_arrow_table.
+        count_nulls (bool): See #ak.to_arrow_table.
+
+    Writes an Awkward Array to an Arrow IPC file or stream.
+
+    See also #ak.from_arrow_ipc, #ak.to_arrow_table, #ak.to_parquet.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.to_arrow_ipc",
+        dict(
+            array=array,
+            destination=destination,
+            format=format,
+            compression=compression,
+            max_batch_size=max_batch_size,
+            list_to32=list_to32,
+            string_to32=string_to32,
+            bytestring_to32=bytestring_to32,
+            emptyarray_to=emptyarray_to,
+            categorical_as_dictionary=categorical_as_dictionary,
+            extensionarray=extensionarray,
+            count_nulls=count_nulls,
+        ),
+    ):
+        return _impl(
+            array,
+            destination,
+            format,
+            compression,
+            max_batch_size,
+            list_to32,
+            string_to32,
+            bytestring_to32,
+            emptyarray_to,
+            categorical_as_dictionary,
+            extensionarray,
+            count_nulls,
+        )
+
+
+def _impl(
+    array,
+    destination,
+    format,
+    compression,
+    max_batch_size,
+    list_to32,
+    string_to32,
+    bytestring_to32,
+    emptyarray_to,
+    categorical_as_dictionary,
+    extensionarray,
+    count_nulls,
+):
+    import awkward._connect.pyarrow
+
+    # early exit if missing deps
+    awkward._connect.pyarrow.import_pyarrow("ak.to_arrow_ipc")
+    import pyarrow
+    import pyarrow.ipc
+
+    if format not in ("file", "stream"):
+        raise ak._errors.wrap_error(
+            ValueError(f"format must be 'file' or 'stream', not {format!r}")
+        )
+    if max_batch_size is not None and not (
+        ak._util.is_integer(max_batch_size) and max_batch_size > 0
+    ):
+        raise ak._errors.wrap_error(
+            ValueError(
+                f"max_batch_size must be None or a positive integer, not {max_batch_size!r}"
+            )
+        )
+
+    table = ak.operations.ak_to_arrow_table._impl(
+        array,
+        list_to32,
+        string_to32,
+        bytestring_to32,
+        emptyarray_to,
+        categorical_as_dictionary,
+        extensionarray,
+        count_nulls,
+    )
+    options = pyarrow.ipc.IpcWriteOptions(compression=compression)
+
+    is_path, destination = ak._util.regularize_path(destination)
+    if is_path or isinstance(destination, str):
+        sink = pyarrow.OSFile(destination, "w")
+    else:
+        sink = destination
+
+    try:
+        if format == "file":
+            writer = pyarrow.ipc.new_file(sink, table.schema, options=options)
+        else:
+            writer = pyarrow.ipc.new_stream(sink, table.schema, options=options)
+        with writer:
+            writer.write_table(table, max_chunksize=max_batch_size)
+    finally:
+        if sink is not destination:
+            sink.close()
@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplikes.NumpyMetadata.instance()
+
+
+def to_avro_file(array, file, codec="null", block_size=64 * 1024):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        file (str, pathlib.Path, or file-like object): Local filename or writable
+            binary file object.
+        codec ("null", "deflate", "bzip2", "xz", "zstandard", or "snappy"):
+            Compression of the Avro blocks; "null" is no compression. The
+            "zstandard" codec requires the zstandard package and "snappy" requires
+            python-snappy.
+        block_size (int): Maximum number of bytes in each Avro block, before
+            compression. Entries are not split across blocks, so a block is
+            larger than this if a single entry is.
+
+    Writes an Awkward Array to an Avro object container file, which can be read
+    by #ak.from_avro_file (and other Avro libraries).
+
+    The Avro schema is derived from the array's type:
+
+    * booleans are "boolean", integers of up to 32 bits are "int", larger
+      integers are "long", and floating-point numbers are "float" or "double";
+    * strings are "string", bytestrings are "bytes", and regular bytestrings
+      are "fixed";
+    * other lists are "array" (regular dimensions are not preserved);
+    * records are "record", named by their `"__record__"` parameter (if it is
+      a valid name) or "Record"; the fields of tuples are named `"0"`, `"1"`...
+    * missing values are a union with "null" and unions are Avro unions;
+      "null" is the first type of an option, but the last type of an option of
+      a union;
+    * categorical data are written as their (projected) values.
+
+    Complex numbers, dates, and times are not supported. The data are encoded
+    directly from the array's buffers, without converting them into Python
+    objects.
+
+    See also #ak.from_avro_file, #ak.iter_avro_file.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.to_avro_file",
+        dict(array=array, file=file, codec=codec, block_size=block_size),
+    ):
+        return _impl(array, file, codec, block_size)
+
+
+def _impl(array, file, codec, block_size):
+    import awkward._connect.avro
+
+    if not (ak._util.is_integer(block_size) and block_size > 0):
+        raise ak._errors.wrap_error(
+            ValueError(f"block_size must be a positive integer, not {block_size!r}")
+        )
+
+    layout = ak.operations.to_layout(array, allow_record=False, allow_other=False)
+    layout = layout.to_backend("cpu")
+
+    writer = awkward._connect.avro.WriteAvro(layout.form, codec, block_size)
+
+    is_path, file = ak._util.regularize_path(file)
+    if is_path or isinstance(file, str):
+        with open(file, "wb") as opened_file:
+            writer.write(layout, opened_file.write)
+    elif hasattr(file, "write"):
+        writer.write(layout, file.write)
+    else:
+        raise ak._errors.wrap_error(
+            TypeError(
+                f"file must be a filename or a writable file object, not {type(file)}"
+            )
+        )
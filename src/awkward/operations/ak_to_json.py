@@ -1,7 +1,9 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 import json
+import math
 import pathlib
+from collections.abc import Iterable, Sized
 from numbers import Number
 from urllib.parse import urlparse
 
@@ -65,11 +67,19 @@ def to_json(
     Records) into JSON text. Returns bytes (encoded JSON) if `file` is None;
     otherwise, this function returns nothing and writes to a file.
 
-    This function converts the array into Python objects with #ak.to_list, performs
-    some conversions to make the data JSON serializable (`nan_string`,
-    `posinf_string`, `neginf_string`, `complex_record_fields`, `convert_bytes`,
-    `convert_other`), then uses `json.dumps` to return a string or `json.dump`
-    to write to a file (depending on the value of `file`).
+    Unless the JSON is indented (`num_indent_spaces`), the array has custom
+    behaviors that override `__getitem__`, or it has types that need
+    `convert_other`, this function writes JSON text directly from the array's
+    buffers, one node at a time, without creating Python lists and dicts.
+    Large arrays are written to `file` in chunks of rows, so the text of the
+    whole array is never held in memory.
+
+    Otherwise, this function converts the array into Python objects with
+    #ak.to_list, performs some conversions to make the data JSON serializable
+    (`nan_string`, `posinf_string`, `neginf_string`, `complex_record_fields`,
+    `convert_bytes`, `convert_other`), then uses `json.dumps` to return a string
+    or `json.dump` to write to a file (depending on the value of `file`). Both
+    ways produce the same JSON text.
 
     If `line_delimited` is True or a line-delimiter string like `"\r\n"`/`os.linesep`,
     the output is line-delimited JSON, variously referred to as "ldjson", "ndjson", and
@@ -182,14 +192,7 @@ def _impl(
             TypeError(f"unrecognized array type: {repr(array)}")
         )
 
-    jsondata = out.to_json(
-        nan_string=nan_string,
-        posinf_string=posinf_string,
-        neginf_string=neginf_string,
-        complex_record_fields=complex_record_fields,
-        convert_bytes=convert_bytes,
-        behavior=ak._util.behavior_of(array),
-    )
+    behavior = ak._util.behavior_of(array)
 
     if line_delimited and not isinstance(line_delimited, str):
         line_delimited = "\n"
@@ -218,6 +221,42 @@ def _impl(
             def opener():
                 return _NoContextManager(file)
 
+    complex_fields = _complex_fields(complex_record_fields)
+    if (
+        (line_delimited or num_indent_spaces is None)
+        and convert_other is None
+        and _is_writable(out.form, behavior, complex_fields, convert_bytes)
+    ):
+        writer = _Writer(
+            separators,
+            nan_string,
+            posinf_string,
+            neginf_string,
+            complex_fields,
+            convert_bytes,
+        )
+        is_record = isinstance(array, (ak.highlevel.Record, ak.record.Record))
+        try:
+            if file is None:
+                output = []
+                writer.write(out, line_delimited, is_record, output.append)
+                return "".join(output)
+            else:
+                with opener() as openfile:
+                    writer.write(out, line_delimited, is_record, openfile.write)
+                    return None
+        except Exception as err:
+            raise ak._errors.wrap_error(err) from err
+
+    jsondata = out.to_json(
+        nan_string=nan_string,
+        posinf_string=posinf_string,
+        neginf_string=neginf_string,
+        complex_record_fields=complex_record_fields,
+        convert_bytes=convert_bytes,
+        behavior=behavior,
+    )
+
     try:
         if line_delimited:
             if file is None:
@@ -300,3 +339,262 @@ class _NoContextManager:
 
     def __exit__(self, exception_type, exception_value, exception_traceback):
         pass
+
+
+def _complex_fields(complex_record_fields):
+    # same rules as Content.to_json: anything but a pair of strings is ignored
+    if (
+        isinstance(complex_record_fields, Sized)
+        and isinstance(complex_record_fields, Iterable)
+        and len(complex_record_fields) == 2
+        and isinstance(complex_record_fields[0], str)
+        and isinstance(complex_record_fields[1], str)
+    ):
+        return tuple(complex_record_fields)
+    else:
+        return None
+
+
+def _is_writable(form, behavior, complex_fields, convert_bytes):
+    """
+    Returns True if `_Writer` produces the same output as `Content.to_json`
+    followed by `json.dump` for arrays with this `form`: no custom `__getitem__`
+    behaviors and no values that need `convert_other`.
+    """
+    if isinstance(form, ak.forms.EmptyForm):
+        return True
+
+    array = form.parameter("__array__")
+    if array == "string":
+        return True
+    elif array == "bytestring":
+        return convert_bytes is not None
+    elif array in ("char", "byte"):
+        # not in a string or bytestring
+        return False
+
+    if isinstance(form, ak.forms.RecordForm):
+        getitem = ak._util.recordclass(form, behavior).__getitem__
+        base = ak.highlevel.Record.__getitem__
+    else:
+        getitem = ak._util.arrayclass(form, behavior).__getitem__
+        base = ak.highlevel.Array.__getitem__
+    if getitem is not base and not getattr(getitem, "ignore_in_to_list", False):
+        return False
+
+    if isinstance(form, ak.forms.NumpyForm):
+        kind = ak.types.numpytype.primitive_to_dtype(form.primitive).kind
+        return kind in "biuf" or (kind == "c" and complex_fields is not None)
+    elif isinstance(form, (ak.forms.RecordForm, ak.forms.UnionForm)):
+        return all(
+            _is_writable(x, behavior, complex_fields, convert_bytes)
+            for x in form.contents
+        )
+    else:
+        return _is_writable(form.content, behavior, complex_fields, convert_bytes)
+
+
+class _Writer:
+    """
+    Writes JSON directly from a layout's buffers: each node is converted into
+    a list of JSON strings, one per element, from the leaves up, so that no
+    intermediate Python lists and dicts are created. The top-level array is
+    written in chunks of `rows_per_chunk` elements.
+    """
+
+    rows_per_chunk = 65536
+
+    def __init__(
+        self,
+        separators,
+        nan_string,
+        posinf_string,
+        neginf_string,
+        complex_fields,
+        convert_bytes,
+    ):
+        self.comma, self.colon = separators
+        self.nan_string = None if nan_string is None else self.dumps(nan_string)
+        self.posinf_string = (
+            None if posinf_string is None else self.dumps(posinf_string)
+        )
+        self.neginf_string = (
+            None if neginf_string is None else self.dumps(neginf_string)
+        )
+        self.complex_fields = complex_fields
+        self.convert_bytes = convert_bytes
+
+    def dumps(self, obj):
+        return json.dumps(
+            obj,
+            skipkeys=True,
+            ensure_ascii=True,
+            check_circular=False,
+            allow_nan=False,
+            indent=None,
+            separators=(self.comma, self.colon),
+            sort_keys=False,
+        )
+
+    def write(self, layout, line_delimited, is_record, write):
+        length = layout.length
+        if is_record and not line_delimited:
+            write(self.strings(layout)[0])
+            return
+
+        if not line_delimited:
+            write("[")
+        for start in range(0, length, self.rows_per_chunk):
+            stop = min(start + self.rows_per_chunk, length)
+            strings = self.strings(layout._getitem_range(slice(start, stop)))
+            if line_delimited:
+                strings.append("")
+                write(line_delimited.join(strings))
+            else:
+                if start != 0:
+                    write(self.comma)
+                write(self.comma.join(strings))
+        if not line_delimited:
+            write("]")
+
+    def strings(self, layout):
+        if isinstance(layout, ak.contents.EmptyArray):
+            return []
+
+        elif isinstance(layout, ak.contents.NumpyArray):
+            if len(layout.shape) != 1:
+                return self.strings(layout.toRegularArray())
+            return self.numbers(layout.raw(numpy))
+
+        elif isinstance(layout, (ak.contents.ListOffsetArray, ak.contents.ListArray)):
+            # a ListArray (such as a permuted or filtered one) can point anywhere
+            # in its content, so only the part that it refers to is kept
+            layout = layout.toListOffsetArray64(True)
+            offsets = layout.offsets.raw(numpy)
+            content = layout.content._getitem_range(slice(0, offsets[-1]))
+            return self.lists(
+                layout, content, offsets[:-1].tolist(), offsets[1:].tolist()
+            )
+
+        elif isinstance(layout, ak.contents.RegularArray):
+            size = layout.size
+            content = layout.content._getitem_range(slice(0, layout.length * size))
+            starts = [i * size for i in range(layout.length)]
+            stops = [x + size for x in starts]
+            return self.lists(layout, content, starts, stops)
+
+        elif isinstance(layout, ak.contents.RecordArray):
+            fields = layout.fields
+            if layout.is_tuple:
+                fields = [str(i) for i in range(len(layout.contents))]
+            contents = [
+                self.strings(layout.content(i)._getitem_range(slice(0, layout.length)))
+                for i in range(len(fields))
+            ]
+            if len(contents) == 0:
+                return ["{}"] * layout.length
+            keys = [self.dumps(x) + self.colon for x in fields]
+            comma = self.comma
+            return [
+                "{" + comma.join([k + v for k, v in zip(keys, values)]) + "}"
+                for values in zip(*contents)
+            ]
+
+        elif isinstance(layout, ak.contents.IndexedOptionArray):
+            index = layout.index.raw(numpy)
+            valid = index >= 0
+            content = layout.content._carry(ak.index.Index64(index[valid]), False)
+            return self.missing(valid, self.strings(content))
+
+        elif isinstance(layout, ak.contents.IndexedArray):
+            return self.strings(layout.project())
+
+        elif isinstance(
+            layout, (ak.contents.ByteMaskedArray, ak.contents.BitMaskedArray)
+        ):
+            valid = layout.mask_as_bool(valid_when=True, nplike=numpy)[: layout.length]
+            out = self.strings(layout.content._getitem_range(slice(0, layout.length)))
+            for i in numpy.nonzero(~valid)[0].tolist():
+                out[i] = "null"
+            return out
+
+        elif isinstance(layout, ak.contents.UnmaskedArray):
+            return self.strings(layout.content)
+
+        elif isinstance(layout, ak.contents.UnionArray):
+            tags = layout.tags.raw(numpy)
+            index = layout.index.raw(numpy)[: len(tags)]
+            out = [None] * len(tags)
+            for tag in range(len(layout.contents)):
+                where = numpy.nonzero(tags == tag)[0]
+                content = layout.content(tag)._carry(
+                    ak.index.Index64(index[where]), False
+                )
+                for i, x in zip(where.tolist(), self.strings(content)):
+                    out[i] = x
+            return out
+
+        else:
+            raise ak._errors.wrap_error(
+                AssertionError(f"unrecognized Content type: {type(layout)}")
+            )
+
+    def lists(self, layout, content, starts, stops):
+        array = layout.parameter("__array__")
+        if array in ("string", "bytestring"):
+            data = ak._util.tobytes(content.raw(numpy))
+            if array == "string":
+                encode = json.encoder.encode_basestring_ascii
+                return [
+                    encode(data[a:b].decode(errors="surrogateescape"))
+                    for a, b in zip(starts, stops)
+                ]
+            else:
+                convert, dumps = self.convert_bytes, self.dumps
+                return [dumps(convert(data[a:b])) for a, b in zip(starts, stops)]
+
+        strings = self.strings(content)
+        comma = self.comma
+        return ["[" + comma.join(strings[a:b]) + "]" for a, b in zip(starts, stops)]
+
+    def missing(self, valid, strings):
+        out = ["null"] * len(valid)
+        for i, x in zip(numpy.nonzero(valid)[0].tolist(), strings):
+            out[i] = x
+        return out
+
+    def numbers(self, data):
+        kind = data.dtype.kind
+        if kind == "b":
+            return numpy.where(data, "true", "false").tolist()
+
+        elif kind in "iu":
+            return list(map(str, data.tolist()))
+
+        elif kind == "c":
+            real_field, imag_field = self.complex_fields
+            keys = [self.dumps(x) + self.colon for x in (real_field, imag_field)]
+            comma = self.comma
+            return [
+                "{" + keys[0] + r + comma + keys[1] + i + "}"
+                for r, i in zip(self.numbers(data.real), self.numbers(data.imag))
+            ]
+
+        else:
+            out = list(map(float.__repr__, data.tolist()))
+            nonfinite = numpy.nonzero(~numpy.isfinite(data))[0]
+            for i in nonfinite.tolist():
+                value = float(data[i])
+                if math.isnan(value):
+                    replacement = self.nan_string
+                elif value > 0:
+                    replacement = self.posinf_string
+                else:
+                    replacement = self.neginf_string
+                if replacement is None:
+                    raise ValueError(
+                        "Out of range float values are not JSON compliant: "
+                        + repr(value)
+                    )
+                out[i] = replacement
+            return out
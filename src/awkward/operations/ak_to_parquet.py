@@ -71,8 +71,75 @@ def to_parquet(
     pyarrow_parquet = awkward._connect.pyarrow.import_pyarrow_parquet("ak.to_parquet")
     fsspec = awkward._connect.pyarrow.import_fsspec("ak.to_parquet")
 
+    layout, form, table = _layout_form_table(
+        data,
+        True,
+        list_to32,
+        string_to32,
+        bytestring_to32,
+        emptyarray_to,
+        categorical_as_dictionary,
+        extensionarray,
+        count_nulls,
+    )
+
+    options = _writer_options(
+        form,
+        table,
+        compression,
+        compression_level,
+        parquet_metadata_statistics,
+        parquet_dictionary_encoding,
+        parquet_byte_stream_split,
+        parquet_compliant_nested,
+    )
+
+    if parquet_extra_options is None:
+        parquet_extra_options = {}
+
+    fs, destination = fsspec.core.url_to_fs(destination, **(storage_options or {}))
+    metalist = []
+    with pyarrow_parquet.ParquetWriter(
+        destination,
+        table.schema,
+        filesystem=fs,
+        flavor=parquet_flavor,
+        version=parquet_version,
+        use_deprecated_int96_timestamps=parquet_old_int96_timestamps,
+        data_page_version=parquet_page_version,
+        use_compliant_nested_type=parquet_compliant_nested,
+        data_page_size=data_page_size,
+        coerce_timestamps=parquet_coerce_timestamps,
+        metadata_collector=metalist,
+        **options,
+        **parquet_extra_options,
+    ) as writer:
+        writer.write_table(table, row_group_size=row_group_size)
+        if hook_after_write is not None:
+            hook_after_write(
+                array=data,
+                layout=layout,
+                table=table,
+                writer=writer,
+            )
+    meta = metalist[0]
+    meta.set_file_path(destination.rsplit("/", 1)[-1])
+    return meta
+
+
+def _layout_form_table(
+    data,
+    allow_record,
+    list_to32,
+    string_to32,
+    bytestring_to32,
+    emptyarray_to,
+    categorical_as_dictionary,
+    extensionarray,
+    count_nulls,
+):
     layout = ak.operations.ak_to_layout.to_layout(
-        data, allow_record=True, allow_other=False
+        data, allow_record=allow_record, allow_other=False
     )
     table = ak.operations.ak_to_arrow_table._impl(
         layout,
@@ -85,6 +152,25 @@ def to_parquet(
         count_nulls,
     )
 
+    if isinstance(layout, ak.record.Record):
+        form = layout.array.form
+    else:
+        form = layout.form
+
+    return layout, form, table
+
+
+def _writer_options(
+    form,
+    table,
+    compression,
+    compression_level,
+    parquet_metadata_statistics,
+    parquet_dictionary_encoding,
+    parquet_byte_stream_split,
+    parquet_compliant_nested,
+):
+    """Resolves the per-column options into pyarrow.parquet.ParquetWriter arguments"""
     if parquet_compliant_nested:
         list_indicator = "list.element"
     else:
@@ -95,11 +181,6 @@ def to_parquet(
     else:
         column_prefix = ()
 
-    if isinstance(data, ak.Record):
-        form = layout.array.form
-    else:
-        form = layout.form
-
     def parquet_columns(specifier, only=None):
         if specifier is None:
             selected_form = form
@@ -182,41 +263,13 @@ def to_parquet(
             )
         parquet_byte_stream_split = [x for x, value in replacement.items() if value]
 
-    if parquet_extra_options is None:
-        parquet_extra_options = {}
-
-    fs, destination = fsspec.core.url_to_fs(destination, **(storage_options or {}))
-    metalist = []
-    with pyarrow_parquet.ParquetWriter(
-        destination,
-        table.schema,
-        filesystem=fs,
-        flavor=parquet_flavor,
-        version=parquet_version,
+    return dict(
         use_dictionary=parquet_dictionary_encoding,
         compression=compression,
         write_statistics=parquet_metadata_statistics,
-        use_deprecated_int96_timestamps=parquet_old_int96_timestamps,
         compression_level=compression_level,
         use_byte_stream_split=parquet_byte_stream_split,
-        data_page_version=parquet_page_version,
-        use_compliant_nested_type=parquet_compliant_nested,
-        data_page_size=data_page_size,
-        coerce_timestamps=parquet_coerce_timestamps,
-        metadata_collector=metalist,
-        **parquet_extra_options,
-    ) as writer:
-        writer.write_table(table, row_group_size=row_group_size)
-        if hook_after_write is not None:
-            hook_after_write(
-                array=data,
-                layout=layout,
-                table=table,
-                writer=writer,
-            )
-    meta = metalist[0]
-    meta.set_file_path(destination.rsplit("/", 1)[-1])
-    return meta
+    )
 
 
 def write_metadata(dir_path, fs, *metas, global_metadata=True):
@@ -230,3 +283,4 @@ def write_metadata(dir_path, fs, *metas, global_metadata=True):
             md.append_row_groups(meta)
         with fs.open("/".join([dir_path, "_metadata"]), "wb") as fil:
             md.write_metadata_file(fil)
+    return md
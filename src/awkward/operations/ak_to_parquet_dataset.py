@@ -0,0 +1,191 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplikes.NumpyMetadata.instance()
+numpy = ak.nplikes.Numpy.instance()
+
+
+def to_parquet_dataset(
+    data,
+    destination,
+    partition_by=None,
+    rows_per_file=None,
+    bytes_per_file=None,
+    executor=None,
+    parquet_options=None,
+    storage_options=None,
+):
+    """
+    Args:
+        data: ak.Array to write.
+        destination (str): Local directory or remote URL, passed to fsspec for
+            resolution. It is created if it does not exist.
+        partition_by (None or str): Name of a top-level field whose values split
+            the data into one subdirectory per distinct value, named
+            `{partition_by}={value}` (Hive style). The field must be convertible
+            by #ak.to_numpy (numbers or strings without missing values) and is
+            kept in the written data. If `data` is empty, there are no
+            partitions and a single empty file is written in `destination`.
+        rows_per_file (None or int): Maximum number of rows in each file. If None
+            (and `bytes_per_file` is None), each partition is one file.
+        bytes_per_file (None or int): Approximate maximum size of each file,
+            estimated from the in-memory (uncompressed) size of `data`. Cannot
+            be used together with `rows_per_file`.
+        executor (None, int, or `concurrent.futures.Executor`): If None, files
+            are written one after another. If an integer, up to that many files
+            are written concurrently in a thread pool. Any object with a `map`
+            method (such as a `concurrent.futures.Executor`) may also be passed.
+        parquet_options (None or dict): Options passed to #ak.to_parquet for each
+            file, such as `compression` or `row_group_size`.
+        storage_options: Passed to `fsspec`.
+
+    Writes an array as a dataset of Parquet files in a directory, along with the
+    `_common_metadata` and `_metadata` files that describe all of them, so that
+    #ak.from_parquet and #ak.metadata_from_parquet can select row groups without
+    opening every file.
+
+    Files are named `part-00000.parquet`, `part-00001.parquet`, etc. (within each
+    partition directory), in the order of the rows in `data`.
+
+    Returns the ``pyarrow._parquet.FileMetaData`` of the whole dataset, as written
+    to `_metadata`.
+
+    See also #ak.to_parquet, #ak.from_parquet.
+    """
+    with ak._errors.OperationErrorContext(
+        "ak.to_parquet_dataset",
+        dict(
+            data=data,
+            destination=destination,
+            partition_by=partition_by,
+            rows_per_file=rows_per_file,
+            bytes_per_file=bytes_per_file,
+            executor=executor,
+            parquet_options=parquet_options,
+            storage_options=storage_options,
+        ),
+    ):
+        return _impl(
+            data,
+            destination,
+            partition_by,
+            rows_per_file,
+            bytes_per_file,
+            executor,
+            parquet_options,
+            storage_options,
+        )
+
+
+def _impl(
+    data,
+    destination,
+    partition_by,
+    rows_per_file,
+    bytes_per_file,
+    executor,
+    parquet_options,
+    storage_options,
+):
+    import awkward._connect.pyarrow
+
+    fsspec = awkward._connect.pyarrow.import_fsspec("ak.to_parquet_dataset")
+
+    layout = ak.operations.to_layout(data, allow_record=False, allow_other=False)
+
+    if rows_per_file is not None and bytes_per_file is not None:
+        raise ak._errors.wrap_error(
+            ValueError("only one of rows_per_file and bytes_per_file may be given")
+        )
+    for name, value in [
+        ("rows_per_file", rows_per_file),
+        ("bytes_per_file", bytes_per_file),
+    ]:
+        if value is not None and not (ak._util.is_integer(value) and value > 0):
+            raise ak._errors.wrap_error(
+                ValueError(f"{name} must be None or a positive integer, not {value!r}")
+            )
+    if bytes_per_file is not None and layout.length != 0:
+        rows_per_file = max(1, (bytes_per_file * layout.length) // layout.nbytes)
+
+    if parquet_options is None:
+        parquet_options = {}
+
+    fs, root = fsspec.core.url_to_fs(destination, **(storage_options or {}))
+    root = root.rstrip("/")
+
+    if partition_by is None:
+        groups = [((), layout)]
+    else:
+        groups = _partitions(layout, partition_by)
+        if len(groups) == 0:
+            # no rows, so no partitions: write one empty file to keep the schema
+            groups = [((), layout)]
+
+    parts = []
+    for directories, group in groups:
+        if rows_per_file is None or group.length == 0:
+            chunks = [group]
+        else:
+            chunks = [
+                group[start : start + rows_per_file]
+                for start in range(0, group.length, rows_per_file)
+            ]
+        for i, chunk in enumerate(chunks):
+            parts.append(("/".join(directories + (f"part-{i:05d}.parquet",)), chunk))
+
+    for directories, _ in groups:
+        fs.makedirs("/".join((root,) + directories), exist_ok=True)
+
+    def write_one(part):
+        relative, chunk = part
+        meta = ak.operations.ak_to_parquet.to_parquet(
+            ak._util.wrap(chunk, highlevel=True),
+            fs.unstrip_protocol("/".join([root, relative])),
+            storage_options=storage_options,
+            **parquet_options,
+        )
+        # row groups are located relative to the _metadata file
+        meta.set_file_path(relative)
+        return meta
+
+    metas = ak._util.map_with_executor(executor, write_one, parts)
+
+    return ak.operations.ak_to_parquet.write_metadata(root, fs, *metas)
+
+
+def _partitions(layout, field):
+    if field not in layout.fields:
+        raise ak._errors.wrap_error(
+            ValueError(
+                f"partition_by field {field!r} is not one of the fields: {layout.fields}"
+            )
+        )
+
+    try:
+        values = ak.operations.to_numpy(layout[field], allow_missing=False)
+    except Exception as err:
+        raise ak._errors.wrap_error(
+            TypeError(
+                f"partition_by field {field!r} must contain numbers or strings "
+                "without missing values"
+            )
+        ) from err
+    if values.ndim != 1:
+        raise ak._errors.wrap_error(
+            TypeError(f"partition_by field {field!r} must not contain lists")
+        )
+
+    unique, inverse = numpy.unique(values, return_inverse=True)
+
+    out = []
+    for i, value in enumerate(unique):
+        directory = f"{field}={value}"
+        if "/" in directory:
+            raise ak._errors.wrap_error(
+                ValueError(f"partition directory name {directory!r} contains '/'")
+            )
+        index = ak.index.Index64(numpy.nonzero(inverse == i)[0].astype(np.int64))
+        out.append(((directory,), layout._carry(index, False)))
+    return out
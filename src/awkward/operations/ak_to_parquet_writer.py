@@ -0,0 +1,243 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+
+def to_parquet_writer(
+    destination,
+    list_to32=False,
+    string_to32=True,
+    bytestring_to32=True,
+    emptyarray_to=None,
+    categorical_as_dictionary=False,
+    extensionarray=True,
+    count_nulls=True,
+    compression="zstd",
+    compression_level=None,
+    row_group_size=64 * 1024 * 1024,
+    data_page_size=None,
+    parquet_flavor=None,
+    parquet_version="1.0",
+    parquet_page_version="1.0",
+    parquet_metadata_statistics=True,
+    parquet_dictionary_encoding=False,
+    parquet_byte_stream_split=False,
+    parquet_coerce_timestamps=None,
+    parquet_old_int96_timestamps=None,
+    parquet_compliant_nested=False,  # https://issues.apache.org/jira/browse/ARROW-16348
+    parquet_extra_options=None,
+    storage_options=None,
+):
+    """
+    Args:
+        destination (str): Local filename or remote URL, passed to fsspec for
+            resolution.
+
+    All other arguments have the same meaning as in #ak.to_parquet.
+
+    Returns a writer that appends arrays to one Parquet file, each call to its
+    `write` method adding (at least) one row group. This allows a file to be
+    produced from a stream of arrays without holding all of them in memory:
+
+        >>> with ak.to_parquet_writer("events.parquet") as writer:
+        ...     for chunk in stream_of_arrays:
+        ...         writer.write(chunk)
+        ...
+        >>> writer.metadata.num_row_groups
+
+    Every array must have the same type as the first one (more precisely, it
+    must convert into the same Arrow schema). Column-dependent options, such as
+    a `compression` dict, are resolved against the first array.
+
+    When the writer is closed (at the end of the `with` block, or by calling its
+    `close` method), the file footer is written and the writer's `metadata`
+    attribute is set to its ``pyarrow._parquet.FileMetaData``. If no arrays were
+    written, no file is created and `metadata` is None.
+
+    See also #ak.to_parquet, #ak.from_parquet.
+    """
+    import awkward._connect.pyarrow
+
+    awkward._connect.pyarrow.import_fsspec("ak.to_parquet_writer")
+
+    return ParquetWriter(
+        destination,
+        list_to32,
+        string_to32,
+        bytestring_to32,
+        emptyarray_to,
+        categorical_as_dictionary,
+        extensionarray,
+        count_nulls,
+        compression,
+        compression_level,
+        row_group_size,
+        data_page_size,
+        parquet_flavor,
+        parquet_version,
+        parquet_page_version,
+        parquet_metadata_statistics,
+        parquet_dictionary_encoding,
+        parquet_byte_stream_split,
+        parquet_coerce_timestamps,
+        parquet_old_int96_timestamps,
+        parquet_compliant_nested,
+        parquet_extra_options,
+        storage_options,
+    )
+
+
+class ParquetWriter:
+    """
+    Context manager returned by #ak.to_parquet_writer.
+    """
+
+    def __init__(
+        self,
+        destination,
+        list_to32,
+        string_to32,
+        bytestring_to32,
+        emptyarray_to,
+        categorical_as_dictionary,
+        extensionarray,
+        count_nulls,
+        compression,
+        compression_level,
+        row_group_size,
+        data_page_size,
+        parquet_flavor,
+        parquet_version,
+        parquet_page_version,
+        parquet_metadata_statistics,
+        parquet_dictionary_encoding,
+        parquet_byte_stream_split,
+        parquet_coerce_timestamps,
+        parquet_old_int96_timestamps,
+        parquet_compliant_nested,
+        parquet_extra_options,
+        storage_options,
+    ):
+        self._destination = destination
+        self._conversion = (
+            list_to32,
+            string_to32,
+            bytestring_to32,
+            emptyarray_to,
+            categorical_as_dictionary,
+            extensionarray,
+            count_nulls,
+        )
+        self._column_options = (
+            compression,
+            compression_level,
+            parquet_metadata_statistics,
+            parquet_dictionary_encoding,
+            parquet_byte_stream_split,
+            parquet_compliant_nested,
+        )
+        self._writer_options = dict(
+            flavor=parquet_flavor,
+            version=parquet_version,
+            use_deprecated_int96_timestamps=parquet_old_int96_timestamps,
+            data_page_version=parquet_page_version,
+            use_compliant_nested_type=parquet_compliant_nested,
+            data_page_size=data_page_size,
+            coerce_timestamps=parquet_coerce_timestamps,
+            **(parquet_extra_options or {}),
+        )
+        self._row_group_size = row_group_size
+        self._storage_options = storage_options
+
+        self._writer = None
+        self._path = None
+        self._metalist = []
+        self._closed = False
+        self.metadata = None
+
+    def __repr__(self):
+        return f"<ak.to_parquet_writer {self._destination!r}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def write(self, data):
+        """
+        Args:
+            data: ak.Array with the same type as the previously written arrays.
+
+        Converts `data` into Arrow and writes it as new row group(s).
+        """
+        with ak._errors.OperationErrorContext(
+            "ak.to_parquet_writer.write",
+            dict(data=data),
+        ):
+            if self._closed:
+                raise ak._errors.wrap_error(
+                    ValueError("cannot write to a closed ak.to_parquet_writer")
+                )
+
+            _, form, table = ak.operations.ak_to_parquet._layout_form_table(
+                data, False, *self._conversion
+            )
+
+            if self._writer is None:
+                self._open(form, table)
+
+            elif not table.schema.equals(self._writer.schema, check_metadata=True):
+                raise ak._errors.wrap_error(
+                    ValueError(
+                        "array type does not match the type of the arrays already "
+                        f"written:\n\n    {table.schema}\n\nversus\n\n    "
+                        f"{self._writer.schema}"
+                    )
+                )
+
+            self._writer.write_table(table, row_group_size=self._row_group_size)
+
+    def _open(self, form, table):
+        import awkward._connect.pyarrow
+
+        pyarrow_parquet = awkward._connect.pyarrow.import_pyarrow_parquet(
+            "ak.to_parquet_writer"
+        )
+        fsspec = awkward._connect.pyarrow.import_fsspec("ak.to_parquet_writer")
+
+        options = ak.operations.ak_to_parquet._writer_options(
+            form, table, *self._column_options
+        )
+
+        fs, self._path = fsspec.core.url_to_fs(
+            self._destination, **(self._storage_options or {})
+        )
+        self._writer = pyarrow_parquet.ParquetWriter(
+            self._path,
+            table.schema,
+            filesystem=fs,
+            metadata_collector=self._metalist,
+            **self._writer_options,
+            **options,
+        )
+
+    def close(self):
+        """
+        Writes the file footer and closes the file; it is safe to call this
+        more than once.
+
+        Returns the ``pyarrow._parquet.FileMetaData`` of the file, or None if
+        nothing was written.
+        """
+        if not self._closed:
+            self._closed = True
+            if self._writer is not None:
+                self._writer.close()
+                self.metadata = self._metalist[0]
+                self.metadata.set_file_path(self._path.rsplit("/", 1)[-1])
+        return self.metadata
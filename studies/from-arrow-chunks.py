@@ -0,0 +1,56 @@
+# Time ak.from_arrow on Tables and ChunkedArrays of many small or a few large
+# chunks, comparing Arrow's combine_chunks with merging converted chunks in
+# awkward._connect.pyarrow.concatenate_owned and with ak.concatenate.
+
+import time
+
+import numpy as np
+import pyarrow as pa
+
+import awkward as ak
+import awkward._connect.pyarrow as cp
+
+
+def best_of(f, n=3):
+    best = float("inf")
+    for _ in range(n):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+for extensionarray in [False, True]:
+    for nbatch, rows in [(5000, 100), (10, 1_000_000)]:
+        array = ak.Array(
+            {"x": np.arange(rows), "y": [[1.1] * (i % 4) for i in range(rows)]}
+        )
+        batch = ak.to_arrow_table(array, extensionarray=extensionarray).to_batches()[0]
+        table = pa.Table.from_batches([batch] * nbatch)
+        plan = cp.record_batch_plan(table.schema)
+
+        def convert():
+            return [cp.handle_record_batch(x, plan) for x in table.to_batches()]
+
+        print(f"extensionarray={extensionarray}, {nbatch} batches of {rows} rows")
+        print(
+            f"    ak.from_arrow(table)            {best_of(lambda: ak.from_arrow(table)):.3f} s"
+        )
+        if not extensionarray:
+            print(
+                f"    combine_chunks                  {best_of(lambda: cp.handle_arrow(table.combine_chunks())):.3f} s"
+            )
+        print(
+            f"    batches + concatenate_owned     {best_of(lambda: cp.concatenate_owned(convert())):.3f} s"
+        )
+        print(
+            f"    batches + ak.concatenate        {best_of(lambda: ak.concatenate(convert(), highlevel=False)):.3f} s"
+        )
+        if not extensionarray:
+            chunked = table.column("y")
+            print(
+                f"    ChunkedArray, ak.from_arrow     {best_of(lambda: ak.from_arrow(chunked)):.3f} s"
+            )
+            print(
+                f"    ChunkedArray, combine_chunks    {best_of(lambda: cp.handle_arrow(chunked.combine_chunks())):.3f} s"
+            )
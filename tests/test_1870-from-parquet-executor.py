@@ -0,0 +1,43 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import concurrent.futures
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture()
+def many_files(tmp_path):
+    expected = []
+    for i in range(10):
+        data = ak.Array([{"x": i, "y": [i] * (i % 3 + 1)}, {"x": -i, "y": []}])
+        ak.to_parquet(data, os.path.join(tmp_path, f"data{i:02d}.parquet"))
+        expected.extend(data.tolist())
+    return str(tmp_path), expected
+
+
+@pytest.mark.parametrize("executor", [None, 1, 4])
+def test_integer_executor(many_files, executor):
+    path, expected = many_files
+    assert ak.from_parquet(path, executor=executor).tolist() == expected
+
+
+def test_executor_object(many_files):
+    path, expected = many_files
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        result = ak.from_parquet(path, columns=["x"], executor=pool)
+    assert result.tolist() == [{"x": x["x"]} for x in expected]
+
+
+def test_bad_executor(many_files):
+    path, expected = many_files
+    with pytest.raises(ValueError):
+        ak.from_parquet(path, executor=0)
+    with pytest.raises(TypeError):
+        ak.from_parquet(path, executor="threads")
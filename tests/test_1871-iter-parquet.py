@@ -0,0 +1,59 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture()
+def dataset(tmp_path):
+    # two files of 3 row groups (of 4, 4, and 2 rows) each
+    expected = []
+    for i in range(2):
+        data = ak.Array([{"x": 10 * i + j, "y": [1.1] * (j % 3)} for j in range(10)])
+        ak.to_parquet(
+            data, os.path.join(tmp_path, f"data{i}.parquet"), row_group_size=4
+        )
+        expected.extend(data.tolist())
+    return str(tmp_path), expected
+
+
+def test_row_groups(dataset):
+    path, expected = dataset
+    arrays = list(ak.iter_parquet(path))
+    assert [len(x) for x in arrays] == [4, 4, 2, 4, 4, 2]
+    assert sum((x.tolist() for x in arrays), []) == expected
+
+
+def test_step_size(dataset):
+    path, expected = dataset
+    arrays = list(ak.iter_parquet(path, step_size=7))
+    assert [len(x) for x in arrays] == [7, 7, 6]
+    assert sum((x.tolist() for x in arrays), []) == expected
+
+
+def test_columns_and_row_groups(dataset):
+    path, expected = dataset
+    arrays = list(ak.iter_parquet(path, columns=["x"], row_groups=[1, 3]))
+    assert [x.fields for x in arrays] == [["x"], ["x"]]
+    assert sum((x.x.tolist() for x in arrays), []) == [4, 5, 6, 7, 10, 11, 12, 13]
+
+
+def test_lowlevel(dataset):
+    path, expected = dataset
+    (first, *_) = ak.iter_parquet(path, highlevel=False)
+    assert isinstance(first, ak.contents.Content)
+
+
+def test_errors_are_eager(dataset):
+    path, expected = dataset
+    with pytest.raises(ValueError):
+        ak.iter_parquet(path, step_size=0)
+    with pytest.raises(ValueError):
+        ak.iter_parquet(path, row_groups=[100])
@@ -0,0 +1,71 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture()
+def path(tmp_path):
+    # row groups: x in [0, 4), [4, 8), [8, 10)
+    data = ak.Array(
+        [{"x": i, "name": f"n{i}", "y": [float(i)] * (1 + i % 3)} for i in range(10)]
+    )
+    filename = os.path.join(tmp_path, "data.parquet")
+    ak.to_parquet(data, filename, row_group_size=4)
+    return filename
+
+
+def test_comparisons(path):
+    assert ak.from_parquet(path, filter=[("x", "==", 5)]).x.tolist() == [4, 5, 6, 7]
+    assert ak.from_parquet(path, filter=[("x", "<", 4)]).x.tolist() == [0, 1, 2, 3]
+    result = ak.from_parquet(path, filter=[("x", ">=", 7)])
+    assert result.x.tolist() == [4, 5, 6, 7, 8, 9]
+    result = ak.from_parquet(path, filter=[("x", "in", [1, 9])])
+    assert result.x.tolist() == [0, 1, 2, 3, 8, 9]
+    assert ak.from_parquet(path, filter=[("name", "=", "n9")]).x.tolist() == [8, 9]
+    assert ak.from_parquet(path, filter=[("y", ">", 8.5)]).x.tolist() == [8, 9]
+
+
+def test_conjunction_and_disjunction(path):
+    result = ak.from_parquet(path, filter=[("x", ">", 2), ("x", "<", 5)])
+    assert result.x.tolist() == [0, 1, 2, 3, 4, 5, 6, 7]
+
+    result = ak.from_parquet(path, filter=[[("x", "==", 0)], [("x", "==", 9)]])
+    assert result.x.tolist() == [0, 1, 2, 3, 8, 9]
+
+
+def test_with_row_groups_and_columns(path):
+    result = ak.from_parquet(
+        path, columns=["name"], row_groups=[0, 1], filter=[("x", ">", 2)]
+    )
+    assert result.fields == ["name"]
+    assert result.name.tolist() == [f"n{i}" for i in range(8)]
+
+    result = list(ak.iter_parquet(path, filter=[("x", ">", 5)]))
+    assert [x.x.tolist() for x in result] == [[4, 5, 6, 7], [8, 9]]
+
+
+def test_nothing_selected(path):
+    result = ak.from_parquet(path, filter=[("x", ">", 100)])
+    assert len(result) == 0
+    assert result.fields == ["x", "name", "y"]
+
+
+def test_errors(path):
+    with pytest.raises(ValueError):
+        ak.from_parquet(path, filter=[("z", "==", 1)])
+    with pytest.raises(ValueError):
+        ak.from_parquet(path, filter=[("x", "~", 1)])
+    with pytest.raises(TypeError):
+        ak.from_parquet(path, filter=("x", "==", 1))
+    with pytest.raises(ValueError, match="'name'"):
+        ak.from_parquet(path, filter=[("name", "==", 5)])
+    with pytest.raises(ValueError, match="'x'"):
+        ak.from_parquet(path, filter=[("x", "in", ["a"])])
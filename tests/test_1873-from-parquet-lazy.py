@@ -0,0 +1,130 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+import pickle
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture()
+def data():
+    return ak.Array(
+        [
+            {"x": 1, "y": [1.1], "z": {"a": "one"}},
+            {"x": 2, "y": [], "z": {"a": "two"}},
+            {"x": 3, "y": [3.3, 3.3], "z": {"a": "three"}},
+        ]
+    )
+
+
+@pytest.fixture()
+def path(tmp_path, data):
+    filename = os.path.join(tmp_path, "data.parquet")
+    ak.to_parquet(data, filename)
+    return filename
+
+
+def count_reads(monkeypatch):
+    reads = []
+    original = ak.operations.ak_from_parquet._read_parquet_file
+
+    def counting(*args, **kwargs):
+        reads.append(kwargs["parquet_columns"])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(ak.operations.ak_from_parquet, "_read_parquet_file", counting)
+    return reads
+
+
+def test_fields_on_demand(path, data, monkeypatch):
+    reads = count_reads(monkeypatch)
+    array = ak.from_parquet(path, lazy=True)
+    assert reads == []
+    assert len(array) == 3
+    assert array.fields == ["x", "y", "z"]
+    assert str(array.type) == str(data.type)
+    assert reads == []
+
+    assert array.y.tolist() == data.y.tolist()
+    assert array["y"].tolist() == data.y.tolist()
+    assert array.z.a.tolist() == data.z.a.tolist()
+    assert reads == [["y.list.item"], ["z.a"]]
+
+    assert array.tolist() == data.tolist()
+    assert reads == [["y.list.item"], ["z.a"], ["x"]]
+
+
+def test_cache_eviction(path, data, monkeypatch):
+    reads = count_reads(monkeypatch)
+    array = ak.from_parquet(path, lazy=True, lazy_cache_size=0)
+    assert array.x.tolist() == [1, 2, 3]
+    assert array.y.tolist() == data.y.tolist()
+    assert array.x.tolist() == [1, 2, 3]
+    assert reads == [["x"], ["y.list.item"], ["x"]]
+
+    # nothing is kept, not even after reading the whole array
+    assert array.tolist() == data.tolist()
+    assert array.tolist() == data.tolist()
+    assert len(reads) == 9
+    assert len(array._fields_cache) == 0
+
+
+def test_repr_without_reading(path, data, monkeypatch):
+    reads = count_reads(monkeypatch)
+    array = ak.from_parquet(path, lazy=True, lazy_cache_size=0)
+    assert repr(array) == f"<Array [...] type='{data.type}'>"
+    assert str(array.type) == str(data.type)
+    assert reads == []
+
+    assert str(array) == str(data)
+    assert len(reads) == 3
+    assert array.show(stream=None) == data.show(stream=None)
+    assert len(reads) == 6
+
+
+def test_operations_and_pickle(path, data):
+    array = ak.from_parquet(path, columns=["x", "y"], lazy=True)
+    assert array.fields == ["x", "y"]
+    assert ak.sum(array.x) == 6
+    assert ak.to_list(array[1:]) == data[["x", "y"]][1:].tolist()
+    assert pickle.loads(pickle.dumps(array)).tolist() == data[["x", "y"]].tolist()
+
+
+def test_not_records(tmp_path):
+    filename = os.path.join(tmp_path, "data.parquet")
+    ak.to_parquet(ak.Array([[1, 2], [3]]), filename)
+    assert ak.from_parquet(filename, lazy=True).tolist() == [[1, 2], [3]]
+
+
+class Point(ak.Array):
+    def norm(self):
+        return self.x * 10
+
+
+def test_behavior(tmp_path, monkeypatch):
+    filename = os.path.join(tmp_path, "data.parquet")
+    points = ak.with_name(ak.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]), "point")
+    ak.to_parquet(points, filename)
+    behavior = {("*", "point"): Point}
+
+    reads = count_reads(monkeypatch)
+    array = ak.from_parquet(filename, lazy=True, behavior=behavior)
+    assert isinstance(array, Point)
+    assert array.norm().tolist() == [10, 20]
+    assert reads == [["x"]]
+    assert repr(array).startswith("<Point ")
+
+    array.behavior = None
+    assert not isinstance(array, Point)
+    assert repr(array).startswith("<Array ")
+    array.behavior = behavior
+    assert isinstance(array, Point)
+
+    assert repr(ak.from_parquet(filename, lazy=True)).startswith("<Array ")
+    assert isinstance(pickle.loads(pickle.dumps(array)), Point)
@@ -0,0 +1,103 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture()
+def data():
+    return ak.Array(
+        [
+            {"run": 1 + i % 3, "x": i, "y": [float(i)] * (i % 4), "s": f"s{i}"}
+            for i in range(20)
+        ]
+    )
+
+
+def test_rows_per_file(tmp_path, data):
+    meta = ak.to_parquet_dataset(data, str(tmp_path), rows_per_file=6, executor=3)
+    assert sorted(os.listdir(tmp_path)) == [
+        "_common_metadata",
+        "_metadata",
+        "part-00000.parquet",
+        "part-00001.parquet",
+        "part-00002.parquet",
+        "part-00003.parquet",
+    ]
+    assert meta.num_rows == 20
+    assert ak.metadata_from_parquet(str(tmp_path))["col_counts"] == [6, 6, 6, 2]
+    assert ak.from_parquet(str(tmp_path)).tolist() == data.tolist()
+    assert ak.from_parquet(str(tmp_path), row_groups=[3]).tolist() == data[18:].tolist()
+
+
+def test_bytes_per_file(tmp_path, data):
+    ak.to_parquet_dataset(data, str(tmp_path), bytes_per_file=data.layout.nbytes // 2)
+    files = [x for x in os.listdir(tmp_path) if x.endswith(".parquet")]
+    assert len(files) == 2
+    assert ak.from_parquet(str(tmp_path)).tolist() == data.tolist()
+
+
+def test_partition_by(tmp_path, data):
+    ak.to_parquet_dataset(data, str(tmp_path), partition_by="run", rows_per_file=4)
+    assert sorted(x for x in os.listdir(tmp_path) if not x.startswith("_")) == [
+        "run=1",
+        "run=2",
+        "run=3",
+    ]
+    assert sorted(os.listdir(os.path.join(tmp_path, "run=1"))) == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+    ]
+    result = ak.from_parquet(str(tmp_path))
+    expected = data[ak.argsort(data.run, stable=True)]
+    assert result.tolist() == expected.tolist()
+
+    run2 = ak.from_parquet(os.path.join(tmp_path, "run=2"))
+    assert run2.tolist() == data[data.run == 2].tolist()
+
+    assert ak.metadata_from_parquet(str(tmp_path))["num_rows"] == 20
+
+
+def test_partition_by_string_and_options(tmp_path, data):
+    ak.to_parquet_dataset(
+        data[:3],
+        str(tmp_path),
+        partition_by="s",
+        parquet_options={"compression": "gzip"},
+    )
+    assert sorted(x for x in os.listdir(tmp_path) if not x.startswith("_")) == [
+        "s=s0",
+        "s=s1",
+        "s=s2",
+    ]
+
+
+def test_partition_by_empty(tmp_path, data):
+    meta = ak.to_parquet_dataset(data[:0], str(tmp_path), partition_by="run")
+    assert sorted(os.listdir(tmp_path)) == [
+        "_common_metadata",
+        "_metadata",
+        "part-00000.parquet",
+    ]
+    assert meta.num_rows == 0
+    metadata = ak.metadata_from_parquet(str(tmp_path))
+    assert metadata["num_rows"] == 0
+    assert metadata["form"].fields == data.fields
+
+
+def test_errors(tmp_path, data):
+    with pytest.raises(ValueError):
+        ak.to_parquet_dataset(data, str(tmp_path), rows_per_file=2, bytes_per_file=2)
+    with pytest.raises(ValueError):
+        ak.to_parquet_dataset(data, str(tmp_path), rows_per_file=0)
+    with pytest.raises(ValueError):
+        ak.to_parquet_dataset(data, str(tmp_path), partition_by="nope")
+    with pytest.raises(TypeError):
+        ak.to_parquet_dataset(data, str(tmp_path), partition_by="y")
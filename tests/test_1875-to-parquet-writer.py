@@ -0,0 +1,60 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+def chunks():
+    for i in range(4):
+        yield ak.Array(
+            [{"x": 10 * i + j, "y": [j] * (j + 1), "z": f"z{j}"} for j in range(i + 1)]
+        )
+
+
+def test_write_chunks(tmp_path):
+    filename = os.path.join(tmp_path, "out.parquet")
+    with ak.to_parquet_writer(filename, compression={"y": "gzip"}) as writer:
+        for chunk in chunks():
+            writer.write(chunk)
+
+    assert writer.closed
+    assert writer.metadata.num_row_groups == 4
+    assert writer.metadata.num_rows == 10
+
+    expected = ak.concatenate(list(chunks()))
+    assert ak.from_parquet(filename).tolist() == expected.tolist()
+    assert (
+        ak.from_parquet(filename, row_groups=[2]).tolist() == list(chunks())[2].tolist()
+    )
+    assert str(ak.from_parquet(filename).type) == str(expected.type)
+
+    row_group = pyarrow_parquet.ParquetFile(filename).metadata.row_group(0)
+    assert row_group.column(1).compression == "GZIP"
+
+
+def test_type_mismatch(tmp_path):
+    filename = os.path.join(tmp_path, "out.parquet")
+    writer = ak.to_parquet_writer(filename)
+    writer.write(ak.Array([{"x": 1}]))
+    with pytest.raises(ValueError):
+        writer.write(ak.Array([{"x": 1.1}]))
+    meta = writer.close()
+    assert meta.num_rows == 1
+    with pytest.raises(ValueError):
+        writer.write(ak.Array([{"x": 1}]))
+    assert ak.from_parquet(filename).tolist() == [{"x": 1}]
+
+
+def test_nothing_written(tmp_path):
+    filename = os.path.join(tmp_path, "out.parquet")
+    with ak.to_parquet_writer(filename) as writer:
+        pass
+    assert writer.metadata is None
+    assert not os.path.exists(filename)
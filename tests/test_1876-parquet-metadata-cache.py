@@ -0,0 +1,181 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+def write_files(directory, n):
+    for i in range(n):
+        ak.to_parquet(
+            ak.Array([{"x": i * 10 + j, "y": [1.1] * j} for j in range(1, 4)]),
+            os.path.join(directory, f"part{i}.parquet"),
+        )
+
+
+def count_footers(monkeypatch):
+    counter = {"n": 0}
+    original = pyarrow_parquet.ParquetFile.__init__
+
+    def counting(self, *args, **kwargs):
+        counter["n"] += 1
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(pyarrow_parquet.ParquetFile, "__init__", counting)
+    return counter
+
+
+def test_lrucache():
+    cache = ak._util.LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert sorted(cache) == ["a", "c"]
+    assert len(cache) == 2
+    del cache["a"]
+    assert list(cache) == ["c"]
+    with pytest.raises(ValueError):
+        ak._util.LRUCache(0)
+
+
+def test_lrucache_bytes():
+    cache = ak._util.LRUCache(max_bytes=100)
+    cache["a"] = np.zeros(40, np.uint8)
+    cache["b"] = np.zeros(40, np.uint8)
+    assert cache["a"].nbytes == 40
+    cache["c"] = np.zeros(40, np.uint8)
+    assert sorted(cache) == ["a", "c"]
+
+    # an item that is too large by itself is not kept
+    cache["d"] = np.zeros(1000, np.uint8)
+    assert sorted(cache) == ["a", "c"]
+    cache["d"] = np.zeros(10, np.uint8)
+    cache["e"] = np.zeros(10, np.uint8)
+    assert sorted(cache) == ["a", "c", "d", "e"]
+    cache["e"] = np.zeros(1000, np.uint8)
+    assert sorted(cache) == ["a", "c", "d"]
+
+    cache = ak._util.LRUCache(max_bytes=0)
+    cache["a"] = np.zeros(1, np.uint8)
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        ak._util.LRUCache()
+    with pytest.raises(ValueError):
+        ak._util.LRUCache(max_bytes=-1)
+
+
+def test_footers_are_reused(tmp_path, monkeypatch):
+    write_files(str(tmp_path), 3)
+    cache = {}
+    expected = ak.from_parquet(str(tmp_path)).tolist()
+
+    counter = count_footers(monkeypatch)
+    ak.operations.ak_from_parquet.metadata(str(tmp_path), metadata_cache=cache)
+    assert counter["n"] == 3
+
+    counter["n"] = 0
+    for _ in range(2):
+        meta = ak.metadata_from_parquet(str(tmp_path), metadata_cache=cache)
+        assert meta["num_rows"] == 9
+        assert meta["col_counts"] == [3, 3, 3]
+    assert counter["n"] == 0
+
+    # reading the data still opens the files, but the footers are not rescanned
+    assert ak.from_parquet(str(tmp_path), metadata_cache=cache).tolist() == expected
+    assert counter["n"] == 3
+
+    counter["n"] = 0
+    out = ak.from_parquet(str(tmp_path), row_groups=[2], metadata_cache=cache)
+    assert out.tolist() == expected[6:]
+    assert counter["n"] == 1
+
+
+def test_invalidation(tmp_path):
+    write_files(str(tmp_path), 2)
+    cache = ak._util.LRUCache(100)
+    assert len(ak.from_parquet(str(tmp_path), metadata_cache=cache)) == 6
+
+    # a new file changes the directory's modification time
+    ak.to_parquet(
+        ak.Array([{"x": 100, "y": [2.2]}]), os.path.join(tmp_path, "part9.parquet")
+    )
+    os.utime(tmp_path, (0, 12345))
+    assert len(ak.from_parquet(str(tmp_path), metadata_cache=cache)) == 7
+
+    # a rewritten file changes its size and modification time
+    ak.to_parquet(
+        ak.Array([{"x": 100, "y": [2.2]}] * 5), os.path.join(tmp_path, "part9.parquet")
+    )
+    meta = ak.metadata_from_parquet(str(tmp_path), metadata_cache=cache)
+    assert meta["col_counts"] == [3, 3, 5]
+
+
+def test_subdirectories(tmp_path):
+    ak.to_parquet_dataset(
+        ak.Array([{"k": 0, "x": 1}, {"k": 0, "x": 2}]), str(tmp_path), partition_by="k"
+    )
+    (subdirectory,) = [x for x in os.listdir(tmp_path) if x.startswith("k=")]
+    cache = ak._util.LRUCache(100)
+    assert len(ak.from_parquet(str(tmp_path), metadata_cache=cache)) == 2
+
+    # neither of these changes the top directory's modification time
+    ak.to_parquet(
+        ak.Array([{"x": 3}, {"x": 4}, {"x": 5}]),
+        os.path.join(tmp_path, subdirectory, "b.parquet"),
+    )
+    assert len(ak.from_parquet(str(tmp_path), metadata_cache=cache)) == 5
+    os.remove(os.path.join(tmp_path, subdirectory, "b.parquet"))
+    assert len(ak.from_parquet(str(tmp_path), metadata_cache=cache)) == 2
+
+
+def test_removed_file(tmp_path):
+    write_files(str(tmp_path), 3)
+    cache = ak._util.LRUCache(100)
+    os.utime(tmp_path, (0, 12345))
+    assert len(ak.from_parquet(str(tmp_path), metadata_cache=cache)) == 9
+
+    # as in an object store, where directories have no modification time
+    os.remove(os.path.join(tmp_path, "part2.parquet"))
+    os.utime(tmp_path, (0, 12345))
+    assert len(ak.from_parquet(str(tmp_path), metadata_cache=cache)) == 6
+
+
+def test_files_with_equal_stamps(tmp_path):
+    one = os.path.join(tmp_path, "one.parquet")
+    two = os.path.join(tmp_path, "two.parquet")
+    ak.to_parquet(ak.Array([{"x": 1}, {"x": 2}]), one)
+    ak.to_parquet(ak.Array([{"x": 3}, {"x": 4}]), two)
+    assert os.path.getsize(one) == os.path.getsize(two)
+    os.utime(one, (0, 12345))
+    os.utime(two, (0, 12345))
+
+    cache = ak._util.LRUCache(100)
+    assert ak.from_parquet(one, metadata_cache=cache).tolist() == [{"x": 1}, {"x": 2}]
+    assert ak.from_parquet(two, metadata_cache=cache).tolist() == [{"x": 3}, {"x": 4}]
+
+
+def test_default_cache(tmp_path):
+    write_files(str(tmp_path), 2)
+    first = ak.from_parquet(str(tmp_path), metadata_cache=True)
+    second = ak.from_parquet(str(tmp_path), metadata_cache=True)
+    assert first.tolist() == second.tolist()
+    assert len(ak.operations.ak_from_parquet._default_metadata_cache) != 0
+
+    with pytest.raises(TypeError):
+        ak.from_parquet(str(tmp_path), metadata_cache="yes")
+
+
+def test_iter_parquet(tmp_path):
+    write_files(str(tmp_path), 2)
+    cache = {}
+    for _ in range(2):
+        out = list(ak.iter_parquet(str(tmp_path), metadata_cache=cache))
+        assert [len(x) for x in out] == [3, 3]
@@ -0,0 +1,45 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+pytest.importorskip("pyarrow.parquet")
+fsspec = pytest.importorskip("fsspec")
+
+
+def test_local_files_are_memory_mapped(tmp_path):
+    filename = os.path.join(tmp_path, "test.parquet")
+    array = ak.Array(
+        {"x": np.arange(1000), "y": [[1.1, 2.2]] * 1000, "z": ["a", None] * 500}
+    )
+    ak.to_parquet(array, filename, compression=None)
+
+    fs = fsspec.filesystem("file")
+    with ak.operations.ak_from_parquet._open_file(
+        filename, fs, None, None, 64_000, 256_000_000, 1_000_000, None
+    ) as file:
+        assert isinstance(file, pyarrow.MemoryMappedFile)
+
+    result = ak.from_parquet(filename)
+    assert result.tolist() == array.tolist()
+    assert ak.from_parquet(filename, columns=["y"]).y.tolist() == array.y.tolist()
+
+
+def test_remote_style_filesystems_are_not(tmp_path):
+    filename = os.path.join(tmp_path, "test.parquet")
+    ak.to_parquet(ak.Array({"x": np.arange(10)}), filename)
+
+    fs = fsspec.filesystem("memory")
+    with open(filename, "rb") as file:
+        fs.pipe("/test.parquet", file.read())
+    with ak.operations.ak_from_parquet._open_file(
+        "/test.parquet", fs, None, None, 64_000, 256_000_000, 1_000_000, None
+    ) as file:
+        assert not isinstance(file, pyarrow.MemoryMappedFile)
+
+    assert ak.from_parquet("memory://test.parquet").x.tolist() == list(range(10))
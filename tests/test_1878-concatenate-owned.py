@@ -0,0 +1,127 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+import awkward._connect.pyarrow
+
+concatenate_owned = awkward._connect.pyarrow.concatenate_owned
+
+
+def check(*layouts):
+    expected = ak.concatenate(layouts, highlevel=False)
+    inputs = list(layouts)
+    result = concatenate_owned(inputs)
+    assert inputs == []
+    assert ak.to_list(result) == ak.to_list(expected)
+    assert result.form.type == layouts[0].form.type
+    assert ak.validity_error(result) == ""
+
+
+def test_numpy_and_regular():
+    check(
+        ak.contents.NumpyArray(np.arange(6).reshape(3, 2)),
+        ak.contents.NumpyArray(np.arange(6, 10).reshape(2, 2)),
+    )
+    check(
+        ak.contents.RegularArray(ak.contents.NumpyArray(np.arange(7)), 3, 2),
+        ak.contents.RegularArray(ak.contents.NumpyArray(np.arange(10, 16)), 3, 2),
+    )
+    check(ak.contents.EmptyArray(), ak.contents.EmptyArray())
+
+
+def test_lists():
+    content = ak.contents.NumpyArray(np.arange(10) * 1.1)
+    check(
+        ak.contents.ListOffsetArray(
+            ak.index.Index32(np.array([2, 4, 4, 7], np.int32)), content
+        ),
+        ak.contents.ListOffsetArray(
+            ak.index.Index32(np.array([0, 1, 3], np.int32)), content
+        ),
+    )
+    check(
+        ak.contents.ListArray(
+            ak.index.Index64(np.array([5, 0, 8])),
+            ak.index.Index64(np.array([7, 0, 10])),
+            content,
+        ),
+        ak.contents.ListArray(
+            ak.index.Index64(np.array([1])), ak.index.Index64(np.array([4])), content
+        ),
+    )
+    check(
+        ak.Array(["one", "two", "three"]).layout, ak.Array(["four", "", "five"]).layout
+    )
+
+
+def test_options():
+    content = ak.contents.NumpyArray(np.arange(10))
+    check(
+        ak.contents.IndexedOptionArray(ak.index.Index64(np.array([3, -1, 1])), content),
+        ak.contents.IndexedOptionArray(ak.index.Index64(np.array([-1, 9])), content),
+    )
+    check(
+        ak.contents.IndexedArray(ak.index.Index64(np.array([3, 3, 1])), content),
+        ak.contents.IndexedArray(ak.index.Index64(np.array([0, 9])), content),
+    )
+    check(
+        ak.contents.ByteMaskedArray(
+            ak.index.Index8(np.array([1, 0, 1], np.int8)), content, True
+        ),
+        ak.contents.ByteMaskedArray(
+            ak.index.Index8(np.array([0, 1], np.int8)), content, True
+        ),
+    )
+    check(
+        ak.contents.UnmaskedArray(ak.contents.NumpyArray(np.arange(3))),
+        ak.contents.UnmaskedArray(ak.contents.NumpyArray(np.arange(5))),
+    )
+    for lsb_order in (True, False):
+        check(
+            ak.contents.BitMaskedArray(
+                ak.index.IndexU8(np.packbits([1, 0, 1], bitorder="little")),
+                content,
+                True,
+                3,
+                lsb_order,
+            ),
+            ak.contents.BitMaskedArray(
+                ak.index.IndexU8(np.array([0b10110110, 0b1], np.uint8)),
+                content,
+                True,
+                10,
+                lsb_order,
+            ),
+        )
+
+
+def test_records_and_unions():
+    one = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}]).layout
+    two = ak.Array([{"x": 3, "y": [3.3, 4.4]}]).layout
+    check(one, two)
+    check(ak.Array([(1, "a")]).layout, ak.Array([(2, "b"), (3, "c")]).layout)
+
+    three = ak.Array([1, [2, 3], 4]).layout
+    four = ak.Array([7, [5], [6, 8]]).layout
+    check(three, four)
+
+
+def test_from_parquet(tmp_path):
+    data = ak.Array(
+        [
+            {"x": i, "y": [i] * (i % 3 + 1), "z": None if i % 4 == 0 else str(i)}
+            for i in range(30)
+        ]
+    )
+    for i in range(3):
+        ak.to_parquet(
+            data[i * 10 : i * 10 + 10], os.path.join(tmp_path, f"{i}.parquet")
+        )
+
+    pytest.importorskip("pyarrow.parquet")
+    assert ak.from_parquet(str(tmp_path)).tolist() == data.tolist()
+    assert ak.from_parquet(str(tmp_path), columns=["z"]).z.tolist() == data.z.tolist()
@@ -0,0 +1,78 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("pyarrow.parquet")
+pytest.importorskip("fsspec")
+
+
+@pytest.fixture()
+def dataset(tmp_path):
+    data = ak.Array([{"x": i, "y": [float(i)] * (i % 3)} for i in range(40)])
+    # two files with row groups of 10 entries each
+    ak.to_parquet(data[:20], os.path.join(tmp_path, "a.parquet"), row_group_size=10)
+    ak.to_parquet(data[20:], os.path.join(tmp_path, "b.parquet"), row_group_size=10)
+    return str(tmp_path), data
+
+
+@pytest.mark.parametrize(
+    "entry_start, entry_stop",
+    [
+        (None, None),
+        (0, 40),
+        (5, 15),
+        (10, 20),
+        (15, 35),
+        (3, 4),
+        (-5, None),
+        (None, -35),
+        (30, 100),
+        (25, 5),
+        (40, 50),
+    ],
+)
+def test_entry_range(dataset, entry_start, entry_stop):
+    path, data = dataset
+    result = ak.from_parquet(path, entry_start=entry_start, entry_stop=entry_stop)
+    assert result.tolist() == data.tolist()[entry_start:entry_stop]
+
+
+def test_only_overlapping_row_groups_are_read(dataset, monkeypatch):
+    path, data = dataset
+    read = []
+    original = ak.operations.ak_from_parquet._read_parquet_file
+
+    def reading(path, **kwargs):
+        read.append((path.rsplit("/", 1)[-1], kwargs["row_groups"]))
+        return original(path, **kwargs)
+
+    monkeypatch.setattr(ak.operations.ak_from_parquet, "_read_parquet_file", reading)
+
+    result = ak.from_parquet(path, entry_start=15, entry_stop=25)
+    assert result.x.tolist() == list(range(15, 25))
+    assert read == [("a.parquet", [1]), ("b.parquet", [0])]
+
+    del read[:]
+    result = ak.from_parquet(path, entry_start=32, entry_stop=38)
+    assert result.x.tolist() == list(range(32, 38))
+    assert read == [("b.parquet", [1])]
+
+
+def test_with_row_groups_and_lazy(dataset):
+    path, data = dataset
+    # entries are counted within the selected row groups
+    result = ak.from_parquet(path, row_groups=[1, 3], entry_start=5, entry_stop=15)
+    assert result.x.tolist() == list(range(15, 20)) + list(range(30, 35))
+
+    lazy = ak.from_parquet(path, entry_start=12, entry_stop=27, lazy=True)
+    assert len(lazy) == 15
+    assert lazy.y.tolist() == data.y[12:27].tolist()
+    assert lazy.tolist() == data[12:27].tolist()
+
+    with pytest.raises(TypeError):
+        ak.from_parquet(path, entry_start=1.5)
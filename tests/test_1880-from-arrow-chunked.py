@@ -0,0 +1,83 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+def count_merges(monkeypatch):
+    import awkward._connect.pyarrow
+
+    counter = {"owned": 0, "concatenate": 0}
+    owned = awkward._connect.pyarrow.concatenate_owned
+    concatenate = ak.operations.concatenate
+
+    def counting_owned(layouts):
+        counter["owned"] += 1
+        return owned(layouts)
+
+    def counting_concatenate(*args, **kwargs):
+        counter["concatenate"] += 1
+        return concatenate(*args, **kwargs)
+
+    monkeypatch.setattr(awkward._connect.pyarrow, "concatenate_owned", counting_owned)
+    monkeypatch.setattr(ak.operations, "concatenate", counting_concatenate)
+    return counter
+
+
+def test_chunked_array(monkeypatch):
+    chunks = [
+        pyarrow.array([[1, 2], None, [3]]),
+        pyarrow.array([], pyarrow.list_(pyarrow.int64())),
+        pyarrow.array([[4, 5, 6], None]),
+    ]
+    result = ak.from_arrow(pyarrow.chunked_array(chunks))
+    assert result.tolist() == [[1, 2], None, [3], [4, 5, 6], None]
+
+    # Arrow can't combine extension arrays
+    chunks = [ak.to_arrow(ak.Array([[1, 2], None])), ak.to_arrow(ak.Array([None, [4]]))]
+    assert isinstance(chunks[0].type, pyarrow.ExtensionType)
+    counter = count_merges(monkeypatch)
+    result = ak.from_arrow(pyarrow.chunked_array(chunks))
+    assert result.tolist() == [[1, 2], None, None, [4]]
+    assert counter["owned"] != 0
+    assert counter["concatenate"] == 0
+
+
+def test_table_of_many_batches(monkeypatch):
+    array = ak.Array(
+        [
+            {"x": i, "y": [i] * (i % 3), "z": None if i % 2 else str(i)}
+            for i in range(50)
+        ]
+    )
+    batches = [
+        ak.to_arrow_table(array[i : i + 7]).to_batches()[0] for i in range(0, 50, 7)
+    ]
+    table = pyarrow.Table.from_batches(batches)
+    assert table.column(0).num_chunks == 8
+
+    result = ak.from_arrow(table)
+    assert result.tolist() == array.tolist()
+    assert result.type == array.type
+
+    counter = count_merges(monkeypatch)
+    result = ak.from_arrow(batches)
+    assert result.tolist() == array.tolist()
+    assert result.type == array.type
+    assert counter["owned"] != 0
+    assert counter["concatenate"] == 0
+
+
+def test_table_of_differing_forms():
+    # the first chunk has no missing values and the second does
+    table = pyarrow.Table.from_batches(
+        [
+            pyarrow.RecordBatch.from_pydict({"x": pyarrow.array([1, 2])}),
+            pyarrow.RecordBatch.from_pydict({"x": pyarrow.array([None, 3])}),
+        ]
+    )
+    assert ak.from_arrow(table).tolist() == [{"x": 1}, {"x": 2}, {"x": None}, {"x": 3}]
@@ -0,0 +1,118 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture()
+def array():
+    return ak.Array(
+        [
+            {"x": i, "y": [1.1 * i] * (i % 3), "z": None if i % 4 == 0 else str(i)}
+            for i in range(20)
+        ]
+    )
+
+
+@pytest.mark.parametrize("format", ["file", "stream"])
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_round_trip(tmp_path, array, format, memory_map):
+    filename = os.path.join(tmp_path, "test.arrow")
+    ak.to_arrow_ipc(array, filename, format=format)
+
+    result = ak.from_arrow_ipc(filename, memory_map=memory_map)
+    assert result.tolist() == array.tolist()
+    assert result.type == array.type
+
+    result = ak.from_arrow_ipc(filename, format=format, columns=["z", "x"])
+    assert result.fields == ["z", "x"]
+    assert result.x.tolist() == array.x.tolist()
+
+    with pytest.raises(ValueError):
+        ak.from_arrow_ipc(filename, columns="nope")
+
+
+def test_memory_map_is_zero_copy(tmp_path):
+    filename = os.path.join(tmp_path, "test.arrow")
+    ak.to_arrow_ipc(ak.Array({"x": np.arange(1000)}), filename)
+
+    result = ak.from_arrow_ipc(filename, highlevel=False)
+    data = result.content("x").data
+    assert not data.flags.owndata
+    assert not data.flags.writeable
+
+
+def test_batches_compression_and_file_objects(array):
+    sink = io.BytesIO()
+    ak.to_arrow_ipc(array, sink, compression="zstd", max_batch_size=6)
+    data = sink.getvalue()
+    assert data.startswith(b"ARROW1")
+    assert pyarrow.ipc.open_file(pyarrow.py_buffer(data)).num_record_batches == 4
+
+    assert ak.from_arrow_ipc(data).tolist() == array.tolist()
+    assert ak.from_arrow_ipc(io.BytesIO(data)).tolist() == array.tolist()
+
+    sink = io.BytesIO()
+    ak.to_arrow_ipc(array, sink, format="stream")
+    assert ak.from_arrow_ipc(sink.getvalue()).tolist() == array.tolist()
+
+    with pytest.raises(ValueError):
+        ak.to_arrow_ipc(array, io.BytesIO(), format="feather")
+    with pytest.raises(ValueError):
+        ak.to_arrow_ipc(array, io.BytesIO(), max_batch_size=0)
+
+
+def test_not_records(tmp_path):
+    filename = os.path.join(tmp_path, "test.arrow")
+    array = ak.Array([[1, 2, 3], [], [4, 5]])
+    ak.to_arrow_ipc(array, filename)
+    result = ak.from_arrow_ipc(filename)
+    assert result.tolist() == array.tolist()
+    assert result.type == array.type
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+
+@pytest.mark.parametrize("format", ["file", "stream"])
+def test_columns_are_not_decompressed(array, format):
+    sink = io.BytesIO()
+    ak.to_arrow_ipc(array, sink, format=format, compression="zstd", max_batch_size=6)
+    data = sink.getvalue()
+    if format == "file":
+        open_reader = pyarrow.ipc.open_file
+    else:
+        open_reader = pyarrow.ipc.open_stream
+
+    for source in [pyarrow.py_buffer(data), io.BytesIO(data)]:
+        reader = ak.operations.ak_from_arrow_ipc._open_selected(
+            source, open_reader, ["z", "x"]
+        )
+        assert reader.read_all().column_names == ["x", "z"]
+
+    result = ak.from_arrow_ipc(io.BytesIO(data), columns=["z", "x"])
+    assert result.fields == ["z", "x"]
+    assert result.z.tolist() == array.z.tolist()
+
+    if format == "stream":
+        result = ak.from_arrow_ipc(_Unseekable(data), format=format, columns="y")
+        assert result.fields == ["y"]
+        assert result.y.tolist() == array.y.tolist()
+
+        with pytest.raises(ValueError):
+            ak.from_arrow_ipc(_Unseekable(data), format=format, columns="nope")
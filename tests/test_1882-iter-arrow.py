@@ -0,0 +1,69 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture()
+def array():
+    return ak.Array(
+        [
+            {"x": i, "y": [1.1 * i] * (i % 3), "z": None if i % 4 == 0 else str(i)}
+            for i in range(20)
+        ]
+    )
+
+
+def make_reader(array, step):
+    batches = [
+        ak.to_arrow_table(array[start : start + step]).to_batches()[0]
+        for start in range(0, len(array), step)
+    ]
+    return pyarrow.RecordBatchReader.from_batches(batches[0].schema, batches)
+
+
+def test_reader(array, monkeypatch):
+    import awkward._connect.pyarrow
+
+    plans = []
+    original = awkward._connect.pyarrow.record_batch_plan
+
+    def counting(*args, **kwargs):
+        plans.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(awkward._connect.pyarrow, "record_batch_plan", counting)
+
+    out = list(ak.iter_arrow(make_reader(array, 6)))
+    assert [len(x) for x in out] == [6, 6, 6, 2]
+    assert sum((x.tolist() for x in out), []) == array.tolist()
+    assert all(x.type.content == array.type.content for x in out)
+    # the schema is interpreted once for the whole stream
+    assert len(plans) == 1
+
+
+def test_table_and_options(array):
+    first = ak.to_arrow_table(array[:5]).to_batches()[0]
+    table = pyarrow.Table.from_batches(
+        [first, first.slice(0, 0), ak.to_arrow_table(array[5:]).to_batches()[0]]
+    )
+    out = list(ak.iter_arrow(table, highlevel=False))
+    assert len(out) == 2
+    assert all(isinstance(x, ak.contents.Content) for x in out)
+    assert ak.to_list(out[1]) == array[5:].tolist()
+
+    with pytest.raises(TypeError):
+        ak.iter_arrow(array)
+
+
+def test_plain_arrow():
+    batch = pyarrow.RecordBatch.from_pydict(
+        {"a": pyarrow.array([1, None, 3]), "b": pyarrow.array([[1], [], None])}
+    )
+    reader = pyarrow.RecordBatchReader.from_batches(batch.schema, [batch, batch])
+    out = list(ak.iter_arrow(reader))
+    assert [x.tolist() for x in out] == [ak.from_arrow(batch).tolist()] * 2
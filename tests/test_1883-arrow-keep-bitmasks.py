@@ -0,0 +1,68 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("offset", [0, 3, 8, 13])
+@pytest.mark.parametrize("extensionarray", [True, False])
+def test_sliced_arrays(offset, extensionarray):
+    array = ak.Array(
+        [
+            {"x": None if i % 3 == 0 else i, "s": None if i % 4 == 0 else str(i)}
+            for i in range(40)
+        ]
+    )
+    table = ak.to_arrow_table(array, extensionarray=extensionarray)
+    sliced = table.slice(offset, 20).to_batches()[0]
+
+    result = ak.from_arrow(sliced, highlevel=False)
+    assert ak.to_list(result) == array[offset : offset + 20].tolist()
+    for field in ["x", "s"]:
+        assert isinstance(result.content(field), ak.contents.BitMaskedArray)
+        data = result.content(field).mask.data
+        if offset % 8 == 0:
+            # still a view of the Arrow validity buffer
+            assert not data.flags.owndata
+        if offset != 0:
+            assert len(data) == 3
+
+
+def test_sliced_struct():
+    array = pyarrow.array([{"a": 1}, {"a": 2}, None, {"a": 4}, None] * 4)
+    sliced = array.slice(5, 9)
+    result = ak.from_arrow(sliced)
+    assert result.tolist() == sliced.to_pylist()
+
+
+def test_record_level_option():
+    array = ak.Array([{"x": 1}, None, {"x": 3}, None, {"x": 5}])
+    table = ak.to_arrow_table(array)
+    layout = ak.from_arrow(table, highlevel=False)
+    assert isinstance(layout, ak.contents.BitMaskedArray)
+    assert layout.lsb_order
+    assert ak.to_list(layout) == array.tolist()
+
+    form = ak._connect.pyarrow.form_handle_arrow(table.schema)
+    assert form.type == layout.form.type
+    assert isinstance(form, ak.forms.BitMaskedForm)
+
+
+def test_bitmaskedarray_getitem_range():
+    content = ak.contents.NumpyArray(np.arange(20))
+    mask = np.packbits([i % 3 != 0 for i in range(20)], bitorder="little")
+    layout = ak.contents.BitMaskedArray(ak.index.IndexU8(mask), content, True, 20, True)
+    expected = ak.to_list(layout)
+
+    sliced = layout[8:19]
+    assert isinstance(sliced, ak.contents.BitMaskedArray)
+    assert ak.to_list(sliced) == expected[8:19]
+    assert ak.to_list(layout[16:]) == expected[16:]
+    assert ak.to_list(layout[8:4]) == []
+
+    sliced = layout[5:11]
+    assert ak.to_list(sliced) == expected[5:11]
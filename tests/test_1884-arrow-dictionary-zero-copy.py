@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+
+
+def arrow_indices(dictarray):
+    indices = dictarray.indices
+    return np.frombuffer(indices.buffers()[1], indices.type.to_pandas_dtype())
+
+
+def test_from_arrow_reuses_indices_and_dictionary():
+    dictarray = pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array(np.array([0, 1, 0, 2, 1], np.int32)),
+        pyarrow.array(["one", "two", "three"]),
+    )
+    layout = ak.from_arrow(dictarray, highlevel=False)
+    assert layout.parameter("__array__") == "categorical"
+    assert np.shares_memory(np.asarray(layout.index), arrow_indices(dictarray))
+    assert isinstance(layout.content, ak.contents.ListOffsetArray)
+    assert ak.to_list(layout) == ["one", "two", "one", "three", "two"]
+
+    back = ak.to_arrow(
+        ak.Array(layout), categorical_as_dictionary=True, extensionarray=False
+    )
+    assert isinstance(back, pyarrow.DictionaryArray)
+    assert back.indices.type == pyarrow.int32()
+    assert np.shares_memory(arrow_indices(back), arrow_indices(dictarray))
+    assert (
+        back.dictionary.buffers()[2].address
+        == dictarray.dictionary.buffers()[2].address
+    )
+    assert back.to_pylist() == dictarray.to_pylist()
+
+
+def test_missing_values_and_other_index_types():
+    dictarray = pyarrow.DictionaryArray.from_arrays(
+        pyarrow.array(
+            np.array([0, 1, 0, 2, 1], np.int16),
+            mask=np.array([False, False, True, False, False]),
+        ),
+        pyarrow.array(["one", "two", "three"]),
+    )
+    array = ak.from_arrow(dictarray)
+    assert array.tolist() == ["one", "two", None, "three", "two"]
+    assert ak.to_arrow(array, categorical_as_dictionary=True).to_pylist() == [
+        "one",
+        "two",
+        None,
+        "three",
+        "two",
+    ]
+
+
+def test_table_round_trip():
+    array = ak.Array({"c": ["a", "b", "a", "a", "c"], "x": [1, 2, 3, 4, 5]})
+    categorical = ak.with_field(array, ak.to_categorical(array.c), "c")
+    table = ak.to_arrow_table(categorical, categorical_as_dictionary=True)
+    assert pyarrow.types.is_dictionary(table.column("c").type.storage_type)
+
+    result = ak.from_arrow(table)
+    assert result.type == categorical.type
+    assert result.tolist() == array.tolist()
+    again = ak.to_arrow_table(result, categorical_as_dictionary=True)
+    assert again.column("c").to_pylist() == table.column("c").to_pylist()
+
+
+@pytest.mark.parametrize("extensionarray", [False, True])
+def test_non_categorical_options_keep_bitmap(extensionarray):
+    for content in [
+        ak.contents.RecordArray([ak.contents.NumpyArray(np.arange(3))], ["x"]),
+        ak.to_layout(["one", "two", "three"]),
+    ]:
+        layout = ak.contents.IndexedOptionArray(
+            ak.index.Index64(np.array([2, 0, 1], np.int64)), content
+        )
+        arrow = ak.to_arrow(layout, extensionarray=extensionarray)
+        result = ak.from_arrow(arrow)
+        assert str(result.type).startswith("3 * ?")
+        assert result.tolist() == ak.to_list(layout)
@@ -0,0 +1,71 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import concurrent.futures
+import pathlib
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+lines = "\n".join(
+    f'{{"x": {i}, "y": {[1.1 * j for j in range(i % 4)]}, "s": "s{i}"}}'
+    for i in range(100)
+)
+
+schema = {
+    "type": "object",
+    "properties": {
+        "x": {"type": "integer"},
+        "y": {"type": "array", "items": {"type": "number"}},
+        "s": {"type": "string"},
+    },
+}
+
+
+@pytest.mark.parametrize("executor", [1, 3, 7, 150])
+def test_no_schema(executor):
+    expected = ak.from_json(lines, line_delimited=True)
+    result = ak.from_json(lines, line_delimited=True, executor=executor)
+    assert result.type == expected.type
+    assert result.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("executor", [2, 5])
+def test_schema(executor):
+    expected = ak.from_json(lines, line_delimited=True, schema=schema)
+    result = ak.from_json(lines, line_delimited=True, schema=schema, executor=executor)
+    assert result.type == expected.type
+    assert result.tolist() == expected.tolist()
+
+
+def test_file_and_executor_object(tmp_path):
+    filename = tmp_path / "test.jsonl"
+    filename.write_text(lines + "\n")
+    with concurrent.futures.ThreadPoolExecutor(2) as pool:
+        result = ak.from_json(
+            pathlib.Path(filename), line_delimited=True, executor=pool
+        )
+    assert result.tolist() == ak.from_json(lines, line_delimited=True).tolist()
+
+    (tmp_path / "empty.jsonl").write_text("")
+    result = ak.from_json(
+        pathlib.Path(tmp_path / "empty.jsonl"), line_delimited=True, executor=2
+    )
+    assert len(result) == 0
+
+
+def test_types_merged_across_chunks():
+    result = ak.from_json("1\n2\n3\n4.5\n5.5\n6.5", line_delimited=True, executor=2)
+    assert str(result.type) == "6 * float64"
+    assert result.tolist() == [1, 2, 3, 4.5, 5.5, 6.5]
+
+    result = ak.from_json("1\n2\n3\n\n\n\n\n\n", line_delimited=True, executor=3)
+    assert result.tolist() == [1, 2, 3]
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.from_json("1\n2\n[3", line_delimited=True, executor=2)
+    with pytest.raises(ValueError):
+        ak.from_json("1\n2\n3", line_delimited=True, executor=0)
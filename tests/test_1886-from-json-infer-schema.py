@@ -0,0 +1,125 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import pathlib
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+import awkward.operations.ak_from_json
+
+lines = "\n".join(
+    f'{{"x": {i}, "y": {[1.1 * j for j in range(i % 4)]}, "s": "s{i}", '
+    f'"t": {"null" if i % 3 == 0 else "true"}, "r": {{"a": {i}, "b": "{i}"}}}}'
+    for i in range(20)
+)
+
+
+@pytest.fixture()
+def small_sample(monkeypatch):
+    monkeypatch.setattr(awkward.operations.ak_from_json, "_infer_num_documents", 3)
+
+
+def test_form_to_schema():
+    schema = awkward.operations.ak_from_json._form_to_schema(
+        ak.from_json(lines, line_delimited=True).layout.form
+    )
+    assert schema == {
+        "type": "object",
+        "properties": {
+            "x": {"type": "integer"},
+            "y": {"type": "array", "items": {"type": "number"}},
+            "s": {"type": "string"},
+            "t": {"type": ["boolean", "null"]},
+            "r": {
+                "type": "object",
+                "properties": {"a": {"type": "integer"}, "b": {"type": "string"}},
+            },
+        },
+    }
+
+    assert (
+        awkward.operations.ak_from_json._form_to_schema(
+            ak.from_json('[1, "two"]').layout.form
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize("executor", [None, 3])
+def test_same_as_discovery(executor):
+    expected = ak.from_json(lines, line_delimited=True)
+    result = ak.from_json(lines, line_delimited=True, schema="infer", executor=executor)
+    assert result.type == expected.type
+    assert result.tolist() == expected.tolist()
+
+
+def test_sources(tmp_path):
+    expected = ak.from_json(lines, line_delimited=True).tolist()
+
+    filename = tmp_path / "test.jsonl"
+    filename.write_text(lines)
+    assert (
+        ak.from_json(
+            pathlib.Path(filename), line_delimited=True, schema="infer"
+        ).tolist()
+        == expected
+    )
+
+    stream = io.BytesIO(lines.encode())
+    assert (
+        ak.from_json(
+            stream, line_delimited=True, schema="infer", buffersize=100
+        ).tolist()
+        == expected
+    )
+
+
+def test_fallback(small_sample):
+    for data in [
+        "{'x': 1}\n{'x': 2}\n{'x': 3}\n{'x': 4.5}",
+        "{'x': 1}\n{'x': 2}\n{'x': 3}\n{'x': null}",
+        "{'x': 1}\n{'x': 2}\n{'x': 3}\n{}",
+        "{'x': []}\n{'x': []}\n{'x': []}\n{'x': [1]}",
+        "1\n2\n3",
+        "[1]\n[2]\n[3]",
+    ]:
+        data = data.replace("'", '"')
+        expected = ak.from_json(data, line_delimited=True)
+        result = ak.from_json(data, line_delimited=True, schema="infer")
+        assert result.type == expected.type
+        assert result.tolist() == expected.tolist()
+
+
+def test_not_line_delimited():
+    assert ak.from_json('{"x": [1, 2, 3]}', schema="infer").tolist() == {"x": [1, 2, 3]}
+
+
+def test_keys_not_in_sample(small_sample, tmp_path):
+    for data in [
+        "{'x': 1}\n{'x': 2}\n{'x': 3}\n{'x': 4, 'y': 5}",
+        "{'x': [{'a': 1}]}\n{'x': []}\n{'x': []}\n{'x': [{'a': 2, 'b': 3}]}",
+        "{'x': {'a': 1}}\n{'x': {'a': 2}}\n{'x': {'a': 3}}\n{'x': {'a': 4}, 'a': 5}",
+        "{'x': 1}\n{'x': 2}\n{'x': 3}\n{'x': 4, 'y' : 5}",
+    ]:
+        data = data.replace("'", '"')
+        expected = ak.from_json(data, line_delimited=True)
+        result = ak.from_json(data, line_delimited=True, schema="infer")
+        assert result.type == expected.type
+        assert result.tolist() == expected.tolist()
+
+        filename = tmp_path / "test.jsonl"
+        filename.write_text(data)
+        result = ak.from_json(filename, line_delimited=True, schema="infer")
+        assert result.tolist() == expected.tolist()
+
+
+def test_key_counting():
+    num_keys = awkward.operations.ak_from_json._num_keys
+    num_json_keys = awkward.operations.ak_from_json._num_json_keys
+    layout = ak.from_json(lines, line_delimited=True, highlevel=False)
+    assert num_keys(layout) == num_json_keys(lines.encode()) == 20 * 7
+    assert num_json_keys(b'{"x" : 1, "y":\t2}') == 2
+    # string contents are counted, too, which only makes it fall back
+    assert num_json_keys(b'{"x": "\\":"}') == 2
@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import pathlib
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+import awkward.operations.ak_iter_json
+
+lines = "\n".join(
+    f'{{"x": {i}, "y": {[1.1 * j for j in range(i % 4)]}}}' for i in range(50)
+)
+
+
+def test_step_size():
+    arrays = list(ak.iter_json(lines, step_size=7))
+    assert [len(x) for x in arrays] == [7] * 7 + [1]
+    assert (
+        ak.concatenate(arrays).tolist()
+        == ak.from_json(lines, line_delimited=True).tolist()
+    )
+
+
+@pytest.mark.parametrize("buffersize", [1, 10, 65536])
+def test_step_bytes(buffersize):
+    step_bytes = 100
+    chunks = list(
+        awkward.operations.ak_iter_json._line_chunks(
+            io.BytesIO(lines.encode()), buffersize, None, step_bytes
+        )
+    )
+    assert b"".join(chunks) == lines.encode()
+    assert all(len(x) <= step_bytes for x in chunks)
+    assert all(x.endswith(b"\n") for x in chunks[:-1])
+
+    arrays = list(ak.iter_json(io.BytesIO(lines.encode()), buffersize=buffersize))
+    assert len(arrays) == 1
+    assert arrays[0].tolist() == ak.from_json(lines, line_delimited=True).tolist()
+
+
+def test_long_lines_and_both_limits():
+    data = b'"a"\n"' + b"b" * 50 + b'"\n"c"\n"d"\n"e"'
+    chunks = list(
+        awkward.operations.ak_iter_json._line_chunks(io.BytesIO(data), 8, 2, 10)
+    )
+    assert chunks == [b'"a"\n', b'"' + b"b" * 50 + b'"\n', b'"c"\n"d"\n', b'"e"']
+
+
+def test_file_and_schema(tmp_path):
+    filename = tmp_path / "test.jsonl"
+    filename.write_text(lines + "\n\n\n")
+    schema = {
+        "type": "object",
+        "properties": {
+            "x": {"type": "integer"},
+            "y": {"type": "array", "items": {"type": "number"}},
+        },
+    }
+    arrays = list(
+        ak.iter_json(
+            pathlib.Path(filename), step_size=20, schema=schema, highlevel=False
+        )
+    )
+    assert [len(x) for x in arrays] == [20, 20, 10]
+    assert all(x.form == arrays[0].form for x in arrays)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.iter_json(lines, step_size=0)
+    with pytest.raises(ValueError):
+        ak.iter_json(lines, step_size=None, step_bytes=None)
+    with pytest.raises(ValueError):
+        list(ak.iter_json("1\n2\n[3", step_size=2))
@@ -0,0 +1,113 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+import awkward.operations.ak_to_json
+
+
+@pytest.fixture()
+def via_python(monkeypatch):
+    def to_json(*args, **kwargs):
+        with monkeypatch.context() as m:
+            m.setattr(
+                awkward.operations.ak_to_json, "_is_writable", lambda *args: False
+            )
+            return ak.to_json(*args, **kwargs)
+
+    return to_json
+
+
+arrays = [
+    ak.Array([[1.1, 2.2], [], [3.3]]),
+    ak.Array([{"x": 1, "y": 'héllo\n"q"'}, {"x": None, "y": "b"}]),
+    ak.Array([1, "two", [3], None, {"a": 1}]),
+    ak.Array(np.arange(12).reshape(3, 2, 2)),
+    ak.Array([True, False, None]),
+    ak.Array([(1, 2.5), (3, 4.0)]),
+    ak.Array([[{"a": [1, 2]}], [], None]),
+    ak.Array(np.array([1.5, 2.5], np.float32)),
+    ak.Array([[1, 2, 3], [4, 5, 6]])[:, ::2],
+    ak.to_regular(ak.Array([[1, 2], [3, 4]])),
+    ak.Array([[], []]),
+    ak.Array([]),
+    ak.Record({"x": [1, 2], "y": {"z": 1.5}}),
+    ak.Array([[1, 2], [3]])[[1, 0, 1]],
+    ak.to_categorical(ak.Array(["a", "b", None, "a"])),
+    ak.Array(
+        ak.contents.BitMaskedArray(
+            ak.index.IndexU8(np.array([5], np.uint8)),
+            ak.contents.NumpyArray(np.arange(5.0)),
+            True,
+            5,
+            True,
+        )
+    ),
+    ak.Array([{"x": 1, "y": 2}, {"x": 3, "y": 4}])[1:],
+]
+
+
+@pytest.mark.parametrize("array", arrays)
+@pytest.mark.parametrize(
+    "options", [{}, {"line_delimited": True}, {"num_readability_spaces": 1}]
+)
+def test_same_as_python(via_python, array, options):
+    assert ak.to_json(array, **options) == via_python(array, **options)
+
+
+def test_conversions(via_python):
+    array = ak.Array([1.0, np.nan, np.inf, -np.inf])
+    options = dict(nan_string="NaN", posinf_string="inf", neginf_string="-inf")
+    assert ak.to_json(array, **options) == '[1.0,"NaN","inf","-inf"]'
+    with pytest.raises(ValueError):
+        ak.to_json(array)
+
+    array = ak.Array(np.array([1 + 2j, 3.5 - 1j]))
+    options = dict(complex_record_fields=("r", "i"))
+    assert ak.to_json(array, **options) == via_python(array, **options)
+
+    array = ak.Array([b"ab", b"c"])
+    options = dict(convert_bytes=bytes.decode)
+    assert ak.to_json(array, **options) == '["ab","c"]'
+
+
+def test_chunks(monkeypatch):
+    monkeypatch.setattr(awkward.operations.ak_to_json._Writer, "rows_per_chunk", 3)
+    array = ak.Array([{"x": i, "y": [i] * (i % 3)} for i in range(10)])
+
+    file = io.StringIO()
+    ak.to_json(array, file, line_delimited=True)
+    assert ak.from_json(file.getvalue(), line_delimited=True).tolist() == array.tolist()
+
+    file = io.StringIO()
+    ak.to_json(array, file)
+    assert ak.from_json(file.getvalue()).tolist() == array.tolist()
+
+    # each chunk of a permuted ListArray refers to parts all over its content
+    permuted = ak.zip({"y": array.y, "s": [str(i) * i for i in range(10)]})
+    permuted = permuted[np.random.default_rng(12345).permutation(10)]
+    assert isinstance(permuted.y.layout, ak.contents.ListArray)
+    sizes = []
+    lists = awkward.operations.ak_to_json._Writer.lists
+
+    def counting(self, layout, content, starts, stops):
+        sizes.append((content.length, sum(b - a for a, b in zip(starts, stops))))
+        return lists(self, layout, content, starts, stops)
+
+    monkeypatch.setattr(awkward.operations.ak_to_json._Writer, "lists", counting)
+    text = ak.to_json(permuted, line_delimited=True)
+    assert ak.from_json(text, line_delimited=True).tolist() == permuted.tolist()
+    assert all(used == length for length, used in sizes)
+
+
+def test_custom_getitem_falls_back(via_python):
+    class Point(ak.Record):
+        def __getitem__(self, where):
+            return "custom"
+
+    behavior = {"point": Point}
+    array = ak.Array([{"x": 1}], with_name="point", behavior=behavior)
+    assert ak.to_json(array) == via_python(array) == '[{"x":"custom"}]'
@@ -0,0 +1,125 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import bz2
+import lzma
+import os
+import zlib
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+DIR = os.path.dirname(__file__)
+SAMPLES_DIR = os.path.join(os.path.abspath(DIR), "samples")
+
+
+def read_long(data, pos):
+    shift = result = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return pos, (result >> 1) ^ -(result & 1)
+
+
+def write_long(value):
+    value = (value << 1) ^ (value >> 63)
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def write_bytes(value):
+    return write_long(len(value)) + value
+
+
+def recode(filename, codec, compress, repeat):
+    with open(filename, "rb") as file:
+        data = file.read()
+    assert data[:4] == b"Obj\x01"
+
+    metadata = {}
+    pos = 4
+    while True:
+        pos, count = read_long(data, pos)
+        if count == 0:
+            break
+        for _ in range(abs(count)):
+            pos, size = read_long(data, pos)
+            key = data[pos : pos + size]
+            pos, size = read_long(data, pos + size)
+            metadata[key] = data[pos : pos + size]
+            pos += size
+    sync = data[pos : pos + 16]
+    pos += 16
+
+    blocks = []
+    while pos < len(data):
+        pos, num_items = read_long(data, pos)
+        pos, size = read_long(data, pos)
+        blocks.append((num_items, data[pos : pos + size]))
+        pos += size + 16
+
+    metadata[b"avro.codec"] = codec
+    out = [b"Obj\x01", write_long(len(metadata))]
+    for key, value in metadata.items():
+        out.append(write_bytes(key) + write_bytes(value))
+    out.append(write_long(0) + sync)
+    for _ in range(repeat):
+        for num_items, block in blocks:
+            out.append(write_long(num_items) + write_bytes(compress(block)) + sync)
+    return b"".join(out)
+
+
+def deflate(data):
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+@pytest.mark.parametrize(
+    "codec, compress",
+    [
+        (b"null", lambda x: x),
+        (b"deflate", deflate),
+        (b"bzip2", bz2.compress),
+        (b"xz", lzma.compress),
+    ],
+)
+@pytest.mark.parametrize(
+    "sample", ["int_test_data.avro", "record_test_data.avro", "array_test_data.avro"]
+)
+def test_codecs(tmp_path, codec, compress, sample):
+    filename = os.path.join(SAMPLES_DIR, sample)
+    expected = ak.from_avro_file(filename).tolist()
+
+    recoded = tmp_path / "recoded.avro"
+    recoded.write_bytes(recode(filename, codec, compress, 3))
+    assert ak.from_avro_file(str(recoded)).tolist() == expected * 3
+    assert ak.from_avro_file(str(recoded), limit_entries=2).tolist() == expected[:2]
+
+
+def test_zstandard(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+
+    filename = os.path.join(SAMPLES_DIR, "record_test_data.avro")
+    recoded = tmp_path / "recoded.avro"
+    recoded.write_bytes(
+        recode(filename, b"zstandard", zstandard.ZstdCompressor().compress, 2)
+    )
+    assert ak.from_avro_file(str(recoded)).tolist() == (
+        ak.from_avro_file(filename).tolist() * 2
+    )
+
+
+def test_unknown_codec(tmp_path):
+    filename = os.path.join(SAMPLES_DIR, "int_test_data.avro")
+    recoded = tmp_path / "recoded.avro"
+    recoded.write_bytes(recode(filename, b"lz4", lambda x: x, 1))
+    with pytest.raises(ValueError, match="unsupported Avro codec"):
+        ak.from_avro_file(str(recoded))
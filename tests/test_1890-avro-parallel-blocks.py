@@ -0,0 +1,58 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import concurrent.futures
+import io
+import os
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+DIR = os.path.dirname(__file__)
+SAMPLES_DIR = os.path.join(os.path.abspath(DIR), "samples")
+
+
+def repeat_blocks(sample, repeat):
+    with open(os.path.join(SAMPLES_DIR, sample), "rb") as file:
+        data = file.read()
+    # the sync marker ends the header and every block
+    sync = data[-16:]
+    header_end = data.index(sync) + 16
+    return data + data[header_end:] * (repeat - 1)
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [
+        "int_test_data.avro",
+        "string_null_test_data.avro",
+        "int_string_null_test_data.avro",
+        "array_enum_test_data.avro",
+        "record_test_data.avro",
+        "record_null_test_data.avro",
+    ],
+)
+@pytest.mark.parametrize("executor", [1, 2, 4, 20])
+def test_same_as_serial(tmp_path, sample, executor):
+    recoded = tmp_path / "recoded.avro"
+    recoded.write_bytes(repeat_blocks(sample, 5))
+    expected = ak.from_avro_file(str(recoded))
+    result = ak.from_avro_file(str(recoded), executor=executor)
+    assert result.type == expected.type
+    assert result.tolist() == expected.tolist()
+
+
+def test_limit_entries_and_file_objects():
+    data = repeat_blocks("record_test_data.avro", 3)
+    expected = ak.from_avro_file(io.BytesIO(data))
+    assert len(expected) == 3 * len(
+        ak.from_avro_file(os.path.join(SAMPLES_DIR, "record_test_data.avro"))
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(2) as pool:
+        result = ak.from_avro_file(io.BytesIO(data), executor=pool)
+    assert result.tolist() == expected.tolist()
+
+    result = ak.from_avro_file(io.BytesIO(data), limit_entries=15, executor=3)
+    assert result.tolist() == expected[:15].tolist()
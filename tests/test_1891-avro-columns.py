@@ -0,0 +1,189 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import json
+import struct
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+
+
+def encode_long(value):
+    value = (value << 1) ^ (value >> 63)
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def encode(schema, value):
+    if isinstance(schema, dict) and isinstance(schema["type"], (dict, list)):
+        schema = schema["type"]
+    tpe = schema["type"] if isinstance(schema, dict) else schema
+
+    if isinstance(tpe, list):
+        python_types = {"null": type(None), "string": str, "int": int}
+        for i, option in enumerate(tpe):
+            if isinstance(value, python_types[option]):
+                return encode_long(i) + encode(option, value)
+    elif tpe == "null":
+        return b""
+    elif tpe == "boolean":
+        return bytes([value])
+    elif tpe in ("int", "long"):
+        return encode_long(value)
+    elif tpe == "float":
+        return struct.pack("<f", value)
+    elif tpe == "double":
+        return struct.pack("<d", value)
+    elif tpe == "string":
+        return encode_long(len(value.encode())) + value.encode()
+    elif tpe == "bytes":
+        return encode_long(len(value)) + value
+    elif tpe == "fixed":
+        return value
+    elif tpe == "enum":
+        return encode_long(schema["symbols"].index(value))
+    elif tpe == "record":
+        return b"".join(encode(x, value[x["name"]]) for x in schema["fields"])
+    elif tpe == "array":
+        items = [encode(schema["items"], x) for x in value]
+        if len(value) == 0:
+            return encode_long(0)
+        elif schema.get("multiblock"):
+            # one block with a negative count (followed by its size), then one
+            # block for each of the other items
+            out = encode_long(-1) + encode_long(len(items[0])) + items[0]
+            for item in items[1:]:
+                out += encode_long(1) + item
+            return out + encode_long(0)
+        else:
+            return encode_long(len(items)) + b"".join(items) + encode_long(0)
+    elif tpe == "map":
+        out = b""
+        if len(value) != 0:
+            out += encode_long(len(value))
+            for k, v in value.items():
+                out += encode("string", k) + encode(schema["values"], v)
+        return out + encode_long(0)
+    raise AssertionError(tpe)
+
+
+def avro_file(schema, records):
+    sync = bytes(range(16))
+    metadata = {b"avro.schema": json.dumps(schema).encode(), b"avro.codec": b"null"}
+    out = [b"Obj\x01", encode_long(len(metadata))]
+    for key, value in metadata.items():
+        out.append(encode_long(len(key)) + key + encode_long(len(value)) + value)
+    out.append(encode_long(0) + sync)
+    block = b"".join(encode(schema, x) for x in records)
+    out.append(encode_long(len(records)) + encode_long(len(block)) + block + sync)
+    return b"".join(out)
+
+
+schema = {
+    "type": "record",
+    "name": "Everything",
+    "fields": [
+        {"name": "b", "type": "boolean"},
+        {"name": "i", "type": "int"},
+        {"name": "l", "type": "long"},
+        {"name": "f", "type": "float"},
+        {"name": "d", "type": "double"},
+        {"name": "s", "type": "string"},
+        {"name": "y", "type": "bytes"},
+        {"name": "x", "type": {"type": "fixed", "name": "three", "size": 3}},
+        {
+            "name": "e",
+            "type": {"type": "enum", "name": "abc", "symbols": ["A", "B", "C"]},
+        },
+        {"name": "u", "type": ["string", "int", "null"]},
+        {"name": "a", "type": {"type": "array", "items": "string"}},
+        {
+            "name": "aa",
+            "type": {"type": "array", "items": {"type": "array", "items": "int"}},
+        },
+        {"name": "m", "type": {"type": "map", "values": "long"}},
+        {
+            "name": "z",
+            "type": {"type": "array", "items": "double", "multiblock": True},
+        },
+        {
+            "name": "r",
+            "type": {
+                "type": "record",
+                "name": "inner",
+                "fields": [
+                    {"name": "p", "type": "double"},
+                    {"name": "q", "type": "string"},
+                ],
+            },
+        },
+        {"name": "last", "type": "long"},
+    ],
+}
+
+records = [
+    {
+        "b": i % 2 == 0,
+        "i": -i,
+        "l": 1000000 * i,
+        "f": 1.5 * i,
+        "d": 2.25 * i,
+        "s": "x" * i,
+        "y": b"y" * i,
+        "x": b"abc",
+        "e": "ABC"[i % 3],
+        "u": [None, f"u{i}", i][i % 3],
+        "a": [str(j) for j in range(i % 4)],
+        "aa": [[j] * j for j in range(i % 3)],
+        "m": {str(j): j for j in range(i % 3)},
+        "z": [0.5 * j for j in range(i % 4)],
+        "r": {"p": 0.5 * i, "q": f"q{i}"},
+        "last": 7 * i,
+    }
+    for i in range(10)
+]
+
+
+@pytest.fixture()
+def filename(tmp_path):
+    out = tmp_path / "everything.avro"
+    out.write_bytes(avro_file(schema, records))
+    return str(out)
+
+
+def test_skip_everything_but_one(filename):
+    # the "m" field (an Avro map) and "z" (an array in several blocks) can't be
+    # read, but they can be skipped
+    result = ak.from_avro_file(filename, columns=["last"])
+    assert result.fields == ["last"]
+    assert result.last.tolist() == [x["last"] for x in records]
+
+
+def test_several_columns(filename):
+    result = ak.from_avro_file(filename, columns=["s", "u", "aa", "e"])
+    assert result.fields == ["s", "e", "u", "aa"]
+    assert result.tolist() == [
+        {"s": x["s"], "e": x["e"], "u": x["u"], "aa": x["aa"]} for x in records
+    ]
+
+
+def test_nested(filename):
+    result = ak.from_avro_file(filename, columns=["r.q", "f", "last"], executor=2)
+    assert result.tolist() == [
+        {"f": x["f"], "r": {"q": x["r"]["q"]}, "last": x["last"]} for x in records
+    ]
+    assert ak.from_avro_file(filename, columns=["r", "r.q"]).r.fields == ["p", "q"]
+
+
+def test_errors(filename):
+    with pytest.raises(ValueError, match="not found"):
+        ak.from_avro_file(filename, columns=["nope"])
+    with pytest.raises(ValueError, match="not found"):
+        ak.from_avro_file(filename, columns=["r.nope"])
+    with pytest.raises(ValueError, match="cannot select fields"):
+        ak.from_avro_file(filename, columns=["i.nope"])
@@ -0,0 +1,284 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+import json
+import pathlib
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+import awkward._connect.avro
+
+
+def round_trip(array, **kwargs):
+    file = io.BytesIO()
+    ak.to_avro_file(array, file, **kwargs)
+    file.seek(0)
+    return ak.from_avro_file(file)
+
+
+def schema_of(array):
+    form = ak.to_layout(array).form
+    return awkward._connect.avro.WriteAvro(form, "null", 1).schema
+
+
+def test_encode_longs():
+    values = np.array(
+        [
+            0,
+            1,
+            -1,
+            63,
+            -64,
+            64,
+            -65,
+            8191,
+            8192,
+            2**31,
+            -(2**31),
+            2**63 - 1,
+            -(2**63),
+        ],
+        np.int64,
+    )
+    data, offsets = awkward._connect.avro.encode_longs(values)
+    for i, value in enumerate(values.tolist()):
+        assert data[offsets[i] : offsets[i + 1]].tobytes() == (
+            awkward._connect.avro.encode_long(value)
+        )
+
+
+def test_schema():
+    array = ak.zip(
+        {
+            "b": np.array([True]),
+            "i": np.array([1], np.int32),
+            "j": np.array([1], np.int64),
+            "f": np.array([1.5], np.float32),
+            "d": np.array([1.5], np.float64),
+            "s": ["one"],
+            "bs": [b"one"],
+            "l": [[1]],
+            "o": [None],
+            "r": ak.zip({"x": [1]}),
+        },
+        depth_limit=1,
+    )
+    assert schema_of(array) == {
+        "type": "record",
+        "name": "Record",
+        "fields": [
+            {"name": "b", "type": "boolean"},
+            {"name": "i", "type": "int"},
+            {"name": "j", "type": "long"},
+            {"name": "f", "type": "float"},
+            {"name": "d", "type": "double"},
+            {"name": "s", "type": "string"},
+            {"name": "bs", "type": "bytes"},
+            {"name": "l", "type": {"type": "array", "items": "long"}},
+            {"name": "o", "type": "null"},
+            {
+                "name": "r",
+                "type": {
+                    "type": "record",
+                    "name": "Record1",
+                    "fields": [{"name": "x", "type": "long"}],
+                },
+            },
+        ],
+    }
+
+
+def test_records():
+    array = ak.Array(
+        [
+            {"x": 1, "y": 1.1, "z": "one", "w": [1, 2, 3], "v": True},
+            {"x": -300, "y": -2.2, "z": "", "w": [], "v": False},
+            {"x": 2**40, "y": 3.3, "z": "three", "w": [4], "v": True},
+        ]
+    )
+    out = round_trip(array)
+    assert out.to_list() == array.to_list()
+    assert (
+        str(out.type)
+        == "3 * {x: int64, y: float64, z: var * char, w: var * int64, v: bool}"
+    )
+
+
+def test_numbers():
+    for dtype in [np.int8, np.int16, np.int32, np.uint8, np.uint16]:
+        out = round_trip(np.arange(-5, 5).astype(dtype))
+        assert out.to_list() == np.arange(-5, 5).astype(dtype).tolist()
+        assert str(out.type) == "10 * int32"
+
+    for dtype in [np.int64, np.uint32, np.uint64]:
+        out = round_trip(np.arange(10).astype(dtype))
+        assert out.to_list() == list(range(10))
+        assert str(out.type) == "10 * int64"
+
+    out = round_trip(np.array([1.5, -np.inf, 3.25], np.float32))
+    assert out.to_list() == [1.5, -np.inf, 3.25]
+    assert str(out.type) == "3 * float32"
+
+    out = round_trip(np.array([[1, 2, 3], [4, 5, 6]], np.int32))
+    assert out.to_list() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_large_integers():
+    values = np.random.default_rng(12345).integers(-(2**62), 2**62, 10000)
+    assert np.array_equal(round_trip(values).to_numpy(), values)
+
+    with pytest.raises(ValueError, match="uint64"):
+        round_trip(np.array([2**63], np.uint64))
+
+
+def test_strings():
+    array = ak.Array([["one", "two"], [], ["three"]])
+    assert round_trip(array).to_list() == array.to_list()
+
+    array = ak.to_regular(ak.Array([b"abc", b"def"]), axis=1)
+    assert schema_of(array) == {"type": "fixed", "name": "Fixed", "size": 3}
+    assert round_trip(array).to_list() == [b"abc", b"def"]
+
+
+def test_missing():
+    array = ak.Array([1, 2, None, 4])
+    assert schema_of(array) == ["null", "long"]
+    assert round_trip(array).to_list() == [1, 2, None, 4]
+
+    array = ak.Array([{"x": 1}, None, {"x": 3}])
+    assert round_trip(array).to_list() == [{"x": 1}, None, {"x": 3}]
+
+    bytemasked = ak.contents.ByteMaskedArray(
+        ak.index.Index8(np.array([1, 0, 1], np.int8)),
+        ak.contents.NumpyArray(np.array([1.1, 2.2, 3.3])),
+        valid_when=True,
+    )
+    assert round_trip(bytemasked).to_list() == [1.1, None, 3.3]
+
+    bitmasked = ak.contents.BitMaskedArray(
+        ak.index.IndexU8(np.array([5], np.uint8)),
+        ak.contents.NumpyArray(np.array([1, 2, 3])),
+        valid_when=True,
+        length=3,
+        lsb_order=True,
+    )
+    assert round_trip(bitmasked).to_list() == [1, None, 3]
+
+    unmasked = ak.contents.UnmaskedArray(ak.contents.NumpyArray(np.array([1, 2, 3])))
+    assert round_trip(unmasked).to_list() == [1, 2, 3]
+
+
+def test_only_missing():
+    # option types of nothing are written as "null", which takes no bytes
+    array = ak.Array([[None], [None, None], []])
+    assert schema_of(array) == {"type": "array", "items": "null"}
+    assert round_trip(array).to_list() == [[None], [None, None], []]
+
+    array = ak.Array([{"x": None, "y": 1}, {"x": None, "y": 2}])
+    assert round_trip(array).to_list() == [{"x": None, "y": 1}, {"x": None, "y": 2}]
+    assert round_trip(array, block_size=1).to_list() == array.to_list()
+
+
+def test_unions():
+    array = ak.Array([1, "two", 3])
+    assert schema_of(array) == ["long", "string"]
+    assert round_trip(array).to_list() == [1, "two", 3]
+
+    array = ak.Array([[1, "a"], [], ["b", 2, 3]])
+    assert round_trip(array).to_list() == array.to_list()
+
+    array = ak.Array([1, "two", None, 3, "four"])
+    assert schema_of(array) == ["long", "string", "null"]
+    assert round_trip(array).to_list() == [1, "two", None, 3, "four"]
+
+
+def test_indexed():
+    array = ak.to_categorical(ak.Array(["a", "b", "a", "c"]))
+    assert round_trip(array).to_list() == ["a", "b", "a", "c"]
+
+    indexed = ak.contents.IndexedArray(
+        ak.index.Index64(np.array([2, 0, 1])),
+        ak.contents.NumpyArray(np.array([1.1, 2.2, 3.3])),
+    )
+    assert round_trip(indexed).to_list() == [3.3, 1.1, 2.2]
+
+
+def test_tuples():
+    array = ak.Array([(1, "a"), (2, "b")])
+    assert round_trip(array).to_list() == [{"0": 1, "1": "a"}, {"0": 2, "1": "b"}]
+
+
+def test_not_supported():
+    with pytest.raises(TypeError, match="complex128"):
+        round_trip(np.array([1 + 1j]))
+
+    with pytest.raises(ValueError, match="unsupported Avro codec"):
+        round_trip(np.arange(3), codec="lz4")
+
+    with pytest.raises(ValueError, match="block_size"):
+        round_trip(np.arange(3), block_size=0)
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate", "bzip2", "xz"])
+def test_codecs(codec):
+    array = ak.Array({"x": np.arange(1000), "y": [[i] * (i % 3) for i in range(1000)]})
+    file = io.BytesIO()
+    ak.to_avro_file(array, file, codec=codec)
+    file.seek(0)
+    reader = awkward._connect.avro.ReadAvroFT(file, None)
+    assert reader.metadata["avro.codec"] == codec.encode()
+
+    assert round_trip(array, codec=codec).to_list() == array.to_list()
+
+
+def test_blocks(monkeypatch):
+    array = ak.Array({"x": np.arange(100), "y": [str(i) for i in range(100)]})
+
+    file = io.BytesIO()
+    ak.to_avro_file(array, file, block_size=16)
+    data = file.getvalue()
+    # one marker after the header and one after each block
+    assert data.count(data[-16:]) > 20
+
+    file = io.BytesIO()
+    ak.to_avro_file(array, file, block_size=1000)
+    data = file.getvalue()
+    assert data.count(data[-16:]) == 2
+
+    monkeypatch.setattr(awkward._connect.avro.WriteAvro, "rows_per_chunk", 7)
+    for block_size in [1, 10, 1000]:
+        out = round_trip(array, block_size=block_size, codec="deflate")
+        assert out.to_list() == array.to_list()
+
+
+def test_permuted_lists(monkeypatch):
+    # each chunk of a permuted ListArray refers to parts all over its content
+    monkeypatch.setattr(awkward._connect.avro.WriteAvro, "rows_per_chunk", 7)
+    array = ak.Array([[i] * (i % 3) for i in range(50)])
+    array = array[np.random.default_rng(12345).permutation(50)]
+    assert isinstance(array.layout, ak.contents.ListArray)
+    assert round_trip(array).to_list() == array.to_list()
+
+
+def test_empty():
+    assert round_trip(ak.Array(np.zeros(0, np.int64))).to_list() == []
+    assert round_trip(ak.Array([[], []])).to_list() == [[], []]
+    assert round_trip(ak.Array([{"x": 1}])[:0]).to_list() == []
+
+
+def test_files(tmp_path):
+    array = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}])
+
+    ak.to_avro_file(array, tmp_path / "array.avro")
+    assert ak.from_avro_file(tmp_path / "array.avro").to_list() == array.to_list()
+
+    ak.to_avro_file(array, str(tmp_path / "array.avro"), codec="deflate")
+    assert ak.from_avro_file(str(tmp_path / "array.avro")).to_list() == array.to_list()
+
+    with open(pathlib.Path(tmp_path) / "array.avro", "rb") as file:
+        data = file.read()
+    assert data.startswith(b"Obj\x01")
+    assert json.dumps(schema_of(array)).encode() in data
+    assert b"deflate" in data
@@ -0,0 +1,97 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+import awkward._connect.avro
+import awkward.forth
+
+array = ak.Array(
+    {
+        "x": np.arange(100),
+        "y": [[i, str(i)][i % 2] for i in range(100)],
+        "z": [[1.1] * (i % 3) for i in range(100)],
+    }
+)
+
+
+def avro_file(codec="null"):
+    file = io.BytesIO()
+    # small blocks of a few rows each
+    ak.to_avro_file(array, file, codec=codec, block_size=40)
+    file.seek(0)
+    return file
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_chunks(codec):
+    arrays = list(ak.iter_avro_file(avro_file(codec), step_blocks=3))
+    assert len(arrays) > 3
+    assert all(isinstance(x, ak.Array) for x in arrays)
+    assert ak.concatenate(arrays).to_list() == array.to_list()
+
+    whole = ak.from_avro_file(avro_file(codec))
+    assert [len(x) for x in ak.iter_avro_file(avro_file(codec), step_blocks=1000)] == [
+        len(whole)
+    ]
+
+
+def test_start_and_limit():
+    lengths = [len(x) for x in ak.iter_avro_file(avro_file(), step_blocks=1)]
+
+    arrays = list(ak.iter_avro_file(avro_file(), step_blocks=2, start_block=3))
+    start = sum(lengths[:3])
+    assert ak.concatenate(arrays).to_list() == array[start:].to_list()
+
+    arrays = list(
+        ak.iter_avro_file(avro_file(), step_blocks=2, start_block=3, limit_entries=20)
+    )
+    assert sum(len(x) for x in arrays) == 20
+    assert ak.concatenate(arrays).to_list() == array[start : start + 20].to_list()
+
+    assert list(ak.iter_avro_file(avro_file(), start_block=len(lengths))) == []
+
+
+def test_compiled_once(monkeypatch):
+    compiled = []
+    original = awkward.forth.ForthMachine64
+
+    def counting(source):
+        compiled.append(source)
+        return original(source)
+
+    monkeypatch.setattr(awkward.forth, "ForthMachine64", counting)
+    monkeypatch.setattr(
+        awkward._connect.avro, "compiled_schemas", ak._util.LRUCache(10)
+    )
+    arrays = list(ak.iter_avro_file(avro_file(), step_blocks=2))
+    assert len(arrays) > 1
+    assert len(compiled) == 1
+    assert ak.concatenate(arrays).to_list() == array.to_list()
+
+
+def test_columns():
+    arrays = list(ak.iter_avro_file(avro_file(), step_blocks=2, columns=["z"]))
+    assert ak.concatenate(arrays).to_list() == array[["z"]].to_list()
+
+
+def test_files(tmp_path):
+    ak.to_avro_file(array, tmp_path / "array.avro", block_size=100)
+    for file in [tmp_path / "array.avro", str(tmp_path / "array.avro")]:
+        arrays = list(ak.iter_avro_file(file, step_blocks=2, highlevel=False))
+        assert all(isinstance(x, ak.contents.Content) for x in arrays)
+        assert ak.concatenate(arrays).to_list() == array.to_list()
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="step_blocks"):
+        ak.iter_avro_file(avro_file(), step_blocks=0)
+
+    with pytest.raises(ValueError, match="start_block"):
+        ak.iter_avro_file(avro_file(), start_block=-1)
+
+    with pytest.raises(TypeError):
+        ak.iter_avro_file(123)
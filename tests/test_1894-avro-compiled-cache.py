@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import io
+
+import numpy as np  # noqa: F401
+import pytest  # noqa: F401
+
+import awkward as ak  # noqa: F401
+import awkward._connect.avro
+import awkward.forth
+
+
+def avro_file(array, **kwargs):
+    file = io.BytesIO()
+    ak.to_avro_file(array, file, **kwargs)
+    file.seek(0)
+    return file
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    sources = []
+    original = awkward.forth.ForthMachine64
+
+    def counting(source):
+        sources.append(source)
+        return original(source)
+
+    monkeypatch.setattr(awkward.forth, "ForthMachine64", counting)
+    monkeypatch.setattr(awkward._connect.avro, "compiled_schemas", ak._util.LRUCache(2))
+    return sources
+
+
+def test_same_schema(compiled):
+    one = ak.Array([{"x": 1, "y": [1.1, 2.2]}])
+    two = ak.Array([{"x": 2, "y": []}, {"x": 3, "y": [3.3]}])
+
+    assert ak.from_avro_file(avro_file(one)).to_list() == one.to_list()
+    assert ak.from_avro_file(avro_file(two)).to_list() == two.to_list()
+    assert ak.from_avro_file(avro_file(one, codec="deflate")).to_list() == one.to_list()
+    assert len(compiled) == 1
+    assert len(awkward._connect.avro.compiled_schemas) == 1
+
+
+def test_columns(compiled):
+    array = ak.Array([{"x": 1, "y": [1.1, 2.2]}])
+
+    assert ak.from_avro_file(avro_file(array), columns=["x"]).to_list() == [{"x": 1}]
+    assert ak.from_avro_file(avro_file(array), columns=["y"]).to_list() == [
+        {"y": [1.1, 2.2]}
+    ]
+    assert ak.from_avro_file(avro_file(array), columns=["x"]).to_list() == [{"x": 1}]
+    assert len(compiled) == 2
+
+
+def test_bounded(compiled):
+    arrays = [ak.Array([{"x": 1}]), ak.Array([{"y": 1}]), ak.Array([{"z": 1}])]
+    for array in arrays + arrays[:1]:
+        assert ak.from_avro_file(avro_file(array)).to_list() == array.to_list()
+
+    # the first schema was evicted by the third
+    assert len(compiled) == 4
+    assert len(awkward._connect.avro.compiled_schemas) == 2
+
+
+def test_threads(compiled):
+    array = ak.Array({"x": np.arange(100), "y": [[1.1] * (i % 3) for i in range(100)]})
+    for _ in range(3):
+        out = ak.from_avro_file(avro_file(array, block_size=50), executor=4)
+        assert out.to_list() == array.to_list()
+
+    # one machine per concurrent group, reused afterward
+    assert 1 <= len(compiled) <= 4
+    (schema,) = awkward._connect.avro.compiled_schemas.values()
+    assert len(schema._idle) <= schema.max_idle_machines
+
+
+def test_debug_forth(compiled, capsys):
+    array = ak.Array([{"x": 1}])
+    ak.from_avro_file(avro_file(array), debug_forth=True)
+    first = capsys.readouterr().out
+    ak.from_avro_file(avro_file(array), debug_forth=True)
+    assert capsys.readouterr().out == first
+    assert "stream zigzag->" in first